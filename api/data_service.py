@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import json
+from datetime import date
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -1043,6 +1044,9 @@ class DataService:
         ticker: Optional[str] = None,
         limit: Optional[int] = None,
         sort_by_date: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> List[Dict[str, Any]]:
         """
         Generic data retrieval for market, earnings, and price-target domains.
@@ -1051,6 +1055,8 @@ class DataService:
         - Silver/Gold use Delta tables.
         - Bronze stores alpha26 bucket parquet files (`A..Z`) per domain.
         - Cross-sectional requests are assembled from bucketed Delta folders.
+        - Single-ticker Silver/Gold reads push the ticker, `columns`, and the inclusive
+          `start_date`/`end_date` range into the Delta scan.
         """
         resolved_layer = str(layer or "").strip().lower()
         raw_domain = str(domain or "").strip().lower()
@@ -1095,8 +1101,16 @@ class DataService:
                     if is_silver
                     else DataPaths.get_gold_market_bucket_path(layer_bucketing.bucket_letter(symbol))
                 )
-                rows = DataService._read_delta(container, path, limit=None)
-                rows = [row for row in rows if str(row.get("symbol", "")).strip().upper() == symbol]
+                rows = DataService._read_symbol_delta(
+                    container,
+                    path,
+                    symbol,
+                    columns=columns,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=downstream_limit,
+                    sort_by_date=resolved_sort,
+                )
                 return DataService._finalize_rows(rows, limit=limit, sort_by_date=resolved_sort)
             prefix = "market-data/buckets" if is_silver else "market/buckets"
             rows = DataService._read_cross_section_from_prefix(container, prefix, limit=downstream_limit)
@@ -1124,8 +1138,16 @@ class DataService:
                     if is_silver
                     else DataPaths.get_gold_earnings_bucket_path(layer_bucketing.bucket_letter(symbol))
                 )
-                rows = DataService._read_delta(container, path, limit=None)
-                rows = [row for row in rows if str(row.get("symbol", "")).strip().upper() == symbol]
+                rows = DataService._read_symbol_delta(
+                    container,
+                    path,
+                    symbol,
+                    columns=columns,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=downstream_limit,
+                    sort_by_date=resolved_sort,
+                )
                 return DataService._finalize_rows(rows, limit=limit, sort_by_date=resolved_sort)
             prefix = f"{(getattr(cfg, 'EARNINGS_DATA_PREFIX', 'earnings-data') or 'earnings-data')}/buckets" if is_silver else "earnings/buckets"
             rows = DataService._read_cross_section_from_prefix(container, prefix, limit=downstream_limit)
@@ -1138,8 +1160,16 @@ class DataService:
                     if is_silver
                     else DataPaths.get_gold_price_targets_bucket_path(layer_bucketing.bucket_letter(symbol))
                 )
-                rows = DataService._read_delta(container, path, limit=None)
-                rows = [row for row in rows if str(row.get("symbol", "")).strip().upper() == symbol]
+                rows = DataService._read_symbol_delta(
+                    container,
+                    path,
+                    symbol,
+                    columns=columns,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=downstream_limit,
+                    sort_by_date=resolved_sort,
+                )
                 return DataService._finalize_rows(rows, limit=limit, sort_by_date=resolved_sort)
             prefix = "price-target-data/buckets" if is_silver else "targets/buckets"
             rows = DataService._read_cross_section_from_prefix(container, prefix, limit=downstream_limit)
@@ -1332,6 +1362,65 @@ class DataService:
             # Log error
             raise FileNotFoundError(f"Failed to read data at {path}: {str(e)}")
 
+    @staticmethod
+    def _read_symbol_delta(
+        container: str,
+        path: str,
+        symbol: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        sort_by_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Reads one symbol from a bucket Delta table with the symbol/date predicates and column
+        projection pushed into the scan, so file statistics skip data for other symbols and
+        only the matching rows are serialized.
+        """
+        schema_columns = delta_core.get_delta_schema_columns(container, path)
+        if schema_columns is None:
+            raise FileNotFoundError(f"Failed to read data at {path}: Delta table not found: {container}/{path}")
+        if "symbol" not in schema_columns:
+            return []
+
+        date_column = next((name for name in ("date", "Date") if name in schema_columns), None)
+        filters: List[Tuple[str, str, Any]] = [("symbol", "=", symbol)]
+        if date_column and start_date is not None:
+            filters.append((date_column, ">=", start_date))
+        if date_column and end_date is not None:
+            filters.append((date_column, "<=", end_date))
+
+        projection: Optional[List[str]] = None
+        if columns:
+            requested = [str(name).strip() for name in columns if str(name or "").strip()]
+            unknown = sorted(set(requested) - set(schema_columns))
+            if unknown:
+                raise ValueError(f"Unknown column(s) for {path}: {', '.join(unknown)}")
+            projection = list(dict.fromkeys(requested))
+            if sort_by_date and date_column and date_column not in projection:
+                projection.append(date_column)
+
+        df = delta_core.load_delta(container, path, columns=projection, filters=filters)
+        if df is None:
+            # The predicate could not be applied (e.g. a non-temporal date column); filter after reading.
+            df = delta_core.load_delta(container, path)
+            if df is None:
+                raise FileNotFoundError(f"Failed to read data at {path}: Delta table not found: {container}/{path}")
+            mask = df["symbol"].astype("string").str.strip().str.upper() == symbol
+            if date_column and (start_date is not None or end_date is not None):
+                dates = pd.to_datetime(df[date_column], errors="coerce")
+                if start_date is not None:
+                    mask &= dates >= pd.Timestamp(start_date)
+                if end_date is not None:
+                    mask &= dates <= pd.Timestamp(end_date)
+            df = df.loc[mask.fillna(False).astype(bool)]
+            if projection is not None:
+                df = df[projection]
+
+        return DataService._df_to_records_json_safe(df.reset_index(drop=True), limit=limit)
+
     @staticmethod
     def _extract_finance_domain_rows(
         layer: str,
@@ -316,6 +316,32 @@ def _find_latest_market_date(
     return latest
 
 
+def _load_latest_market_snapshot(
+    *,
+    gold_container: str,
+    columns: Sequence[str],
+    symbols: Optional[Sequence[str]] = None,
+) -> Optional[pd.DataFrame]:
+    """Read the gold latest-row-per-symbol snapshot, or None when it has not been materialized."""
+    filters = [("symbol", "in", list(symbols))] if symbols else None
+    try:
+        df = load_delta(
+            gold_container,
+            DataPaths.get_gold_market_latest_path(),
+            columns=["date", "symbol", *columns],
+            filters=filters,
+        )
+    except Exception:
+        return None
+    if df is None or df.empty:
+        return None
+    df = df.copy()
+    df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.normalize()
+    df["symbol"] = df["symbol"].astype(str).str.upper()
+    df = df[df["date"].notna()]
+    return df if not df.empty else None
+
+
 def _query_symbols(conn, *, q: Optional[str] = None) -> pd.DataFrame:  # type: ignore[no-untyped-def]
     query = """
         SELECT
@@ -407,6 +433,8 @@ def get_stock_screener(
       - Silver: latest OHLCV for the as-of date.
       - Gold: engineered features for the as-of date.
       - Postgres: symbol metadata (core.symbols).
+
+    The latest date is served from the gold latest-row snapshot; older dates scan the buckets.
     """
     validate_auth(request)
 
@@ -431,11 +459,6 @@ def get_stock_screener(
 
     symbol_list = symbols_df["symbol"].astype(str).str.upper().tolist() if not symbols_df.empty else []
     requested = _parse_iso_date(as_of)
-    resolved_date = requested or _find_latest_market_date(gold_container=gold_container, symbols=symbol_list)
-    if resolved_date is None:
-        raise HTTPException(status_code=503, detail="No Gold market feature data found for recent dates.")
-
-    resolved_dt = datetime(resolved_date.year, resolved_date.month, resolved_date.day)
 
     gold_cols = [
         "return_1d",
@@ -453,6 +476,39 @@ def get_stock_screener(
         "volume_z_20d",
         "volume_pct_rank_252d",
     ]
+    silver_cols = ["open", "high", "low", "close", "volume"]
+
+    # The gold job maintains one row per symbol, so the current screen is an O(symbols) read.
+    # Older as-of dates are not in the snapshot and fall back to scanning the bucket history.
+    snapshot = _load_latest_market_snapshot(
+        gold_container=gold_container,
+        columns=[*silver_cols, *gold_cols],
+        symbols=symbol_list if q else None,
+    )
+    snapshot_date = snapshot["date"].max().date() if snapshot is not None else None
+    if snapshot is not None and (requested is None or requested >= snapshot_date):
+        resolved_date = requested or snapshot_date
+        resolved_dt = datetime(resolved_date.year, resolved_date.month, resolved_date.day)
+        current = snapshot[snapshot["date"] == resolved_dt]
+        if current.empty:
+            raise HTTPException(status_code=503, detail=f"Gold market features unavailable for {resolved_date.isoformat()}.")
+        return _screener_page(
+            symbols_df=symbols_df,
+            silver_df=current.reindex(columns=["symbol", *silver_cols]),
+            gold_df=current.reindex(columns=["symbol", *gold_cols]),
+            resolved_date=resolved_date,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            direction=direction,
+        )
+
+    resolved_date = requested or _find_latest_market_date(gold_container=gold_container, symbols=symbol_list)
+    if resolved_date is None:
+        raise HTTPException(status_code=503, detail="No Gold market feature data found for recent dates.")
+
+    resolved_dt = datetime(resolved_date.year, resolved_date.month, resolved_date.day)
+
     layer_bucketing.gold_layout_mode()
     layer_bucketing.silver_layout_mode()
 
@@ -514,8 +570,6 @@ def get_stock_screener(
     if silver_df.empty:
         raise HTTPException(status_code=503, detail=f"Silver market data unavailable for {resolved_date.isoformat()}.")
 
-    gold_df["symbol"] = gold_df["symbol"].astype(str).str.upper()
-    gold_df = gold_df.sort_values(["symbol"]).drop_duplicates(subset=["symbol"], keep="last")
     silver_symbol_col = _first_present(silver_df.columns.tolist(), ["symbol", "Symbol"])
     if not silver_symbol_col:
         raise HTTPException(status_code=500, detail="Silver market schema missing Symbol/date columns.")
@@ -529,11 +583,38 @@ def get_stock_screener(
             "Volume": "volume",
         }
     )
+    return _screener_page(
+        symbols_df=symbols_df,
+        silver_df=silver_df.reindex(columns=["symbol", *silver_cols]),
+        gold_df=gold_df.reindex(columns=["symbol", *gold_cols]),
+        resolved_date=resolved_date,
+        limit=limit,
+        offset=offset,
+        sort=sort,
+        direction=direction,
+    )
+
+
+def _screener_page(
+    *,
+    symbols_df: pd.DataFrame,
+    silver_df: pd.DataFrame,
+    gold_df: pd.DataFrame,
+    resolved_date: date,
+    limit: int,
+    offset: int,
+    sort: str,
+    direction: str,
+) -> Dict[str, Any]:
+    gold_df = gold_df.copy()
+    gold_df["symbol"] = gold_df["symbol"].astype(str).str.upper()
+    gold_df = gold_df.sort_values(["symbol"]).drop_duplicates(subset=["symbol"], keep="last")
+    silver_df = silver_df.copy()
     silver_df["symbol"] = silver_df["symbol"].astype(str).str.upper()
     silver_df = silver_df.sort_values(["symbol"]).drop_duplicates(subset=["symbol"], keep="last")
 
-    merged = symbols_df.merge(silver_df[["symbol", "open", "high", "low", "close", "volume"]], on="symbol", how="left")
-    merged = merged.merge(gold_df[["symbol", *gold_cols]], on="symbol", how="left", suffixes=("", "_gold"))
+    merged = symbols_df.merge(silver_df, on="symbol", how="left")
+    merged = merged.merge(gold_df, on="symbol", how="left", suffixes=("", "_gold"))
 
     merged["has_silver"] = merged["close"].notna().astype(int)
     merged["has_gold"] = merged["return_1d"].notna().astype(int)
@@ -705,6 +786,12 @@ def get_data_generic(
         default=None,
         description="Optional date sort direction: asc|desc",
     ),
+    columns: Optional[str] = Query(
+        default=None,
+        description="Optional comma-separated columns to return (single-ticker Silver/Gold reads)",
+    ),
+    start_date: Optional[date] = Query(default=None, description="Inclusive start date (single-ticker Silver/Gold reads)"),
+    end_date: Optional[date] = Query(default=None, description="Inclusive end date (single-ticker Silver/Gold reads)"),
 ):
     """
     Generic endpoint for retrieving data from Bronze/Silver/Gold layers.
@@ -733,6 +820,9 @@ def get_data_generic(
         normalized_date_sort = str(date_sort).strip().lower()
         if normalized_date_sort not in {"asc", "desc"}:
             raise HTTPException(status_code=400, detail="date_sort must be 'asc' or 'desc'.")
+    if start_date is not None and end_date is not None and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be on or before end_date.")
+    requested_columns = [name.strip() for name in str(columns or "").split(",") if name.strip()] or None
 
     try:
         return DataService.get_data(
@@ -741,6 +831,9 @@ def get_data_generic(
             ticker_normalized,
             limit=limit,
             sort_by_date=normalized_date_sort,
+            columns=requested_columns,
+            start_date=start_date,
+            end_date=end_date,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -49,7 +49,7 @@ async def websocket_updates(websocket: WebSocket) -> None:
             data_str = await websocket.receive_text()
 
             if data_str == "ping":
-                await websocket.send_text("pong")
+                await realtime_manager.send_text(websocket, "pong")
                 continue
 
             try:
@@ -32,6 +32,7 @@ from api.service.massive_gateway import MassiveGateway
 from api.service.realtime_tickets import WebSocketTicketStore
 from api.service.settings import ServiceSettings
 from api.service.realtime import manager as realtime_manager
+from api.service.run_updates import RunUpdateListener, run_updates_listener_enabled
 from monitoring.ttl_cache import TtlCache
 from core.delta_core import get_delta_storage_auth_diagnostics
 
@@ -266,6 +267,13 @@ def create_app() -> FastAPI:
 
         app.state.system_health_cache = TtlCache(ttl_seconds=_system_health_ttl_seconds())
 
+        run_updates_listener: RunUpdateListener | None = None
+        run_updates_task: asyncio.Task[None] | None = None
+        if workers_enabled and settings.postgres_dsn and run_updates_listener_enabled():
+            run_updates_listener = RunUpdateListener(realtime_manager, settings.postgres_dsn)
+            run_updates_task = asyncio.create_task(run_updates_listener.run())
+        app.state.run_updates_listener = run_updates_listener
+
         try:
             storage_diag = get_delta_storage_auth_diagnostics(container=None)
             logger.info(
@@ -298,6 +306,21 @@ def create_app() -> FastAPI:
 
         await log_stream_manager.shutdown()
 
+        if run_updates_listener is not None:
+            run_updates_listener.stop()
+        await _shutdown_background_task(
+            run_updates_task,
+            stop_event=None,
+            task_name="run-updates-listener",
+        )
+
+        try:
+            from core.postgres import close_pools
+
+            close_pools()
+        except Exception:
+            pass
+
     app = FastAPI(
         title="Asset Allocation API",
         version="0.1.0",
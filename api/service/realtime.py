@@ -1,33 +1,128 @@
+import asyncio
+import json
 import logging
-from collections import defaultdict
-from typing import Dict, List, Set, Any
+import os
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from fastapi import WebSocket
 
 logger = logging.getLogger("asset-allocation.api.realtime")
 
+SLOW_CLIENT_POLICY_DROP_OLDEST = "drop_oldest"
+SLOW_CLIENT_POLICY_DISCONNECT = "disconnect"
+_SLOW_CLIENT_POLICIES = {SLOW_CLIENT_POLICY_DROP_OLDEST, SLOW_CLIENT_POLICY_DISCONNECT}
+_DEFAULT_SEND_QUEUE_SIZE = 256
+_DEFAULT_SEND_TIMEOUT_SECONDS = 10.0
+# "Try again later": the client fell too far behind and should reconnect.
+_SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+def _serialize(payload: Dict[str, Any]) -> str:
+    # Same encoding Starlette uses for WebSocket.send_json in text mode.
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _send_queue_size_from_env() -> int:
+    raw = os.environ.get("REALTIME_SEND_QUEUE_SIZE")
+    try:
+        value = int(raw.strip()) if raw else _DEFAULT_SEND_QUEUE_SIZE
+    except ValueError:
+        value = _DEFAULT_SEND_QUEUE_SIZE
+    return max(1, value)
+
+
+def _send_timeout_from_env() -> float:
+    raw = os.environ.get("REALTIME_SEND_TIMEOUT_SECONDS")
+    try:
+        value = float(raw.strip()) if raw else _DEFAULT_SEND_TIMEOUT_SECONDS
+    except ValueError:
+        value = _DEFAULT_SEND_TIMEOUT_SECONDS
+    return value if value > 0 else _DEFAULT_SEND_TIMEOUT_SECONDS
+
+
+def _slow_client_policy_from_env() -> str:
+    raw = str(os.environ.get("REALTIME_SLOW_CLIENT_POLICY") or "").strip().lower()
+    return raw if raw in _SLOW_CLIENT_POLICIES else SLOW_CLIENT_POLICY_DROP_OLDEST
+
+
+class _ClientChannel:
+    """Bounded outbound queue for one websocket, drained by a dedicated writer task."""
+
+    def __init__(self, websocket: WebSocket, max_pending: int) -> None:
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.pending: Deque[str] = deque()
+        self.ready = asyncio.Event()
+        self.dropped = 0
+        self.writer: Optional[asyncio.Task] = None
+
+    def is_full(self) -> bool:
+        return len(self.pending) >= self.max_pending
+
+    def put(self, text: str) -> None:
+        if self.is_full():
+            self.pending.popleft()
+            self.dropped += 1
+        self.pending.append(text)
+        self.ready.set()
+
+    async def get(self) -> str:
+        while not self.pending:
+            self.ready.clear()
+            await self.ready.wait()
+        return self.pending.popleft()
+
 
 class RealtimeManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        send_queue_size: Optional[int] = None,
+        send_timeout_seconds: Optional[float] = None,
+        slow_client_policy: Optional[str] = None,
+    ) -> None:
         # Keep track of all active connections
         self.active_connections: Set[WebSocket] = set()
         # Map topic -> connected clients interested in that topic
         self.subscriptions: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self._channels: Dict[WebSocket, _ClientChannel] = {}
+        self._send_queue_size = send_queue_size
+        self._send_timeout_seconds = send_timeout_seconds
+        self._slow_client_policy = slow_client_policy
+
+    @property
+    def send_queue_size(self) -> int:
+        return max(1, int(self._send_queue_size)) if self._send_queue_size else _send_queue_size_from_env()
+
+    @property
+    def send_timeout_seconds(self) -> float:
+        return float(self._send_timeout_seconds) if self._send_timeout_seconds else _send_timeout_from_env()
+
+    @property
+    def slow_client_policy(self) -> str:
+        policy = str(self._slow_client_policy or "").strip().lower()
+        return policy if policy in _SLOW_CLIENT_POLICIES else _slow_client_policy_from_env()
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
         self.active_connections.add(websocket)
+        self._ensure_channel(websocket)
         logger.info("Client connected. Active: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket) -> None:
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-        
+
         # Remove from all topics
         for subscribers in self.subscriptions.values():
             if websocket in subscribers:
                 subscribers.discard(websocket)
-                
+
+        channel = self._channels.pop(websocket, None)
+        if channel is not None and channel.writer is not None and channel.writer is not asyncio.current_task():
+            channel.writer.cancel()
+
         logger.info("Client disconnected. Active: %d", len(self.active_connections))
 
     async def subscribe(self, websocket: WebSocket, topics: List[str]) -> None:
@@ -45,24 +140,73 @@ class RealtimeManager:
     def has_subscribers(self, topic: str) -> bool:
         return bool(self.subscriptions.get(str(topic or "").strip()))
 
+    async def send_text(self, websocket: WebSocket, text: str) -> None:
+        """Queue a direct reply (e.g. pong) behind any pending broadcasts for this client."""
+        self._enqueue(self._ensure_channel(websocket), text)
+
     async def broadcast(self, topic: str, message: Dict[str, Any]) -> None:
         """
         Broadcast a message to all clients subscribed to the specific topic.
-        The message will be wrapped: {"topic": topic, "payload": message}
+        The message will be wrapped: {"topic": topic, "data": message}
+
+        The payload is serialized once and queued per client; each client's writer task
+        does the actual send, so a stalled client never delays the others or the caller.
         """
         targets = self.subscriptions.get(topic)
         if not targets:
             return
 
-        payload = {"topic": topic, "data": message}
-        
-        # Snapshot to allow removing dead connections during iteration
+        text = _serialize({"topic": topic, "data": message})
+
+        # Snapshot to allow removing slow connections during iteration
         for connection in list(targets):
+            self._enqueue(self._ensure_channel(connection), text)
+
+    def _ensure_channel(self, websocket: WebSocket) -> _ClientChannel:
+        channel = self._channels.get(websocket)
+        if channel is None:
+            channel = _ClientChannel(websocket, self.send_queue_size)
+            channel.writer = asyncio.get_running_loop().create_task(self._run_writer(channel))
+            self._channels[websocket] = channel
+        return channel
+
+    def _enqueue(self, channel: _ClientChannel, text: str) -> None:
+        if channel.is_full():
+            if self.slow_client_policy == SLOW_CLIENT_POLICY_DISCONNECT:
+                logger.warning(
+                    "Client send queue full (%d pending); disconnecting slow client.",
+                    len(channel.pending),
+                )
+                self.disconnect(channel.websocket)
+                asyncio.get_running_loop().create_task(self._close_quietly(channel.websocket))
+                return
+            if channel.dropped == 0 or channel.dropped % 100 == 0:
+                logger.warning(
+                    "Client send queue full (%d pending); dropping oldest message (dropped=%d).",
+                    len(channel.pending),
+                    channel.dropped + 1,
+                )
+        channel.put(text)
+
+    async def _run_writer(self, channel: _ClientChannel) -> None:
+        websocket = channel.websocket
+        while True:
+            text = await channel.get()
             try:
-                await connection.send_json(payload)
+                await asyncio.wait_for(websocket.send_text(text), timeout=self.send_timeout_seconds)
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:
-                logger.warning("Failed to send to client (disconnecting): %s", exc)
-                self.disconnect(connection)
+                logger.warning("Failed to send to client (disconnecting): %r", exc)
+                self.disconnect(websocket)
+                return
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=_SLOW_CLIENT_CLOSE_CODE)
+        except Exception:
+            pass
 
 
 manager = RealtimeManager()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from api.service.realtime import RealtimeManager
+
+logger = logging.getLogger("asset-allocation.api.run_updates")
+
+RUN_UPDATES_CHANNEL = "run_updates"
+RUN_UPDATES_TOPIC = "backtests"
+RUN_UPDATE_EVENT = "RUN_UPDATE"
+_DEFAULT_DEBOUNCE_SECONDS = 0.25
+_DEFAULT_POLL_SECONDS = 1.0
+_DEFAULT_RECONNECT_MIN_SECONDS = 1.0
+_DEFAULT_RECONNECT_MAX_SECONDS = 30.0
+
+
+def _debounce_seconds_from_env() -> float:
+    raw = os.environ.get("RUN_UPDATES_DEBOUNCE_SECONDS")
+    try:
+        value = float(raw.strip()) if raw else _DEFAULT_DEBOUNCE_SECONDS
+    except ValueError:
+        value = _DEFAULT_DEBOUNCE_SECONDS
+    return max(0.0, value)
+
+
+def run_updates_listener_enabled() -> bool:
+    raw = str(os.environ.get("RUN_UPDATES_LISTENER_ENABLED") or "").strip().lower()
+    return raw not in {"0", "false", "f", "no", "n", "off"}
+
+
+def decode_run_update(payload: str) -> Optional[Dict[str, Any]]:
+    """Decode a `run_updates` notification payload written by the `notify_run_update` trigger."""
+    try:
+        decoded = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(decoded, dict):
+        return None
+    run_id = str(decoded.get("run_id") or "").strip()
+    if not run_id:
+        return None
+    status = decoded.get("status")
+    event = decoded.get("event")
+    return {
+        "run_id": run_id,
+        "status": str(status) if status is not None else None,
+        "event": str(event) if event is not None else None,
+    }
+
+
+def _connect_dedicated(dsn: str) -> Any:
+    from core.postgres import connect
+
+    return connect(dsn, pooled=False)
+
+
+class RunUpdateListener:
+    """
+    Forwards `run_updates` notifications from Postgres to websocket subscribers.
+
+    One dedicated connection holds the LISTEN in a worker thread. Notifications are coalesced per
+    run for `debounce_seconds`, so a burst of status writes for the same run reaches clients as a
+    single RUN_UPDATE carrying the latest status. The connection is re-established with capped
+    exponential backoff whenever it drops.
+    """
+
+    def __init__(
+        self,
+        realtime: RealtimeManager,
+        dsn: str,
+        *,
+        debounce_seconds: Optional[float] = None,
+        poll_seconds: float = _DEFAULT_POLL_SECONDS,
+        reconnect_min_seconds: float = _DEFAULT_RECONNECT_MIN_SECONDS,
+        reconnect_max_seconds: float = _DEFAULT_RECONNECT_MAX_SECONDS,
+        connect_fn: Callable[[str], Any] = _connect_dedicated,
+    ) -> None:
+        self._realtime = realtime
+        self._dsn = dsn
+        self.debounce_seconds = _debounce_seconds_from_env() if debounce_seconds is None else max(0.0, debounce_seconds)
+        self._poll_seconds = poll_seconds
+        self._reconnect_min_seconds = reconnect_min_seconds
+        self._reconnect_max_seconds = max(reconnect_min_seconds, reconnect_max_seconds)
+        self._connect_fn = connect_fn
+        self._stop = threading.Event()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_ready = asyncio.Event()
+        self.connections_opened = 0
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._pending_ready.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        flusher = loop.create_task(self._run_flusher())
+        backoff = self._reconnect_min_seconds
+        try:
+            while not self._stop.is_set():
+                connected = threading.Event()
+                try:
+                    await asyncio.to_thread(self._listen_blocking, loop, connected)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning("Run updates listener disconnected: %s", exc)
+                if self._stop.is_set():
+                    break
+                if connected.is_set():
+                    backoff = self._reconnect_min_seconds
+                await asyncio.to_thread(self._stop.wait, backoff)
+                backoff = min(backoff * 2, self._reconnect_max_seconds)
+        finally:
+            self._stop.set()
+            self._pending_ready.set()
+            await flusher
+
+    def _listen_blocking(self, loop: asyncio.AbstractEventLoop, connected: threading.Event) -> None:
+        with self._connect_fn(self._dsn) as conn:
+            conn.autocommit = True
+            conn.execute(f"LISTEN {RUN_UPDATES_CHANNEL}")
+            self.connections_opened += 1
+            connected.set()
+            logger.info("Listening for Postgres notifications on channel '%s'.", RUN_UPDATES_CHANNEL)
+            while not self._stop.is_set():
+                for notify in conn.notifies(timeout=self._poll_seconds):
+                    loop.call_soon_threadsafe(self._accept, notify.payload)
+                    if self._stop.is_set():
+                        break
+
+    def _accept(self, payload: str) -> None:
+        update = decode_run_update(payload)
+        if update is None:
+            logger.debug("Ignoring malformed run_updates payload: %r", payload)
+            return
+        self._pending[update["run_id"]] = update
+        self._pending_ready.set()
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await self._pending_ready.wait()
+            if not self._stop.is_set() and self.debounce_seconds > 0:
+                await asyncio.sleep(self.debounce_seconds)
+            self._pending_ready.clear()
+            batch, self._pending = self._pending, {}
+            for update in batch.values():
+                await self._realtime.broadcast(RUN_UPDATES_TOPIC, {"type": RUN_UPDATE_EVENT, "payload": update})
+            if self._stop.is_set():
+                return
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import math
+import os
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
@@ -37,6 +38,9 @@ logger = logging.getLogger(__name__)
 
 _PRICE_TABLE = "market_data"
 _PRICE_COLUMNS = {"open", "high", "low", "close", "volume"}
+_PRELOAD_MAX_MB_DEFAULT = 512.0
+# Rough in-memory cost of one loaded cell once pandas objects and the symbol column are counted.
+_PRELOAD_BYTES_PER_VALUE = 16
 
 
 @dataclass(frozen=True)
@@ -262,25 +266,243 @@ def _load_slow_frames(
     return frames
 
 
-def _snapshot_for_timestamp(
-    ts: datetime,
-    *,
-    intraday_frames: dict[str, pd.DataFrame],
-    slow_frames: dict[str, pd.DataFrame],
-) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    for frame in intraday_frames.values():
-        if frame.empty:
-            continue
-        exact = frame[frame["as_of"] == pd.Timestamp(ts)]
-        if exact.empty:
-            continue
-        frames.append(exact.drop(columns=["as_of"], errors="ignore"))
-    for frame in slow_frames.values():
-        if frame.empty:
-            continue
-        frames.append(frame.drop(columns=["as_of"], errors="ignore"))
+def _preload_max_mb() -> float:
+    raw = os.environ.get("BACKTEST_PRELOAD_MAX_MB")
+    try:
+        value = float(raw.strip()) if raw else _PRELOAD_MAX_MB_DEFAULT
+    except ValueError:
+        value = _PRELOAD_MAX_MB_DEFAULT
+    return max(0.0, value)
+
+
+def _select_parts_for(spec: universe_service.UniverseTableSpec, selected_columns: list[str]) -> list[str]:
+    select_parts = [
+        f"{universe_service._quote_identifier(spec.as_of_column)} AS as_of",
+        f'{universe_service._quote_identifier("symbol")} AS symbol',
+    ]
+    select_parts.extend(universe_service._quote_identifier(column) for column in selected_columns)
+    return select_parts
 
+
+def _bar_size_clause(spec: universe_service.UniverseTableSpec, bar_size: str | None) -> tuple[str, list[Any]]:
+    if bar_size and "bar_size" in spec.columns:
+        return f" AND {universe_service._quote_identifier('bar_size')} = %s", [bar_size]
+    return "", []
+
+
+class _RunFrameSource:
+    """Serves per-session intraday and slow frames for a backtest run.
+
+    Each table is loaded once for the whole run window and sliced per session, unless its
+    estimated size exceeds BACKTEST_PRELOAD_MAX_MB, in which case that table keeps the
+    per-session queries. Slow tables are preloaded as the latest row per symbol at the first
+    session plus every later row in the window, and replayed forward so each session sees
+    exactly what `_load_slow_frames` would return for it.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        table_specs: dict[str, universe_service.UniverseTableSpec],
+        required_columns: dict[str, set[str]],
+        session_dates: list[date],
+        bar_size: str | None,
+        max_mb: float | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._table_specs = table_specs
+        self._bar_size = bar_size
+        self._intraday_by_session: dict[str, dict[date, pd.DataFrame]] = {}
+        self._intraday_empty: dict[str, pd.DataFrame] = {}
+        self._slow_history: dict[str, pd.DataFrame] = {}
+        self._slow_state: dict[str, tuple[date | None, int, pd.DataFrame]] = {}
+        self._fallback_columns: dict[str, set[str]] = {}
+        if not session_dates:
+            self._fallback_columns = dict(required_columns)
+            return
+
+        first_date, last_date = min(session_dates), max(session_dates)
+        budget_bytes = (_preload_max_mb() if max_mb is None else max_mb) * 1024 * 1024
+        with connect(dsn) as conn:
+            for table_name, columns in required_columns.items():
+                spec = table_specs[table_name]
+                selected_columns = sorted(columns)
+                estimated_rows = self._estimate_rows(conn, table_name, spec, first_date, last_date)
+                estimated_bytes = estimated_rows * (len(selected_columns) + 2) * _PRELOAD_BYTES_PER_VALUE
+                if estimated_bytes > budget_bytes:
+                    logger.info(
+                        "Backtest preload skipped for %s: estimated_rows=%d estimated_mb=%.1f budget_mb=%.1f",
+                        table_name,
+                        estimated_rows,
+                        estimated_bytes / (1024 * 1024),
+                        budget_bytes / (1024 * 1024),
+                    )
+                    self._fallback_columns[table_name] = columns
+                    continue
+                if spec.as_of_kind == "intraday":
+                    self._preload_intraday(conn, table_name, spec, selected_columns, first_date, last_date)
+                else:
+                    self._preload_slow(conn, table_name, spec, selected_columns, first_date, last_date)
+
+    def _estimate_rows(
+        self,
+        conn: Any,
+        table_name: str,
+        spec: universe_service.UniverseTableSpec,
+        first_date: date,
+        last_date: date,
+    ) -> int:
+        as_of = universe_service._quote_identifier(spec.as_of_column)
+        bar_sql, bar_params = _bar_size_clause(spec, self._bar_size)
+        if spec.as_of_kind == "intraday":
+            first_start, _ = _session_bounds(datetime.combine(first_date, time.min))
+            _, last_end = _session_bounds(datetime.combine(last_date, time.min))
+            where_sql = f"{as_of} >= %s AND {as_of} <= %s"
+            params: list[Any] = [first_start, last_end]
+        else:
+            # The initial per-symbol state is bounded by the symbol count, which the window rows dominate.
+            where_sql = f"{as_of} <= %s AND {as_of} > %s"
+            params = [last_date, first_date]
+        sql = f'SELECT COUNT(*) FROM "gold".{universe_service._quote_identifier(table_name)} WHERE {where_sql}{bar_sql}'
+        with conn.cursor() as cur:
+            cur.execute(sql, [*params, *bar_params])
+            row = cur.fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def _fetch_frame(self, conn: Any, sql: str, params: list[Any]) -> pd.DataFrame:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            columns_in_result = [desc.name for desc in cur.description]
+        return pd.DataFrame(rows, columns=columns_in_result)
+
+    def _preload_intraday(
+        self,
+        conn: Any,
+        table_name: str,
+        spec: universe_service.UniverseTableSpec,
+        selected_columns: list[str],
+        first_date: date,
+        last_date: date,
+    ) -> None:
+        as_of = universe_service._quote_identifier(spec.as_of_column)
+        bar_sql, bar_params = _bar_size_clause(spec, self._bar_size)
+        first_start, _ = _session_bounds(datetime.combine(first_date, time.min))
+        _, last_end = _session_bounds(datetime.combine(last_date, time.min))
+        sql = f"""
+            SELECT {", ".join(_select_parts_for(spec, selected_columns))}
+            FROM "gold".{universe_service._quote_identifier(table_name)}
+            WHERE {as_of} >= %s
+              AND {as_of} <= %s{bar_sql}
+        """
+        frame = _prepare_loaded_frame(
+            self._fetch_frame(conn, sql, [first_start, last_end, *bar_params]),
+            table_name=table_name,
+            table_spec=spec,
+            selected_columns=selected_columns,
+        )
+        self._intraday_empty[table_name] = frame.iloc[0:0].copy()
+        by_session: dict[date, pd.DataFrame] = {}
+        if not frame.empty:
+            session_keys = frame["as_of"].dt.date
+            for session_date, group in frame.groupby(session_keys, sort=False):
+                by_session[session_date] = group.reset_index(drop=True)
+        self._intraday_by_session[table_name] = by_session
+
+    def _preload_slow(
+        self,
+        conn: Any,
+        table_name: str,
+        spec: universe_service.UniverseTableSpec,
+        selected_columns: list[str],
+        first_date: date,
+        last_date: date,
+    ) -> None:
+        as_of = universe_service._quote_identifier(spec.as_of_column)
+        symbol = universe_service._quote_identifier("symbol")
+        table = universe_service._quote_identifier(table_name)
+        select_sql = ", ".join(_select_parts_for(spec, selected_columns))
+        bar_sql, bar_params = _bar_size_clause(spec, self._bar_size)
+        sql = f"""
+            (
+                SELECT DISTINCT ON ({symbol})
+                    {select_sql}
+                FROM "gold".{table}
+                WHERE {as_of} <= %s{bar_sql}
+                ORDER BY {symbol}, {as_of} DESC NULLS LAST
+            )
+            UNION ALL
+            (
+                SELECT {select_sql}
+                FROM "gold".{table}
+                WHERE {as_of} > %s
+                  AND {as_of} <= %s{bar_sql}
+            )
+        """
+        params = [first_date, *bar_params, first_date, last_date, *bar_params]
+        frame = _prepare_loaded_frame(
+            self._fetch_frame(conn, sql, params),
+            table_name=table_name,
+            table_spec=spec,
+            selected_columns=selected_columns,
+        )
+        self._slow_history[table_name] = frame.sort_values("as_of", kind="stable").reset_index(drop=True)
+
+    def _slow_frame_for(self, table_name: str, session_date: date) -> pd.DataFrame:
+        history = self._slow_history[table_name]
+        cutoff = pd.Timestamp(session_date, tz="UTC")
+        end = int(history["as_of"].searchsorted(cutoff, side="right")) if not history.empty else 0
+        last_date, applied, state = self._slow_state.get(table_name, (None, 0, history.iloc[0:0]))
+        if last_date is not None and session_date < last_date:
+            applied, state = 0, history.iloc[0:0]
+        if end > applied:
+            state = pd.concat([state, history.iloc[applied:end]], ignore_index=True)
+            state = state.drop_duplicates(subset=["symbol"], keep="last")
+            state = state.sort_values("symbol", kind="stable").reset_index(drop=True)
+            applied = end
+        self._slow_state[table_name] = (session_date, applied, state)
+        return state
+
+    def frames_for_session(
+        self,
+        session_date: date,
+        *,
+        session_start: datetime,
+        session_end: datetime,
+        as_of_ts: datetime,
+    ) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+        intraday_frames: dict[str, pd.DataFrame] = {
+            table_name: by_session.get(session_date, self._intraday_empty[table_name])
+            for table_name, by_session in self._intraday_by_session.items()
+        }
+        slow_frames: dict[str, pd.DataFrame] = {
+            table_name: self._slow_frame_for(table_name, session_date) for table_name in self._slow_history
+        }
+        if self._fallback_columns:
+            intraday_frames.update(
+                _load_intraday_session_frames(
+                    self._dsn,
+                    table_specs=self._table_specs,
+                    required_columns=self._fallback_columns,
+                    session_start=session_start,
+                    session_end=session_end,
+                    bar_size=self._bar_size,
+                )
+            )
+            slow_frames.update(
+                _load_slow_frames(
+                    self._dsn,
+                    table_specs=self._table_specs,
+                    required_columns=self._fallback_columns,
+                    as_of_ts=as_of_ts,
+                    bar_size=self._bar_size,
+                )
+            )
+        return intraday_frames, slow_frames
+
+
+def _merge_snapshot_frames(frames: list[pd.DataFrame]) -> pd.DataFrame | None:
     merged: pd.DataFrame | None = None
     for frame in frames:
         frame = frame.drop_duplicates(subset=["symbol"]).reset_index(drop=True)
@@ -288,13 +510,53 @@ def _snapshot_for_timestamp(
             merged = frame.copy()
         else:
             merged = merged.merge(frame, on="symbol", how="outer")
-    if merged is None:
-        return pd.DataFrame(columns=["date", "symbol"])
-    merged["date"] = pd.Timestamp(ts)
-    merged = merged.drop_duplicates(subset=["symbol"]).reset_index(drop=True)
     return merged
 
 
+class _SessionSnapshots:
+    """Per-bar snapshots for one session with the per-bar work reduced to a dict lookup.
+
+    Intraday frames are split by timestamp once and the slow frames, which do not change
+    within a session, are merged once; each bar then merges only its own intraday rows.
+    """
+
+    def __init__(self, *, intraday_frames: dict[str, pd.DataFrame], slow_frames: dict[str, pd.DataFrame]) -> None:
+        self._intraday_by_ts: list[dict[pd.Timestamp, pd.DataFrame]] = []
+        for frame in intraday_frames.values():
+            if frame.empty:
+                continue
+            self._intraday_by_ts.append(
+                {
+                    pd.Timestamp(as_of): group.drop(columns=["as_of"], errors="ignore")
+                    for as_of, group in frame.groupby("as_of", sort=False)
+                }
+            )
+        self._slow = _merge_snapshot_frames(
+            [frame.drop(columns=["as_of"], errors="ignore") for frame in slow_frames.values() if not frame.empty]
+        )
+
+    def snapshot(self, ts: datetime) -> pd.DataFrame:
+        key = pd.Timestamp(ts)
+        frames = [by_ts[key] for by_ts in self._intraday_by_ts if key in by_ts]
+        if self._slow is not None:
+            frames.append(self._slow)
+        merged = _merge_snapshot_frames(frames)
+        if merged is None:
+            return pd.DataFrame(columns=["date", "symbol"])
+        merged["date"] = key
+        merged = merged.drop_duplicates(subset=["symbol"]).reset_index(drop=True)
+        return merged
+
+
+def _snapshot_for_timestamp(
+    ts: datetime,
+    *,
+    intraday_frames: dict[str, pd.DataFrame],
+    slow_frames: dict[str, pd.DataFrame],
+) -> pd.DataFrame:
+    return _SessionSnapshots(intraday_frames=intraday_frames, slow_frames=slow_frames).snapshot(ts)
+
+
 def _resolve_strategy_universe(
     dsn: str,
     *,
@@ -523,11 +785,27 @@ def _score_snapshot(
     return filtered[["rebalance_ts", "symbol", "score", "ordinal", "selected", "target_weight"]]
 
 
-def _market_row(snapshot: pd.DataFrame, symbol: str) -> pd.Series | None:
-    matches = snapshot[snapshot["symbol"] == symbol]
-    if matches.empty:
-        return None
-    return matches.iloc[0]
+class _SnapshotRows:
+    """Symbol -> row lookup over one bar's snapshot, indexed once instead of filtered per symbol."""
+
+    def __init__(self, snapshot: pd.DataFrame) -> None:
+        self._snapshot = snapshot
+        self._positions: dict[str, int] = {}
+        if "symbol" in snapshot.columns:
+            for position, symbol in enumerate(snapshot["symbol"].tolist()):
+                self._positions.setdefault(symbol, position)
+        self._rows: dict[str, pd.Series] = {}
+
+    def get(self, symbol: str) -> pd.Series | None:
+        row = self._rows.get(symbol)
+        if row is not None:
+            return row
+        position = self._positions.get(symbol)
+        if position is None:
+            return None
+        row = self._snapshot.iloc[position]
+        self._rows[symbol] = row
+        return row
 
 
 def _price_bar(ts: datetime, row: pd.Series) -> PriceBar:
@@ -951,30 +1229,33 @@ def execute_backtest_run(
     regime_trace_rows: list[dict[str, Any]] = []
     trade_rows: list[dict[str, Any]] = []
     timeseries_rows: list[dict[str, Any]] = []
+    # Running peak equity per bar, updated incrementally instead of rescanning all prior rows.
+    running_peak_values = np.empty(len(schedule), dtype="float64")
     log_lines = [f"run_id={run_id} strategy={definition.strategy_name} bars={len(schedule)}"]
     previous_equity = cash
     previous_close_by_symbol: dict[str, float] = {}
     first_signal_computed = False
 
+    frame_source = _RunFrameSource(
+        dsn,
+        table_specs=table_specs,
+        required_columns=required_columns,
+        session_dates=list(grouped_schedule.keys()),
+        bar_size=str(run.get("bar_size") or "").strip() or None,
+    )
+
     for session_date, session_schedule in grouped_schedule.items():
         session_start, session_end = _session_bounds(session_schedule[0])
-        intraday_frames = _load_intraday_session_frames(
-            dsn,
-            table_specs=table_specs,
-            required_columns=required_columns,
+        intraday_frames, slow_frames = frame_source.frames_for_session(
+            session_date,
             session_start=session_start,
             session_end=session_end,
-            bar_size=str(run.get("bar_size") or "").strip() or None,
-        )
-        slow_frames = _load_slow_frames(
-            dsn,
-            table_specs=table_specs,
-            required_columns=required_columns,
             as_of_ts=session_schedule[-1],
-            bar_size=str(run.get("bar_size") or "").strip() or None,
         )
+        session_snapshots = _SessionSnapshots(intraday_frames=intraday_frames, slow_frames=slow_frames)
         for index, current_ts in enumerate(session_schedule):
-            snapshot = _snapshot_for_timestamp(current_ts, intraday_frames=intraday_frames, slow_frames=slow_frames)
+            snapshot = session_snapshots.snapshot(current_ts)
+            snapshot_rows = _SnapshotRows(snapshot)
             repo.update_heartbeat(run_id)
             regime_row = regime_schedule_map.get(session_date)
             regime_context = _regime_context_for_session(definition.strategy_config.regimePolicy, regime_row)
@@ -1030,7 +1311,7 @@ def execute_backtest_run(
             market_equity_open = cash
 
             for symbol, position in list(positions.items()):
-                row = _market_row(snapshot, symbol)
+                row = snapshot_rows.get(symbol)
                 if row is None:
                     market_equity_open += position.quantity * previous_close_by_symbol.get(symbol, position.entry_price)
                     continue
@@ -1041,7 +1322,7 @@ def execute_backtest_run(
                 target_qty_by_symbol: dict[str, float] = {}
                 if pending_target_weights:
                     for symbol, target_weight in pending_target_weights.items():
-                        row = _market_row(snapshot, symbol)
+                        row = snapshot_rows.get(symbol)
                         if row is None:
                             continue
                         open_price = _maybe_float(row.get(f"{_PRICE_TABLE}__open")) or _maybe_float(
@@ -1053,7 +1334,7 @@ def execute_backtest_run(
 
                 all_symbols = sorted(set(positions.keys()) | set(target_qty_by_symbol.keys()))
                 for symbol in all_symbols:
-                    row = _market_row(snapshot, symbol)
+                    row = snapshot_rows.get(symbol)
                     if row is None:
                         continue
                     open_price = _maybe_float(row.get(f"{_PRICE_TABLE}__open")) or _maybe_float(
@@ -1095,7 +1376,7 @@ def execute_backtest_run(
             pending_target_weights = {}
 
             for symbol, position in list(positions.items()):
-                row = _market_row(snapshot, symbol)
+                row = snapshot_rows.get(symbol)
                 if row is None:
                     continue
                 bar = _price_bar(current_ts, row)
@@ -1123,7 +1404,7 @@ def execute_backtest_run(
             close_equity = cash
             gross_exposure = 0.0
             for symbol, position in positions.items():
-                row = _market_row(snapshot, symbol)
+                row = snapshot_rows.get(symbol)
                 close_price = None
                 if row is not None:
                     close_price = _maybe_float(row.get(f"{_PRICE_TABLE}__close")) or _maybe_float(row.get(f"{_PRICE_TABLE}__open"))
@@ -1135,7 +1416,11 @@ def execute_backtest_run(
                 gross_exposure += abs(position_value)
 
             period_return = (close_equity / previous_equity - 1.0) if previous_equity else 0.0
-            running_peak = max([close_equity, *(row["portfolio_value"] for row in timeseries_rows)] if timeseries_rows else [close_equity])
+            bar_number = len(timeseries_rows)
+            running_peak_values[bar_number] = (
+                max(close_equity, running_peak_values[bar_number - 1]) if bar_number else close_equity
+            )
+            running_peak = running_peak_values[bar_number]
             drawdown = (close_equity / running_peak - 1.0) if running_peak else 0.0
             timeseries_rows.append(
                 {
@@ -1,7 +1,11 @@
 import os
 import io
+import hashlib
 import pandas as pd
 from datetime import datetime
+from pathlib import Path
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
 from azure.storage.blob import BlobServiceClient
 from azure.identity import DefaultAzureCredential
 import logging
@@ -16,14 +20,30 @@ logger = logging.getLogger(__name__)
 logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(logging.WARNING)
 logging.getLogger("azure.identity").setLevel(logging.WARNING)
 
+# Blobs larger than this are never written to the local read cache.
+_READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
 class BlobStorageClient:
-    def __init__(self, account_name=None, connection_string=None, container_name='market-data', ensure_container_exists: bool = True):
+    def __init__(
+        self,
+        account_name=None,
+        connection_string=None,
+        container_name='market-data',
+        ensure_container_exists: bool = True,
+        read_cache_dir: Optional[str] = None,
+    ):
         # 1. Try config/env for Account Name (Preferred)
         self.account_name = account_name or os.environ.get('AZURE_STORAGE_ACCOUNT_NAME')
         # 2. Try config/env for Connection String.
         self.connection_string = connection_string or os.environ.get('AZURE_STORAGE_CONNECTION_STRING')
         
         self.container_name = container_name
+
+        # Optional on-disk cache of blob bodies keyed by path + ETag. Cached reads revalidate with
+        # If-None-Match, so unchanged blobs cost a 304 instead of a full download.
+        cache_root = read_cache_dir or os.environ.get('BLOB_READ_CACHE_DIR')
+        self.read_cache_dir = Path(cache_root) / container_name if cache_root else None
         
         # Configure transport with larger connection pool
         # Default is 10, which causes "Connection pool is full" with many threads
@@ -99,6 +119,7 @@ class BlobStorageClient:
             # Only delete if it exists? Or let SDK raise?
             # Test expects success if it deletes, usually idempotent or silent logic is preferred?
             # Standard delete_blob raises ResourceNotFoundError if not found.
+            self._invalidate_cached_blob(remote_path)
             if blob_client.exists():
                 blob_client.delete_blob()
                 logger.info(f"Deleted blob: {remote_path}")
@@ -146,20 +167,91 @@ class BlobStorageClient:
             logger.error(f"Error checking blobs for prefix '{prefix}': {e}")
             raise
 
+    def _read_cache_paths(self, remote_path: str) -> Optional[tuple[Path, Path]]:
+        if self.read_cache_dir is None:
+            return None
+        digest = hashlib.sha256(remote_path.encode("utf-8")).hexdigest()
+        return self.read_cache_dir / f"{digest}.bin", self.read_cache_dir / f"{digest}.etag"
+
+    def _load_cached_blob(self, remote_path: str) -> Optional[tuple[str, bytes]]:
+        paths = self._read_cache_paths(remote_path)
+        if paths is None:
+            return None
+        data_path, etag_path = paths
+        try:
+            return etag_path.read_text(encoding="utf-8"), data_path.read_bytes()
+        except OSError:
+            return None
+
+    def _store_cached_blob(self, remote_path: str, etag: Optional[str], data: bytes) -> None:
+        paths = self._read_cache_paths(remote_path)
+        if paths is None or not etag or len(data) > _READ_CACHE_MAX_BYTES:
+            return
+        data_path, etag_path = paths
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write body then ETag, each via rename, so a reader never pairs a new ETag with old bytes.
+            tmp_data = data_path.with_suffix(f".bin.{os.getpid()}.tmp")
+            tmp_data.write_bytes(data)
+            os.replace(tmp_data, data_path)
+            tmp_etag = etag_path.with_suffix(f".etag.{os.getpid()}.tmp")
+            tmp_etag.write_text(etag, encoding="utf-8")
+            os.replace(tmp_etag, etag_path)
+        except OSError as exc:
+            logger.debug(f"Failed to cache blob {remote_path} locally: {exc}")
+
+    def _invalidate_cached_blob(self, remote_path: str) -> None:
+        paths = self._read_cache_paths(remote_path)
+        if paths is None:
+            return
+        for path in reversed(paths):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.debug(f"Failed to drop cached blob {path}: {exc}")
+
+    def _download_blob_bytes(self, remote_path: str) -> Optional[bytes]:
+        """
+        Downloads a blob in a single request, returning None when it does not exist.
+
+        When the read cache is enabled and holds a copy, the request is conditional on the
+        cached ETag and a 304 response is served from the local copy.
+        """
+        blob_client = self.container_client.get_blob_client(remote_path)
+        cached = self._load_cached_blob(remote_path)
+        try:
+            if cached is not None:
+                download_stream = blob_client.download_blob(
+                    etag=cached[0],
+                    match_condition=MatchConditions.IfModified,
+                )
+            else:
+                download_stream = blob_client.download_blob()
+        except ResourceNotModifiedError:
+            return cached[1]
+        except ResourceNotFoundError:
+            if cached is not None:
+                self._invalidate_cached_blob(remote_path)
+            return None
+
+        data = download_stream.readall()
+        properties = getattr(download_stream, "properties", None)
+        self._store_cached_blob(remote_path, getattr(properties, "etag", None), data)
+        return data
+
     def read_csv(self, remote_path: str) -> pd.DataFrame:
         """
         Reads a CSV from Azure Blob Storage into a Pandas DataFrame.
         Returns None if the file does not exist or is empty.
         """
         try:
-            blob_client = self.container_client.get_blob_client(remote_path)
-            if not blob_client.exists():
+            data = self._download_blob_bytes(remote_path)
+            if data is None:
                 logger.debug(f"File not found in blob storage: {remote_path}")
                 return None
-            
-            download_stream = blob_client.download_blob()
-            data = download_stream.readall()
-            
+
             if not data:
                 return None
 
@@ -178,6 +270,7 @@ class BlobStorageClient:
             data = output.getvalue()
             
             blob_client = self.container_client.get_blob_client(remote_path)
+            self._invalidate_cached_blob(remote_path)
             blob_client.upload_blob(data, overwrite=True)
             logger.info(f"Successfully wrote to blob: {remote_path}")
         except Exception as e:
@@ -190,6 +283,7 @@ class BlobStorageClient:
         """
         try:
             blob_client = self.container_client.get_blob_client(remote_path)
+            self._invalidate_cached_blob(remote_path)
             with open(local_path, "rb") as data:
                 blob_client.upload_blob(data, overwrite=True)
             logger.info(f"Uploaded {local_path} to {remote_path}")
@@ -216,10 +310,7 @@ class BlobStorageClient:
         Downloads a blob as bytes.
         """
         try:
-            blob_client = self.container_client.get_blob_client(remote_path)
-            if not blob_client.exists():
-                return None
-            return blob_client.download_blob().readall()
+            return self._download_blob_bytes(remote_path)
         except Exception as e:
             logger.error(f"Error downloading data {remote_path}: {e}")
             raise
@@ -230,6 +321,7 @@ class BlobStorageClient:
         """
         try:
             blob_client = self.container_client.get_blob_client(remote_path)
+            self._invalidate_cached_blob(remote_path)
             blob_client.upload_blob(data, overwrite=overwrite)
             logger.info(f"Uploaded data to {remote_path}")
         except Exception as e:
@@ -242,9 +334,9 @@ class BlobStorageClient:
         """
         try:
             blob_client = self.container_client.get_blob_client(remote_path)
-            if not blob_client.exists():
-                return None
             return blob_client.get_blob_properties().last_modified
+        except ResourceNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Error getting properties for {remote_path}: {e}")
             return None
@@ -254,11 +346,9 @@ class BlobStorageClient:
         Reads a Parquet file from Azure Blob Storage into a Pandas DataFrame.
         """
         try:
-            blob_client = self.container_client.get_blob_client(remote_path)
-            if not blob_client.exists():
+            data = self._download_blob_bytes(remote_path)
+            if data is None:
                 return None
-            
-            data = blob_client.download_blob().readall()
             return pd.read_parquet(io.BytesIO(data))
         except Exception as e:
             logger.error(f"Error reading parquet {remote_path}: {e}")
@@ -274,6 +364,7 @@ class BlobStorageClient:
             data = output.getvalue()
             
             blob_client = self.container_client.get_blob_client(remote_path)
+            self._invalidate_cached_blob(remote_path)
             blob_client.upload_blob(data, overwrite=True)
             logger.info(f"Successfully wrote parquet to blob: {remote_path}")
         except Exception as e:
@@ -1,7 +1,10 @@
 import os
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, TypeVar
 import re
 
 import pandas as pd
@@ -19,6 +22,9 @@ _INDEX_ARTIFACT_EXACT_NAMES = {
     "index_level_0",
 }
 _NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+_DEFAULT_DELTA_TABLE_CACHE_MAX_ENTRIES = 64
+
+T = TypeVar("T")
 
 
 def _normalize_index_artifact_name(name: Any) -> str:
@@ -123,7 +129,7 @@ def _log_delta_cast_candidates(df: pd.DataFrame, container: str, path: str, erro
     try:
         uri = get_delta_table_uri(container, path)
         opts = get_delta_storage_options(container)
-        dt = DeltaTable(uri, storage_options=opts)
+        dt = _get_cached_delta_table(uri, opts)[0]
 
         table_types = {}
         for field in dt.schema().fields:
@@ -184,8 +190,11 @@ def _log_delta_cast_candidates(df: pd.DataFrame, container: str, path: str, erro
 
 def _get_existing_delta_schema_columns(uri: str, storage_options: Dict[str, str]) -> Optional[List[str]]:
     try:
-        dt = DeltaTable(uri, storage_options=storage_options)
-        return [field.name for field in dt.schema().fields]
+        return _read_cached_delta_table(
+            uri,
+            storage_options,
+            lambda dt: [field.name for field in dt.schema().fields],
+        )
     except Exception as exc:
         if _is_missing_delta_table_error(exc):
             return None
@@ -343,40 +352,122 @@ def get_delta_storage_auth_diagnostics(container: Optional[str] = None) -> Dict[
         "accountKeySource": key_source,
     }
 
+_USER_DELEGATION_SAS_TTL_MINUTES = 60
+_USER_DELEGATION_SAS_REFRESH_SKEW = timedelta(minutes=5)
+_user_delegation_sas_cache: Dict[tuple[str, str], tuple[str, datetime]] = {}
+_user_delegation_key_cache: Dict[str, tuple[Any, datetime]] = {}
+_user_delegation_credential: Optional[DefaultAzureCredential] = None
+_user_delegation_cache_lock = threading.Lock()
+_user_delegation_refresh_locks: Dict[str, threading.Lock] = {}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _user_delegation_refresh_lock(account_name: str) -> threading.Lock:
+    with _user_delegation_cache_lock:
+        lock = _user_delegation_refresh_locks.get(account_name)
+        if lock is None:
+            lock = threading.Lock()
+            _user_delegation_refresh_locks[account_name] = lock
+        return lock
+
+
+def _get_user_delegation_credential() -> DefaultAzureCredential:
+    # DefaultAzureCredential caches tokens internally, so one instance per process avoids a
+    # token round trip on every delegation key request.
+    global _user_delegation_credential
+    with _user_delegation_cache_lock:
+        if _user_delegation_credential is None:
+            _user_delegation_credential = DefaultAzureCredential()
+        return _user_delegation_credential
+
+
+def _is_fresh(expiry: datetime, now: datetime) -> bool:
+    return now < expiry - _USER_DELEGATION_SAS_REFRESH_SKEW
+
+
+def _get_user_delegation_key(account_name: str, ttl_minutes: int) -> tuple[Any, datetime]:
+    """
+    Returns a (delegation_key, expiry) pair for the account, reusing the cached key until it
+    is within the refresh skew of expiring. Callers must hold the account refresh lock.
+    """
+    now = _utcnow()
+    cached = _user_delegation_key_cache.get(account_name)
+    if cached is not None and _is_fresh(cached[1], now):
+        return cached
+
+    account_url = f"https://{account_name}.blob.core.windows.net"
+    service_client = BlobServiceClient(account_url=account_url, credential=_get_user_delegation_credential())
+    start = now - timedelta(minutes=5)
+    expiry = start + timedelta(minutes=ttl_minutes)
+    delegation_key = service_client.get_user_delegation_key(start, expiry)
+    _user_delegation_key_cache[account_name] = (delegation_key, expiry)
+    logger.info("Issued user delegation key for account=%s expiry=%s", account_name, expiry.isoformat())
+    return delegation_key, expiry
+
+
 def _get_user_delegation_sas(
     container: Optional[str],
     account_name: Optional[str],
-    ttl_minutes: int = 60,
+    ttl_minutes: int = _USER_DELEGATION_SAS_TTL_MINUTES,
 ) -> Optional[str]:
+    """
+    Returns a container SAS signed with a user delegation key.
+
+    Tokens are cached per (account, container) and reused until shortly before expiry. Refreshes
+    are single-flight per account, so concurrent callers wait for one identity/key round trip
+    instead of each issuing their own; the delegation key itself is shared across containers.
+    """
     if not container or not account_name:
         return None
 
-    try:
-        credential = DefaultAzureCredential()
-        account_url = f"https://{account_name}.blob.core.windows.net"
-        service_client = BlobServiceClient(account_url=account_url, credential=credential)
-        start = datetime.now(timezone.utc) - timedelta(minutes=5)
-        expiry = start + timedelta(minutes=ttl_minutes)
-        delegation_key = service_client.get_user_delegation_key(start, expiry)
-        permissions = ContainerSasPermissions(
-            read=True,
-            write=True,
-            delete=True,
-            list=True,
-            add=True,
-            create=True,
-        )
-        return generate_container_sas(
-            account_name=account_name,
-            container_name=container,
-            user_delegation_key=delegation_key,
-            permission=permissions,
-            expiry=expiry,
-            start=start,
-        )
-    except Exception as exc:
-        logger.warning(f"Failed to generate user delegation SAS for {container}: {exc}")
-        return None
+    cache_key = (account_name, container)
+    cached = _user_delegation_sas_cache.get(cache_key)
+    if cached is not None and _is_fresh(cached[1], _utcnow()):
+        return cached[0]
+
+    with _user_delegation_refresh_lock(account_name):
+        cached = _user_delegation_sas_cache.get(cache_key)
+        if cached is not None and _is_fresh(cached[1], _utcnow()):
+            return cached[0]
+
+        try:
+            delegation_key, expiry = _get_user_delegation_key(account_name, ttl_minutes)
+            permissions = ContainerSasPermissions(
+                read=True,
+                write=True,
+                delete=True,
+                list=True,
+                add=True,
+                create=True,
+            )
+            sas_token = generate_container_sas(
+                account_name=account_name,
+                container_name=container,
+                user_delegation_key=delegation_key,
+                permission=permissions,
+                expiry=expiry,
+                start=expiry - timedelta(minutes=ttl_minutes),
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to generate user delegation SAS for {container}: {exc}")
+            return None
+
+        _user_delegation_sas_cache[cache_key] = (sas_token, expiry)
+        return sas_token
+
+
+def clear_user_delegation_sas_cache() -> None:
+    """
+    Drops cached delegation keys and SAS tokens (e.g. after a role assignment change).
+    """
+    global _user_delegation_credential
+    with _user_delegation_cache_lock:
+        _user_delegation_sas_cache.clear()
+        _user_delegation_key_cache.clear()
+        _user_delegation_credential = None
 
 def _ensure_container_exists(container: Optional[str]) -> None:
     if not container or container in _checked_containers:
@@ -431,6 +522,9 @@ def get_delta_storage_options(container: Optional[str] = None) -> Dict[str, str]
     2. Connection String (not directly supported by simple options, usually parsed)
     3. SAS Token (AZURE_STORAGE_SAS_TOKEN)
     4. Azure CLI/Identity fallback (azure_use_azure_cli='true')
+
+    Under Managed Identity the user delegation SAS is cached per (account, container),
+    so repeated calls do not hit the identity endpoint until the token nears expiry.
     """
     options = {}
     
@@ -545,6 +639,149 @@ def _is_missing_delta_table_error(exc: Exception) -> bool:
     )
     return any(marker in text for marker in markers)
 
+class _CachedDeltaTable:
+    __slots__ = ("table", "refresh_lock")
+
+    def __init__(self, table: DeltaTable) -> None:
+        self.table = table
+        self.refresh_lock = threading.Lock()
+
+
+_delta_table_cache: "OrderedDict[tuple[str, str], _CachedDeltaTable]" = OrderedDict()
+_delta_table_cache_lock = threading.Lock()
+
+
+def _delta_table_cache_max_entries() -> int:
+    raw = (os.environ.get("DELTA_TABLE_CACHE_MAX_ENTRIES") or "").strip()
+    if not raw:
+        return _DEFAULT_DELTA_TABLE_CACHE_MAX_ENTRIES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return _DEFAULT_DELTA_TABLE_CACHE_MAX_ENTRIES
+
+
+def _storage_identity(storage_options: Optional[Dict[str, str]]) -> str:
+    # Hash the options so credentials never sit in cache keys, while still separating
+    # handles opened under different identities (or a rotated SAS token).
+    payload = "\n".join(f"{key}={value}" for key, value in sorted((storage_options or {}).items()))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _delta_table_cache_key(uri: str, storage_options: Optional[Dict[str, str]]) -> tuple[str, str]:
+    # The table URI already encodes account, container and path.
+    return (str(uri), _storage_identity(storage_options))
+
+
+def _open_and_cache_delta_table(
+    key: tuple[str, str],
+    uri: str,
+    storage_options: Optional[Dict[str, str]],
+    *,
+    log_buffer_size: Optional[int] = None,
+) -> DeltaTable:
+    table = DeltaTable(uri, storage_options=storage_options, log_buffer_size=log_buffer_size)
+    max_entries = _delta_table_cache_max_entries()
+    with _delta_table_cache_lock:
+        existing = _delta_table_cache.get(key)
+        if existing is not None:
+            # Another thread opened the same table first; keep its handle and drop ours.
+            _delta_table_cache.move_to_end(key)
+            return existing.table
+        _delta_table_cache[key] = _CachedDeltaTable(table=table)
+        while len(_delta_table_cache) > max_entries:
+            _delta_table_cache.popitem(last=False)
+    return table
+
+
+def _get_cached_delta_table(
+    uri: str,
+    storage_options: Optional[Dict[str, str]],
+    *,
+    log_buffer_size: Optional[int] = None,
+) -> tuple[DeltaTable, bool]:
+    """
+    Returns an open DeltaTable at its latest version and whether it came from the cache.
+
+    Cached handles are brought up to date with delta-rs' incremental log update, which only
+    lists and applies commits newer than the handle's version instead of replaying the log
+    from the last checkpoint.
+    """
+    if _delta_table_cache_max_entries() <= 0:
+        return DeltaTable(uri, storage_options=storage_options, log_buffer_size=log_buffer_size), False
+
+    key = _delta_table_cache_key(uri, storage_options)
+    with _delta_table_cache_lock:
+        entry = _delta_table_cache.get(key)
+        if entry is not None:
+            _delta_table_cache.move_to_end(key)
+
+    if entry is None:
+        return _open_and_cache_delta_table(key, uri, storage_options, log_buffer_size=log_buffer_size), False
+
+    try:
+        with entry.refresh_lock:
+            entry.table.update_incremental()
+    except Exception as exc:
+        logger.info(f"Cached Delta handle refresh failed for {uri}; reopening: {exc}")
+        _evict_delta_table_cache_key(key)
+        return _open_and_cache_delta_table(key, uri, storage_options, log_buffer_size=log_buffer_size), False
+    return entry.table, True
+
+
+def _evict_delta_table_cache_key(key: tuple[str, str]) -> None:
+    with _delta_table_cache_lock:
+        _delta_table_cache.pop(key, None)
+
+
+def _read_cached_delta_table(
+    uri: str,
+    storage_options: Optional[Dict[str, str]],
+    reader: Callable[[DeltaTable], T],
+    *,
+    log_buffer_size: Optional[int] = None,
+) -> T:
+    """
+    Runs ``reader`` against a cached handle, retrying once on a freshly opened table when the
+    cached handle fails (e.g. the table was deleted or recreated underneath it).
+    """
+    dt, from_cache = _get_cached_delta_table(uri, storage_options, log_buffer_size=log_buffer_size)
+    try:
+        return reader(dt)
+    except Exception:
+        if not from_cache:
+            raise
+        key = _delta_table_cache_key(uri, storage_options)
+        _evict_delta_table_cache_key(key)
+        dt = _open_and_cache_delta_table(key, uri, storage_options, log_buffer_size=log_buffer_size)
+        return reader(dt)
+
+
+def invalidate_delta_table_cache(container: Optional[str] = None, path: Optional[str] = None) -> int:
+    """
+    Drops cached DeltaTable handles.
+
+    With no arguments the whole cache is cleared; otherwise only handles for the given
+    container/path are dropped, regardless of the storage identity they were opened with.
+    Returns the number of evicted handles.
+    """
+    if container is None and path is None:
+        with _delta_table_cache_lock:
+            evicted = len(_delta_table_cache)
+            _delta_table_cache.clear()
+        return evicted
+
+    try:
+        uri = get_delta_table_uri(str(container or ""), str(path or ""))
+    except Exception:
+        return 0
+    with _delta_table_cache_lock:
+        stale_keys = [key for key in _delta_table_cache if key[0] == uri]
+        for key in stale_keys:
+            _delta_table_cache.pop(key, None)
+    return len(stale_keys)
+
+
 def store_delta(
     df: pd.DataFrame, 
     container: str, 
@@ -594,8 +831,11 @@ def store_delta(
             schema_mode=schema_mode,
             storage_options=opts
         )
+        invalidate_delta_table_cache(container, path)
         logger.info(f"Successfully wrote Delta table to {path}")
     except Exception as e:
+        # A failed commit may still have advanced the log (e.g. a conflicting writer).
+        invalidate_delta_table_cache(container, path)
         logger.error(f"Failed to write Delta table {path}: {e}")
         error_text = str(e)
         if "Cannot cast" in error_text:
@@ -620,8 +860,16 @@ def load_delta(
         uri = get_delta_table_uri(container, path)
         opts = get_delta_storage_options(container)
         
-        dt = DeltaTable(uri, version=version, storage_options=opts, log_buffer_size=log_buffer_size)
-        return dt.to_pandas(columns=columns, filters=filters)
+        if version is not None:
+            # Time-travel reads pin a specific version, so they bypass the shared handle cache.
+            dt = DeltaTable(uri, version=version, storage_options=opts, log_buffer_size=log_buffer_size)
+            return dt.to_pandas(columns=columns, filters=filters)
+        return _read_cached_delta_table(
+            uri,
+            opts,
+            lambda dt: dt.to_pandas(columns=columns, filters=filters),
+            log_buffer_size=log_buffer_size,
+        )
     except Exception as e:
         if _is_missing_delta_table_error(e):
             logger.info(f"Delta table not found for {path}; returning empty.")
@@ -638,16 +886,8 @@ def get_delta_last_commit(container: str, path: str) -> Optional[float]:
         uri = get_delta_table_uri(container, path)
         opts = get_delta_storage_options(container)
         
-        dt = DeltaTable(uri, storage_options=opts)
-        # history() returns a list of dictionaries. 0-th index is usually latest? 
-        # Actually dt.history() in python returns a list of dicts, most recent first usually?
-        # Let's check metadata directly or history.
-        # dt.metadata().created_time is creation.
-        # let's use history(1)
-        hist = dt.history(1)
+        hist = _read_cached_delta_table(uri, opts, lambda dt: dt.history(1))
         if hist:
-            # timestamp is usually in milliseconds or microseconds?
-            # dictionary keys: timestamp, operation, etc.
             # timestamp is int (ms since epoch)
             ts = hist[0].get('timestamp')
             if ts:
@@ -685,6 +925,8 @@ def vacuum_delta_table(
             enforce_retention_duration=enforce_retention_duration,
             full=full,
         )
+        if not dry_run:
+            invalidate_delta_table_cache(container, path)
         removed_count = len(removed or [])
         logger.info(
             "Vacuumed Delta table %s (container=%s): removed_files=%d dry_run=%s retention_hours=%s full=%s",
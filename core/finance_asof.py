@@ -0,0 +1,96 @@
+"""Point-in-time views over sparse finance tables.
+
+Silver finance tables keep one row per report/effective date and symbol. Consumers that
+need a calendar-daily series (gold features, rankings, backtests) expand them on demand
+with `daily_asof_view` instead of storing the forward-filled days.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+FINANCE_ASOF_GROUP_COLUMNS: tuple[str, ...] = ("symbol", "timeframe")
+
+_DAY_NS = 86_400_000_000_000
+
+
+def utc_today() -> pd.Timestamp:
+    """Current UTC calendar date; the default end for daily views that run through today."""
+    return pd.Timestamp(datetime.now(timezone.utc).date())
+
+
+def _coerce_naive_dates(series: pd.Series) -> pd.Series:
+    parsed = pd.to_datetime(series, errors="coerce", utc=True, format="mixed")
+    if hasattr(parsed.dtype, "tz") and parsed.dtype.tz is not None:
+        parsed = parsed.dt.tz_convert(None)
+    return parsed
+
+
+def daily_asof_view(
+    df: pd.DataFrame,
+    *,
+    date_column: str = "date",
+    group_columns: Sequence[str] = FINANCE_ASOF_GROUP_COLUMNS,
+    extend_to: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """Expand point-in-time rows into one row per calendar day per group.
+
+    Each group (the `group_columns` present in `df`) spans its first row date through its
+    last row date, or `extend_to` when later. Every column is forward-filled independently
+    within the group, so a day carries the latest known value as of that date. Output
+    matches a per-group `reindex(date_range(freq="D")).ffill()` with groups in sorted order.
+    """
+
+    if date_column not in df.columns:
+        return df
+
+    out = df.copy()
+    out[date_column] = _coerce_naive_dates(out[date_column])
+    out = out.dropna(subset=[date_column]).reset_index(drop=True)
+    if out.empty:
+        return out
+
+    keys = [column for column in group_columns if column in out.columns]
+    if keys:
+        group_ids = out.groupby(keys, dropna=False, sort=True).ngroup().to_numpy(dtype="int64")
+    else:
+        group_ids = np.zeros(len(out), dtype="int64")
+    dates_ns = out[date_column].to_numpy(dtype="datetime64[ns]").astype("int64")
+
+    # Latest row wins when a group repeats a date; input order breaks ties.
+    order = np.lexsort((np.arange(len(out)), dates_ns, group_ids))
+    out = out.iloc[order].reset_index(drop=True)
+    group_ids = group_ids[order]
+    dates_ns = dates_ns[order]
+    is_last = np.ones(len(out), dtype=bool)
+    is_last[:-1] = (group_ids[1:] != group_ids[:-1]) | (dates_ns[1:] != dates_ns[:-1])
+    out = out.loc[is_last].reset_index(drop=True)
+    group_ids = group_ids[is_last]
+    dates_ns = dates_ns[is_last]
+
+    group_count = int(group_ids.max()) + 1
+    starts = np.full(group_count, np.iinfo("int64").max, dtype="int64")
+    ends = np.full(group_count, np.iinfo("int64").min, dtype="int64")
+    np.minimum.at(starts, group_ids, dates_ns)
+    np.maximum.at(ends, group_ids, dates_ns)
+    if extend_to is not None:
+        ends = np.maximum(ends, pd.Timestamp(extend_to).value)
+    day_counts = (ends - starts) // _DAY_NS + 1
+    calendar_offsets = np.concatenate([[0], np.cumsum(day_counts)[:-1]])
+    total_days = int(day_counts.sum())
+
+    # Rows off the group's midnight-aligned day grid have no calendar slot, as with reindex.
+    since_start = dates_ns - starts[group_ids]
+    on_grid = since_start % _DAY_NS == 0
+    out = out.loc[on_grid]
+    out.index = calendar_offsets[group_ids[on_grid]] + since_start[on_grid] // _DAY_NS
+
+    calendar_groups = np.repeat(np.arange(group_count), day_counts)
+    day_index = np.arange(total_days) - np.repeat(calendar_offsets, day_counts)
+    expanded = out.reindex(np.arange(total_days)).groupby(calendar_groups, sort=False).ffill()
+    expanded[date_column] = pd.to_datetime(np.repeat(starts, day_counts) + day_index * _DAY_NS)
+    return expanded.reset_index(drop=True)
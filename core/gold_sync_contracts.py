@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 import time
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from core import core as mdc
@@ -350,6 +352,13 @@ class GoldSyncFailureDetails:
     detail: str
 
 
+@dataclass(frozen=True)
+class _SymbolWatermark:
+    max_key: date
+    row_count: int
+    digest: int
+
+
 class PostgresWriteTargetUnavailableError(RuntimeError):
     pass
 
@@ -358,6 +367,10 @@ _TRANSIENT_SYNC_MAX_ATTEMPTS = 3
 _TRANSIENT_SYNC_RETRY_BASE_SECONDS = 2.0
 _TEMP_STAGE_NAME = "gold_sync_stage"
 _TEMP_STAGE_TABLE = f"pg_temp.{_TEMP_STAGE_NAME}"
+_TEMP_WINDOW_NAME = "gold_sync_window"
+_TEMP_WINDOW_TABLE = f"pg_temp.{_TEMP_WINDOW_NAME}"
+_SYMBOL_WATERMARK_VERSION = 1
+_DIGEST_MASK = (1 << 64) - 1
 
 
 def sync_state_cache_entry(result: GoldSyncResult) -> dict[str, Any]:
@@ -617,12 +630,26 @@ def _sync_gold_bucket_prepared_frames(
         attempt += 1
         current_symbols: set[str] = set()
         row_count = 0
+        staged_rows = 0
         min_key: Optional[date] = None
         max_key: Optional[date] = None
         failure_stage = "connect"
         effective_scope_symbols = set(normalized_scope_symbols)
         deleted_rows = 0
         upserted_rows = 0
+        sync_windows: dict[str, date] = {}
+
+        def _observe(prepared: pd.DataFrame) -> None:
+            nonlocal row_count, min_key, max_key
+            current_symbols.update(_normalize_symbols(prepared.get("symbol", pd.Series(dtype="object")).tolist()))
+            row_count += int(len(prepared))
+            frame_min = prepared[config.date_column].min()
+            frame_max = prepared[config.date_column].max()
+            if frame_min is not None and (min_key is None or frame_min < min_key):
+                min_key = frame_min
+            if frame_max is not None and (max_key is None or frame_max > max_key):
+                max_key = frame_max
+            digests.add(prepared)
 
         try:
             attempt_started_at = time.perf_counter()
@@ -631,35 +658,50 @@ def _sync_gold_bucket_prepared_frames(
                 with conn.cursor() as cur:
                     failure_stage = "verify_write_target"
                     _ensure_connection_is_writable(cur)
+                    failure_stage = "load_watermarks"
+                    prior_watermarks = _load_symbol_watermarks(cur, config=config, bucket=clean_bucket)
+                    digests = _SymbolDigests(config=config, prior=prior_watermarks)
+                    if prior_watermarks:
+                        # Scan pass: find symbols whose already-synced history is unchanged so only
+                        # their newer dates need staging. Everything else resyncs in full.
+                        failure_stage = "scan_frames"
+                        for prepared in prepared_frames_factory():
+                            if isinstance(prepared, pd.DataFrame) and not prepared.empty:
+                                _observe(prepared)
+                        sync_windows = digests.sync_windows()
                     failure_stage = "stage_copy"
                     _create_temp_stage(cur, config=config)
                     for prepared in prepared_frames_factory():
                         if not isinstance(prepared, pd.DataFrame) or prepared.empty:
                             continue
-                        current_symbols.update(
-                            _normalize_symbols(prepared.get("symbol", pd.Series(dtype="object")).tolist())
-                        )
-                        row_count += int(len(prepared))
-                        frame_min = prepared[config.date_column].min()
-                        frame_max = prepared[config.date_column].max()
-                        if frame_min is not None and (min_key is None or frame_min < min_key):
-                            min_key = frame_min
-                        if frame_max is not None and (max_key is None or frame_max > max_key):
-                            max_key = frame_max
+                        if not prior_watermarks:
+                            _observe(prepared)
+                        staged = _filter_to_sync_windows(prepared, config=config, sync_windows=sync_windows)
+                        if staged.empty:
+                            continue
+                        staged_rows += int(len(staged))
                         copy_rows(
                             cur,
                             table=_TEMP_STAGE_TABLE,
                             columns=_quote_columns(config.columns),
-                            rows=_copy_rows(prepared),
+                            rows=_copy_rows(staged),
                         )
                     _analyze_temp_stage(cur)
                     effective_scope_symbols.update(current_symbols)
                     failure_stage = "delete_missing"
-                    deleted_rows = _delete_missing_target_rows(
-                        cur,
-                        config=config,
-                        scope_symbols=sorted(effective_scope_symbols),
-                    )
+                    if sync_windows:
+                        deleted_rows = _delete_missing_target_rows_in_windows(
+                            cur,
+                            config=config,
+                            scope_symbols=sorted(effective_scope_symbols),
+                            sync_windows=sync_windows,
+                        )
+                    else:
+                        deleted_rows = _delete_missing_target_rows(
+                            cur,
+                            config=config,
+                            scope_symbols=sorted(effective_scope_symbols),
+                        )
                     failure_stage = "upsert_stage"
                     upserted_rows = _upsert_staged_rows(cur, config=config)
                     unchanged_rows = max(row_count - upserted_rows, 0)
@@ -675,14 +717,16 @@ def _sync_gold_bucket_prepared_frames(
                         min_key=min_key,
                         max_key=max_key,
                         error=None,
+                        symbol_watermarks=digests.watermarks(),
                     )
             duration_ms = int(round((time.perf_counter() - attempt_started_at) * 1000.0))
             mdc.write_line(
                 "postgres_gold_sync_apply_stats "
-                f"domain={config.domain} bucket={clean_bucket} staged_rows={row_count} "
+                f"domain={config.domain} bucket={clean_bucket} staged_rows={staged_rows} "
                 f"deleted_rows={deleted_rows} upserted_rows={upserted_rows} "
                 f"unchanged_rows={unchanged_rows} scope_symbols={len(effective_scope_symbols)} "
-                f"duration_ms={duration_ms}"
+                f"duration_ms={duration_ms} sync_mode={'incremental' if sync_windows else 'full'} "
+                f"incremental_symbols={len(sync_windows)} row_count={row_count}"
             )
             return _result(
                 row_count=row_count,
@@ -898,6 +942,153 @@ def _analyze_temp_stage(cur: Any) -> None:
     cur.execute(f"ANALYZE {_TEMP_STAGE_NAME}")
 
 
+def _load_symbol_watermarks(cur: Any, *, config: GoldSyncConfig, bucket: str) -> dict[str, _SymbolWatermark]:
+    cur.execute(
+        """
+        SELECT status, symbol_watermarks
+        FROM core.gold_sync_state
+        WHERE domain = %s AND bucket = %s
+        """,
+        (config.domain, bucket),
+    )
+    row = cur.fetchone()
+    if not row or str(row[0] or "").strip().lower() != "success":
+        return {}
+    return _parse_symbol_watermarks(row[1])
+
+
+def _parse_symbol_watermarks(value: Any) -> dict[str, _SymbolWatermark]:
+    payload = value
+    if isinstance(payload, (bytes, str)):
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return {}
+    if not isinstance(payload, Mapping) or payload.get("version") != _SYMBOL_WATERMARK_VERSION:
+        return {}
+    symbols = payload.get("symbols")
+    if not isinstance(symbols, Mapping):
+        return {}
+
+    out: dict[str, _SymbolWatermark] = {}
+    for symbol, entry in symbols.items():
+        try:
+            out[str(symbol).strip().upper()] = _SymbolWatermark(
+                max_key=date.fromisoformat(str(entry["max_key"])),
+                row_count=int(entry["row_count"]),
+                digest=int(str(entry["digest"]), 16),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return out
+
+
+def _encode_symbol_watermarks(watermarks: Mapping[str, _SymbolWatermark]) -> str:
+    return json.dumps(
+        {
+            "version": _SYMBOL_WATERMARK_VERSION,
+            "symbols": {
+                symbol: {
+                    "max_key": watermark.max_key.isoformat(),
+                    "row_count": watermark.row_count,
+                    "digest": f"{watermark.digest:016x}",
+                }
+                for symbol, watermark in sorted(watermarks.items())
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+def _symbol_digest_sums(frame: pd.DataFrame, *, config: GoldSyncConfig) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Return symbols, row counts and wrapping uint64 row-hash sums for a prepared frame."""
+
+    if frame.empty:
+        return [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64)
+    row_hashes = pd.util.hash_pandas_object(frame[list(config.columns)], index=False).to_numpy(dtype=np.uint64)
+    codes, symbols = pd.factorize(frame["symbol"], sort=False)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_codes[1:] != sorted_codes[:-1]]))
+    counts = np.diff(np.concatenate([starts, [sorted_codes.size]]))
+    sums = np.add.reduceat(row_hashes[order], starts)
+    return [str(symbols[code]) for code in sorted_codes[starts]], counts, sums
+
+
+class _SymbolDigests:
+    """Per-symbol row counts, max keys and order-independent content digests for one bucket sync.
+
+    Alongside the full-history digest, rows at or before each symbol's prior watermark are
+    digested separately; when that prefix still matches the prior watermark the symbol only
+    needs rows after it staged.
+    """
+
+    def __init__(self, *, config: GoldSyncConfig, prior: Mapping[str, _SymbolWatermark]) -> None:
+        self._config = config
+        self._prior = prior
+        self._prior_keys = {symbol: pd.Timestamp(watermark.max_key) for symbol, watermark in prior.items()}
+        self._totals: dict[str, list[Any]] = {}
+        self._prefixes: dict[str, list[int]] = {}
+
+    def add(self, frame: pd.DataFrame) -> None:
+        symbols, counts, sums = _symbol_digest_sums(frame, config=self._config)
+        frame_max_keys = frame.groupby("symbol", sort=False)[self._config.date_column].max()
+        for symbol, count, digest in zip(symbols, counts.tolist(), sums.tolist()):
+            total = self._totals.setdefault(symbol, [0, 0, None])
+            total[0] += int(count)
+            total[1] = (total[1] + int(digest)) & _DIGEST_MASK
+            frame_max_key = frame_max_keys.get(symbol)
+            if frame_max_key is not None and (total[2] is None or frame_max_key > total[2]):
+                total[2] = frame_max_key
+
+        if not self._prior_keys:
+            return
+        limits = frame["symbol"].map(self._prior_keys)
+        in_prefix = pd.to_datetime(frame[self._config.date_column]).le(limits).to_numpy(dtype=bool)
+        if not in_prefix.any():
+            return
+        symbols, counts, sums = _symbol_digest_sums(frame.loc[in_prefix], config=self._config)
+        for symbol, count, digest in zip(symbols, counts.tolist(), sums.tolist()):
+            prefix = self._prefixes.setdefault(symbol, [0, 0])
+            prefix[0] += int(count)
+            prefix[1] = (prefix[1] + int(digest)) & _DIGEST_MASK
+
+    def sync_windows(self) -> dict[str, date]:
+        """Map symbols whose synced history is unchanged to the last key already in Postgres."""
+
+        windows: dict[str, date] = {}
+        for symbol in self._totals:
+            prior = self._prior.get(symbol)
+            prefix = self._prefixes.get(symbol)
+            if prior is None or prefix is None:
+                continue
+            if prefix[0] == prior.row_count and prefix[1] == prior.digest:
+                windows[symbol] = prior.max_key
+        return windows
+
+    def watermarks(self) -> dict[str, _SymbolWatermark]:
+        return {
+            symbol: _SymbolWatermark(max_key=max_key, row_count=row_count, digest=digest)
+            for symbol, (row_count, digest, max_key) in self._totals.items()
+            if max_key is not None
+        }
+
+
+def _filter_to_sync_windows(
+    frame: pd.DataFrame,
+    *,
+    config: GoldSyncConfig,
+    sync_windows: Mapping[str, date],
+) -> pd.DataFrame:
+    if not sync_windows:
+        return frame
+    after_keys = frame["symbol"].map({symbol: pd.Timestamp(key) for symbol, key in sync_windows.items()})
+    keep = after_keys.isna() | pd.to_datetime(frame[config.date_column]).gt(after_keys)
+    if bool(keep.all()):
+        return frame
+    return frame.loc[keep.to_numpy(dtype=bool)]
+
+
 def _delete_missing_target_rows(
     cur: Any,
     *,
@@ -924,6 +1115,49 @@ def _delete_missing_target_rows(
     return _cursor_rowcount(cur)
 
 
+def _delete_missing_target_rows_in_windows(
+    cur: Any,
+    *,
+    config: GoldSyncConfig,
+    scope_symbols: Sequence[str],
+    sync_windows: Mapping[str, date],
+) -> int:
+    """Delete stale rows only inside each symbol's sync window.
+
+    Symbols with a window are reconciled after their watermark key; every other scope symbol
+    (changed history, new, or absent from the bucket) is reconciled over its full history.
+    """
+
+    if not scope_symbols:
+        return 0
+
+    quoted_date_column = _quote_identifier(config.date_column)
+    cur.execute(
+        f"CREATE TEMP TABLE {_TEMP_WINDOW_NAME} (symbol TEXT PRIMARY KEY, after_key DATE) ON COMMIT DROP"
+    )
+    copy_rows(
+        cur,
+        table=_TEMP_WINDOW_TABLE,
+        columns=_quote_columns(("symbol", "after_key")),
+        rows=((symbol, sync_windows.get(symbol)) for symbol in scope_symbols),
+    )
+    cur.execute(
+        f"""
+        DELETE FROM {config.table} AS target
+        USING {_TEMP_WINDOW_TABLE} AS sync_window
+        WHERE target."symbol" = sync_window."symbol"
+          AND (sync_window.after_key IS NULL OR target.{quoted_date_column} > sync_window.after_key)
+          AND NOT EXISTS (
+              SELECT 1
+              FROM {_TEMP_STAGE_TABLE} AS stage
+              WHERE stage."symbol" = target."symbol"
+                AND stage.{quoted_date_column} = target.{quoted_date_column}
+          )
+        """
+    )
+    return _cursor_rowcount(cur)
+
+
 def _upsert_staged_rows(cur: Any, *, config: GoldSyncConfig) -> int:
     key_columns = _sync_key_columns(config)
     quoted_insert_columns = ", ".join(_quote_identifier(column) for column in config.columns)
@@ -1035,6 +1269,7 @@ def _upsert_sync_state(
     min_key: Optional[date],
     max_key: Optional[date],
     error: Optional[str],
+    symbol_watermarks: Optional[Mapping[str, _SymbolWatermark]] = None,
 ) -> None:
     cur.execute(
         """
@@ -1048,9 +1283,10 @@ def _upsert_sync_state(
             min_observation_date,
             max_observation_date,
             synced_at,
-            error
+            error,
+            symbol_watermarks
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s, %s::jsonb)
         ON CONFLICT (domain, bucket) DO UPDATE
         SET source_commit = EXCLUDED.source_commit,
             status = EXCLUDED.status,
@@ -1059,7 +1295,8 @@ def _upsert_sync_state(
             min_observation_date = EXCLUDED.min_observation_date,
             max_observation_date = EXCLUDED.max_observation_date,
             synced_at = NOW(),
-            error = EXCLUDED.error
+            error = EXCLUDED.error,
+            symbol_watermarks = EXCLUDED.symbol_watermarks
         """,
         (
             domain,
@@ -1071,6 +1308,7 @@ def _upsert_sync_state(
             min_key,
             max_key,
             error,
+            _encode_symbol_watermarks(symbol_watermarks) if symbol_watermarks is not None else None,
         ),
     )
 
@@ -43,6 +43,37 @@ def silver_alpha26_force_rebuild() -> bool:
     return _is_truthy(raw)
 
 
+def silver_market_force_rebuild() -> bool:
+    """
+    Silver market merges changed symbols into existing buckets unless a full replay is requested.
+
+    Unlike the other Silver domains, an unset SILVER_ALPHA26_FORCE_REBUILD means incremental here.
+    """
+    return _is_truthy(os.environ.get("SILVER_ALPHA26_FORCE_REBUILD"))
+
+
+def available_memory_mb() -> Optional[float]:
+    """Best-effort memory headroom for this container (cgroup limit first, then host MemAvailable)."""
+
+    try:
+        with open("/sys/fs/cgroup/memory.max", encoding="utf-8") as handle:
+            raw_limit = handle.read().strip()
+        with open("/sys/fs/cgroup/memory.current", encoding="utf-8") as handle:
+            raw_current = handle.read().strip()
+        if raw_limit.isdigit() and raw_current.isdigit():
+            return max(0.0, (int(raw_limit) - int(raw_current)) / (1024 * 1024))
+    except OSError:
+        pass
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("MemAvailable:"):
+                    return float(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
 def gold_layout_mode() -> str:
     from core import config as cfg
 
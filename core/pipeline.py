@@ -33,6 +33,11 @@ class DataPaths:
     def get_gold_market_bucket_path(bucket: str) -> str:
         return f"market/buckets/{str(bucket).strip().upper()}"
 
+    @staticmethod
+    def get_gold_market_latest_path() -> str:
+        """Latest-row-per-symbol snapshot maintained alongside the gold market buckets."""
+        return "market/snapshots/latest"
+
     @staticmethod
     def get_technical_analysis_path(ticker: str) -> str:
         """Per-ticker technical analysis indicator table path."""
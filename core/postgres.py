@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+import logging
 import os
-from typing import Any, Iterable, Optional, Sequence
+import threading
+import time
+from collections import deque
+from io import BytesIO
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+_POOL_MIN_SIZE_ENV = "POSTGRES_POOL_MIN_SIZE"
+_POOL_MAX_SIZE_ENV = "POSTGRES_POOL_MAX_SIZE"
+_POOL_TIMEOUT_ENV = "POSTGRES_POOL_TIMEOUT_SECONDS"
+_POOL_MAX_IDLE_ENV = "POSTGRES_POOL_MAX_IDLE_SECONDS"
+_POOL_CHECK_AFTER_ENV = "POSTGRES_POOL_HEALTH_CHECK_AFTER_SECONDS"
+_DEFAULT_POOL_MIN_SIZE = 0
+_DEFAULT_POOL_MAX_SIZE = 10
+_DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+_DEFAULT_POOL_MAX_IDLE_SECONDS = 300.0
+_DEFAULT_POOL_CHECK_AFTER_SECONDS = 30.0
+
 
 class PostgresError(RuntimeError):
     pass
@@ -28,9 +46,277 @@ def _import_psycopg():
     return psycopg
 
 
-def connect(dsn: str):
-    psycopg = _import_psycopg()
-    return psycopg.connect(dsn)
+def _env_int(name: str, default: int) -> int:
+    raw = (os.environ.get(name) or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except ValueError:
+        return int(default)
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = (os.environ.get(name) or "").strip()
+    if not raw:
+        return float(default)
+    try:
+        return float(raw)
+    except ValueError:
+        return float(default)
+
+
+_SESSION_RESET_SQL = "SELECT pg_advisory_unlock_all()"
+
+
+class _ConnectionPool:
+    """Thread-safe pool of idle psycopg connections for one DSN.
+
+    Connections are handed out through `_PooledConnection` and returned on context exit.
+    A connection goes back to the idle set only when it is open, unbroken, outside a
+    transaction and its session reset (advisory locks released, autocommit off) succeeded;
+    otherwise it is closed. Idle connections past `check_after_seconds` are pinged before
+    reuse and idle connections past `max_idle_seconds` beyond `min_size` are closed.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_size: int,
+        max_size: int,
+        timeout_seconds: float,
+        max_idle_seconds: float,
+        check_after_seconds: float,
+    ) -> None:
+        self.dsn = dsn
+        self.min_size = max(0, min(int(min_size), int(max_size)))
+        self.max_size = max(1, int(max_size))
+        self.timeout_seconds = max(0.0, float(timeout_seconds))
+        self.max_idle_seconds = max(0.0, float(max_idle_seconds))
+        self.check_after_seconds = max(0.0, float(check_after_seconds))
+        self.pid = os.getpid()
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        for _ in range(self.min_size):
+            try:
+                self._idle.append((self._open(), time.monotonic()))
+            except Exception as exc:
+                logger.warning("Postgres pool prefill failed: %s", exc)
+                break
+            self._size += 1
+
+    def _open(self) -> Any:
+        psycopg = _import_psycopg()
+        return psycopg.connect(self.dsn)
+
+    def acquire(self) -> Any:
+        deadline = time.monotonic() + self.timeout_seconds
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PostgresError("Postgres connection pool is closed.")
+                if self._idle:
+                    conn, released_at = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn, released_at = None, 0.0
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PostgresError(
+                        f"Timed out after {self.timeout_seconds:.1f}s waiting for a Postgres connection "
+                        f"(max_size={self.max_size})."
+                    )
+                self._cond.wait(remaining)
+
+        if conn is not None and self._is_reusable(conn, released_at=released_at):
+            return conn
+        if conn is not None:
+            _close_quietly(conn)
+        try:
+            return self._open()
+        except BaseException:
+            self._forget()
+            raise
+
+    def release(self, conn: Any) -> None:
+        if self.pid != os.getpid():
+            _FORK_ORPHANS.append(conn)
+            return
+        reusable = self._is_reusable(conn, released_at=None) and self._reset_session(conn)
+        with self._cond:
+            if reusable and not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                self._evict_idle_locked()
+                self._cond.notify()
+                return
+        _close_quietly(conn)
+        self._forget()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            _close_quietly(conn)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {"size": self._size, "idle": len(self._idle), "max_size": self.max_size}
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size = max(0, self._size - 1)
+            self._cond.notify()
+
+    def _evict_idle_locked(self) -> None:
+        if self.max_idle_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.max_idle_seconds
+        while self._idle and self._size > self.min_size and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            _close_quietly(conn)
+
+    def _reset_session(self, conn: Any) -> bool:
+        # Session advisory locks survive commit and rollback; a closed connection used to drop them.
+        try:
+            conn.autocommit = True
+            conn.execute(_SESSION_RESET_SQL)
+            conn.autocommit = False
+        except Exception as exc:
+            logger.warning("Postgres pooled connection reset failed; closing it: %s", exc)
+            return False
+        return True
+
+    def _is_reusable(self, conn: Any, *, released_at: Optional[float]) -> bool:
+        if getattr(conn, "closed", False) or getattr(conn, "broken", False):
+            return False
+        psycopg = _import_psycopg()
+        status = getattr(getattr(conn, "info", None), "transaction_status", None)
+        if status is not None and status != psycopg.pq.TransactionStatus.IDLE:
+            return False
+        if released_at is None or time.monotonic() - released_at < self.check_after_seconds:
+            return True
+        try:
+            conn.execute("SELECT 1")
+            conn.rollback()
+        except Exception:
+            return False
+        return True
+
+
+class _PooledConnection:
+    """Context manager matching `with psycopg.connect(dsn) as conn:` on top of a pool.
+
+    Exit commits (or rolls back on error) like a psycopg connection, then returns the
+    connection to the pool instead of closing it.
+    """
+
+    def __init__(self, pool: _ConnectionPool) -> None:
+        self._pool = pool
+        self._conn: Any = None
+
+    def __enter__(self) -> Any:
+        self._conn = self._pool.acquire()
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return None
+        try:
+            if not getattr(conn, "closed", False):
+                if exc_type is None:
+                    conn.commit()
+                else:
+                    conn.rollback()
+        except Exception:
+            _close_quietly(conn)
+            self._pool._forget()
+            if exc_type is None:
+                raise
+            return None
+        self._pool.release(conn)
+        return None
+
+
+_POOLS: Dict[str, _ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+# Connections inherited across fork() share sockets with the parent; keep them referenced
+# so garbage collection in the child never sends a terminate message on the parent's session.
+_FORK_ORPHANS: List[Any] = []
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _reset_pools_after_fork() -> None:
+    global _POOLS_LOCK
+    _POOLS_LOCK = threading.Lock()
+    for pool in _POOLS.values():
+        _FORK_ORPHANS.extend(conn for conn, _ in pool._idle)
+        pool._idle.clear()
+        pool._closed = True
+    _POOLS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def _pool_max_size() -> int:
+    return _env_int(_POOL_MAX_SIZE_ENV, _DEFAULT_POOL_MAX_SIZE)
+
+
+def get_pool(dsn: str) -> _ConnectionPool:
+    """Return the process-wide pool for `dsn`, creating it from POSTGRES_POOL_* settings."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(dsn)
+        if pool is not None and pool.pid == os.getpid():
+            return pool
+        pool = _ConnectionPool(
+            dsn,
+            min_size=_env_int(_POOL_MIN_SIZE_ENV, _DEFAULT_POOL_MIN_SIZE),
+            max_size=_pool_max_size(),
+            timeout_seconds=_env_float(_POOL_TIMEOUT_ENV, _DEFAULT_POOL_TIMEOUT_SECONDS),
+            max_idle_seconds=_env_float(_POOL_MAX_IDLE_ENV, _DEFAULT_POOL_MAX_IDLE_SECONDS),
+            check_after_seconds=_env_float(_POOL_CHECK_AFTER_ENV, _DEFAULT_POOL_CHECK_AFTER_SECONDS),
+        )
+        _POOLS[dsn] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Close every idle pooled connection; checked-out connections close on return."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def connect(dsn: str, *, pooled: bool = True):
+    """Open a Postgres connection for use as `with connect(dsn) as conn:`.
+
+    Connections come from a DSN-keyed process-wide pool; set POSTGRES_POOL_MAX_SIZE=0 or
+    pass `pooled=False` for a dedicated connection (e.g. long-lived LISTEN sessions).
+    """
+    if not pooled or _pool_max_size() <= 0:
+        psycopg = _import_psycopg()
+        return psycopg.connect(dsn)
+    return _PooledConnection(get_pool(dsn))
 
 
 def require_columns(df: pd.DataFrame, required: Sequence[str], label: str) -> None:
@@ -52,3 +338,54 @@ def copy_rows(
         for row in rows:
             copy.write_row(row)
 
+
+def copy_frame(
+    cursor: Any,
+    *,
+    table: str,
+    frame: pd.DataFrame,
+    columns: Sequence[str],
+    chunk_rows: int = 100_000,
+) -> None:
+    """
+    Streams a DataFrame into `table` with `COPY ... FROM STDIN` in CSV format.
+
+    Rows are rendered in chunks by `DataFrame.to_csv`, so no per-row Python tuples are built;
+    missing values become empty fields, which COPY loads as NULL.
+    """
+    cols = ", ".join(columns)
+    statement = f"COPY {table} ({cols}) FROM STDIN (FORMAT CSV)"
+    step = max(1, int(chunk_rows))
+    with cursor.copy(statement) as copy:
+        for start in range(0, len(frame), step):
+            buffer = BytesIO()
+            frame.iloc[start : start + step].to_csv(buffer, columns=list(columns), header=False, index=False)
+            copy.write(buffer.getvalue())
+
+
+def copy_query_frame(
+    cursor: Any,
+    query: str,
+    params: Optional[Sequence[Any]] = None,
+    *,
+    text_columns: Sequence[str] = (),
+) -> pd.DataFrame:
+    """
+    Streams a SELECT through `COPY ... TO STDOUT` as CSV and parses it column-wise with pandas,
+    avoiding per-row Python tuples for large result sets.
+
+    Values come back in their text form (e.g. booleans as ``t``/``f``); only empty fields are
+    treated as missing, and `text_columns` are kept as strings.
+    """
+    statement = f"COPY ({query}) TO STDOUT (FORMAT CSV, HEADER)"
+    buffer = BytesIO()
+    with cursor.copy(statement, params) as copy:
+        for block in copy:
+            buffer.write(block)
+    buffer.seek(0)
+    return pd.read_csv(
+        buffer,
+        keep_default_na=False,
+        na_values=[""],
+        dtype={column: "string" for column in text_columns},
+    )
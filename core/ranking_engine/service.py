@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-import math
 import uuid
 from datetime import date, datetime, timezone
 from typing import Any
@@ -9,7 +10,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from core.postgres import connect, copy_rows
+from core.postgres import connect, copy_frame, copy_query_frame
 from core.ranking_engine.contracts import (
     RankingGroup,
     RankingMaterializationSummary,
@@ -63,7 +64,16 @@ def materialize_strategy_rankings(
     start_date: date | None = None,
     end_date: date | None = None,
     triggered_by: str = "manual",
+    incremental: bool = False,
 ) -> dict[str, Any]:
+    """
+    Computes rankings for a strategy and replaces the covered dates in its platinum table.
+
+    With `incremental=True` and no explicit `start_date`, only dates from the stored watermark
+    onward are recomputed (the watermark date itself is refreshed in case it was revised). A
+    missing watermark, a changed ranking definition, a different output table, or an end date
+    before the watermark falls back to a full rebuild.
+    """
     strategy = _load_strategy(dsn, strategy_name)
     strategy_config: StrategyConfig = strategy["config"]
     if not strategy_config.rankingSchemaName:
@@ -75,9 +85,36 @@ def materialize_strategy_rankings(
         raise ValueError(f"Ranking schema '{strategy_config.rankingSchemaName}' not found.")
 
     ranking_schema = RankingSchemaConfig.model_validate(ranking_schema_record["config"])
-    resolved_start, resolved_end = _resolve_date_range(dsn, ranking_schema, strategy_config, start_date, end_date)
-    run_id = uuid.uuid4().hex
     output_table_name = str(strategy.get("output_table_name") or slugify_strategy_output_table(strategy_name))
+    # Resolved once per run and shared by the fingerprint, the date range and the computation.
+    strategy_universe = _resolve_strategy_universe(dsn, strategy_config)
+    ranking_universe = _resolve_ranking_universe(dsn, ranking_schema)
+    # An explicit start date leaves earlier dates as they were, so the table can only be vouched
+    # for under the current definition after a full rebuild or a resumed incremental run.
+    definition_fingerprint = (
+        _ranking_definition_fingerprint(strategy_universe, ranking_universe, ranking_schema)
+        if start_date is None
+        else None
+    )
+    incremental_start: date | None = None
+    if incremental and definition_fingerprint is not None:
+        incremental_start = _incremental_start_date(
+            dsn,
+            strategy_name=strategy_name,
+            output_table_name=output_table_name,
+            definition_fingerprint=definition_fingerprint,
+            end_date=end_date,
+        )
+    resolved_start, resolved_end = _resolve_date_range(
+        dsn,
+        ranking_schema,
+        strategy_config,
+        start_date or incremental_start,
+        end_date,
+        strategy_universe=strategy_universe,
+        ranking_universe=ranking_universe,
+    )
+    run_id = uuid.uuid4().hex
     _insert_ranking_run(
         dsn,
         run_id=run_id,
@@ -98,6 +135,8 @@ def materialize_strategy_rankings(
             ranking_schema=ranking_schema,
             start_date=resolved_start,
             end_date=resolved_end,
+            strategy_universe=strategy_universe,
+            ranking_universe=ranking_universe,
         )
         rows_written = _write_rankings_to_platinum(
             dsn,
@@ -121,6 +160,7 @@ def materialize_strategy_rankings(
             ranking_schema_version=int(ranking_schema_record["version"]),
             output_table_name=output_table_name,
             last_ranked_date=resolved_end,
+            definition_fingerprint=definition_fingerprint,
         )
         summary = RankingMaterializationSummary(
             runId=run_id,
@@ -149,19 +189,69 @@ def _load_strategy(dsn: str, strategy_name: str) -> dict[str, Any]:
     return strategy
 
 
+def _ranking_definition_fingerprint(
+    strategy_universe: UniverseDefinition,
+    ranking_universe: UniverseDefinition,
+    ranking_schema: RankingSchemaConfig,
+) -> str:
+    # Only inputs that change which rows are ranked or how they score; exit rules and sizing don't.
+    payload = {
+        "strategyUniverse": strategy_universe.model_dump(mode="json"),
+        "rankingUniverse": ranking_universe.model_dump(mode="json"),
+        "rankingSchema": ranking_schema.model_dump(mode="json"),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _incremental_start_date(
+    dsn: str,
+    *,
+    strategy_name: str,
+    output_table_name: str,
+    definition_fingerprint: str,
+    end_date: date | None,
+) -> date | None:
+    watermark = _load_ranking_watermark(dsn, strategy_name)
+    if not watermark or watermark.get("last_ranked_date") is None:
+        logger.info("No ranking watermark for strategy '%s'; rebuilding all dates.", strategy_name)
+        return None
+    if watermark.get("output_table_name") != output_table_name:
+        logger.info("Ranking output table changed for strategy '%s'; rebuilding all dates.", strategy_name)
+        return None
+    if watermark.get("definition_fingerprint") != definition_fingerprint:
+        logger.info("Ranking definition changed for strategy '%s'; rebuilding all dates.", strategy_name)
+        return None
+    last_ranked_date: date = watermark["last_ranked_date"]
+    if end_date is not None and end_date < last_ranked_date:
+        logger.info(
+            "Ranking end date %s precedes watermark %s for strategy '%s'; rebuilding all dates.",
+            end_date.isoformat(),
+            last_ranked_date.isoformat(),
+            strategy_name,
+        )
+        return None
+    return last_ranked_date
+
+
 def _resolve_date_range(
     dsn: str,
     ranking_schema: RankingSchemaConfig,
     strategy_config: StrategyConfig,
     start_date: date | None,
     end_date: date | None,
+    *,
+    strategy_universe: UniverseDefinition | None = None,
+    ranking_universe: UniverseDefinition | None = None,
 ) -> tuple[date, date]:
     if start_date and end_date:
         return start_date, end_date
 
     table_specs = universe_service._load_gold_table_specs(dsn)
-    strategy_universe = _resolve_strategy_universe(dsn, strategy_config)
-    ranking_universe = _resolve_ranking_universe(dsn, ranking_schema)
+    if strategy_universe is None:
+        strategy_universe = _resolve_strategy_universe(dsn, strategy_config)
+    if ranking_universe is None:
+        ranking_universe = _resolve_ranking_universe(dsn, ranking_schema)
     referenced_tables = _collect_required_columns(strategy_universe, ranking_universe, ranking_schema)
     candidate_dates: list[date] = []
     with connect(dsn) as conn:
@@ -196,10 +286,14 @@ def _compute_rankings_dataframe(
     ranking_schema: RankingSchemaConfig,
     start_date: date,
     end_date: date,
+    strategy_universe: UniverseDefinition | None = None,
+    ranking_universe: UniverseDefinition | None = None,
 ) -> pd.DataFrame:
     table_specs = universe_service._load_gold_table_specs(dsn)
-    strategy_universe = _resolve_strategy_universe(dsn, strategy_config)
-    ranking_universe = _resolve_ranking_universe(dsn, ranking_schema)
+    if strategy_universe is None:
+        strategy_universe = _resolve_strategy_universe(dsn, strategy_config)
+    if ranking_universe is None:
+        ranking_universe = _resolve_ranking_universe(dsn, ranking_schema)
     required_columns = _collect_required_columns(strategy_universe, ranking_universe, ranking_schema)
     frames = _load_table_frames(dsn, table_specs=table_specs, required_columns=required_columns, start_date=start_date, end_date=end_date)
     merged = _merge_frames(frames)
@@ -315,10 +409,7 @@ def _load_table_frames(
                   AND {universe_service._quote_identifier(spec.as_of_column)} <= %s
             """
             with conn.cursor() as cur:
-                cur.execute(query, (start_date, end_date))
-                rows = cur.fetchall()
-                columns_in_result = [desc.name for desc in cur.description]
-            frame = pd.DataFrame(rows, columns=columns_in_result)
+                frame = copy_query_frame(cur, query, (start_date, end_date), text_columns=("symbol",))
             if frame.empty:
                 frames[table_name] = pd.DataFrame(columns=["date", "symbol", *[f"{table_name}__{column}" for column in selected_columns]])
                 continue
@@ -327,25 +418,32 @@ def _load_table_frames(
             for column in selected_columns:
                 normalized = f"{table_name}__{column}"
                 series = frame[column]
-                if str(series.dtype) == "bool":
-                    frame[normalized] = series.astype(int)
+                if _is_copied_boolean(series):
+                    frame[normalized] = series.map({"t": 1, "f": 0})
                 else:
                     frame[normalized] = pd.to_numeric(series, errors="coerce")
             frames[table_name] = frame[["date", "symbol", *[f"{table_name}__{column}" for column in selected_columns]]]
     return frames
 
 
+def _is_copied_boolean(series: pd.Series) -> bool:
+    # COPY renders booleans as t/f text.
+    if series.dtype != object:
+        return False
+    present = series.dropna()
+    return not present.empty and bool(present.isin(["t", "f"]).all())
+
+
 def _merge_frames(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
-    merged: pd.DataFrame | None = None
-    for frame in frames.values():
-        if merged is None:
-            merged = frame.copy()
-            continue
-        merged = merged.merge(frame, on=["date", "symbol"], how="outer")
-    if merged is None:
+    """Aligns all table frames on (date, symbol) with one multi-way outer join."""
+    keyed = [
+        frame.drop_duplicates(subset=["date", "symbol"]).set_index(["date", "symbol"])
+        for frame in frames.values()
+    ]
+    if not keyed:
         return pd.DataFrame(columns=["date", "symbol"])
-    merged = merged.drop_duplicates(subset=["date", "symbol"]).reset_index(drop=True)
-    return merged
+    merged = keyed[0] if len(keyed) == 1 else pd.concat(keyed, axis=1, join="outer", sort=True)
+    return merged.reset_index()
 
 
 def _evaluate_universe_mask(df: pd.DataFrame, node: UniverseGroup | UniverseCondition) -> pd.Series:
@@ -425,15 +523,14 @@ def _apply_transforms(series: pd.Series, dates: pd.Series, transforms: list[Rank
         elif transform_type == "clip":
             current = current.clip(lower=params.get("lower"), upper=params.get("upper"))
         elif transform_type == "winsorize":
-            current = current.groupby(groups, group_keys=False).apply(
-                lambda item: _winsorize(
-                    item,
-                    lower_quantile=_optional_float(params.get("lowerQuantile")),
-                    upper_quantile=_optional_float(params.get("upperQuantile")),
-                )
+            current = _winsorize(
+                current,
+                groups,
+                lower_quantile=_optional_float(params.get("lowerQuantile")),
+                upper_quantile=_optional_float(params.get("upperQuantile")),
             )
         elif transform_type == "log1p":
-            current = current.where(current > -1).map(lambda value: math.log1p(value) if pd.notna(value) else np.nan)
+            current = np.log1p(current.where(current > -1))
         elif transform_type == "negate":
             current = current * -1
         elif transform_type == "abs":
@@ -441,33 +538,86 @@ def _apply_transforms(series: pd.Series, dates: pd.Series, transforms: list[Rank
         elif transform_type == "percentile_rank":
             current = current.groupby(groups, group_keys=False).rank(method="average", pct=True)
         elif transform_type == "zscore":
-            current = current.groupby(groups, group_keys=False).apply(_zscore)
+            current = _zscore(current, groups)
         elif transform_type == "minmax":
-            current = current.groupby(groups, group_keys=False).apply(_minmax)
+            current = _minmax(current, groups)
         else:
             raise ValueError(f"Unsupported transform '{transform_type}'.")
     return current
 
 
-def _winsorize(series: pd.Series, *, lower_quantile: float | None, upper_quantile: float | None) -> pd.Series:
-    lower = series.quantile(lower_quantile) if lower_quantile is not None else None
-    upper = series.quantile(upper_quantile) if upper_quantile is not None else None
+# Cross-sectional transforms run per date group via grouped `transform`, which broadcasts each
+# group statistic back onto the original rows without a Python call per group.
+def _winsorize(
+    series: pd.Series,
+    groups: pd.Series,
+    *,
+    lower_quantile: float | None,
+    upper_quantile: float | None,
+) -> pd.Series:
+    lower = _group_quantile(series, groups, lower_quantile) if lower_quantile is not None else None
+    upper = _group_quantile(series, groups, upper_quantile) if upper_quantile is not None else None
     return series.clip(lower=lower, upper=upper)
 
 
-def _zscore(series: pd.Series) -> pd.Series:
-    std = series.std(ddof=0)
-    if pd.isna(std) or std == 0:
-        return pd.Series(0.0, index=series.index)
-    return (series - series.mean()) / std
-
-
-def _minmax(series: pd.Series) -> pd.Series:
-    min_value = series.min()
-    max_value = series.max()
-    if pd.isna(min_value) or pd.isna(max_value) or min_value == max_value:
-        return pd.Series(0.0, index=series.index)
-    return (series - min_value) / (max_value - min_value)
+def _group_quantile(series: pd.Series, groups: pd.Series, quantile: float) -> pd.Series:
+    """
+    Per-group linear quantile broadcast back onto the rows.
+
+    Sort-based kernel that reproduces `Series.quantile` (numpy's linear percentile) exactly, so
+    winsorized bounds and the ties they create match the per-group computation bit for bit.
+    """
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    codes, uniques = pd.factorize(groups)
+    out = np.full(len(values), np.nan)
+    valid = (codes >= 0) & ~np.isnan(values)
+    if not valid.any():
+        return pd.Series(out, index=series.index)
+
+    valid_codes = codes[valid]
+    valid_values = values[valid]
+    sorted_values = valid_values[np.lexsort((valid_values, valid_codes))]
+    counts = np.bincount(valid_codes, minlength=len(uniques))
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    counts, starts = counts[present], starts[present]
+
+    # Same arithmetic as pandas -> np.percentile(q * 100) -> linear interpolation.
+    q = np.true_divide(np.float64(quantile) * 100.0, 100)
+    virtual = (counts - 1) * q
+    previous = np.floor(virtual)
+    at_end = virtual >= counts - 1
+    previous = np.where(at_end, -1.0, previous)
+    lower_index = np.where(at_end, counts - 1, previous).astype(np.intp)
+    upper_index = np.where(at_end, counts - 1, previous + 1).astype(np.intp)
+    gamma = virtual - previous
+    a = sorted_values[starts + lower_index]
+    b = sorted_values[starts + upper_index]
+    diff = b - a
+    interpolated = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+    by_group = np.full(len(present), np.nan)
+    by_group[present] = interpolated
+    in_group = codes >= 0
+    out[in_group] = by_group[codes[in_group]]
+    return pd.Series(out, index=series.index)
+
+
+def _zscore(series: pd.Series, groups: pd.Series) -> pd.Series:
+    grouped = series.groupby(groups)
+    mean = grouped.transform("mean")
+    std = grouped.transform("std", ddof=0)
+    # Degenerate groups (constant or all-missing) score 0.0 for every member.
+    degenerate = (std.isna() | (std == 0)) & groups.notna()
+    return ((series - mean) / std).mask(degenerate, 0.0)
+
+
+def _minmax(series: pd.Series, groups: pd.Series) -> pd.Series:
+    grouped = series.groupby(groups)
+    min_value = grouped.transform("min")
+    max_value = grouped.transform("max")
+    degenerate = (min_value.isna() | max_value.isna() | (min_value == max_value)) & groups.notna()
+    return ((series - min_value) / (max_value - min_value)).mask(degenerate, 0.0)
 
 
 def _optional_float(value: Any) -> float | None:
@@ -484,37 +634,49 @@ def _write_rankings_to_platinum(
     start_date: date,
     end_date: date,
 ) -> int:
+    """
+    Replaces the date range in the platinum output table with `ranked`.
+
+    The frame is bulk-loaded into a transaction-scoped staging table first, then swapped in with
+    a range delete plus `INSERT ... SELECT` in the same transaction, so readers see either the old
+    or the new rankings and a failed load leaves the table untouched.
+    """
+    target = f'"platinum".{universe_service._quote_identifier(table_name)}'
+    columns = ("date", "symbol", "rank", "score", "last_updated_date")
     with connect(dsn) as conn:
         with conn.cursor() as cur:
             cur.execute("CREATE SCHEMA IF NOT EXISTS platinum")
             _ensure_platinum_output_table(cur, table_name)
+            staged = 0
+            if not ranked.empty:
+                staging = _platinum_staging_identifier(table_name)
+                cur.execute(f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP")
+                payload = pd.DataFrame(
+                    {
+                        "date": ranked["date"],
+                        "symbol": ranked["symbol"].astype(str),
+                        "rank": ranked["rank"].astype("int64"),
+                        "score": ranked["score"].astype("float64"),
+                        "last_updated_date": datetime.now(timezone.utc).date(),
+                    }
+                )
+                copy_frame(cur, table=staging, frame=payload, columns=columns)
+                staged = int(len(payload))
             cur.execute(
                 f"""
-                DELETE FROM "platinum".{universe_service._quote_identifier(table_name)}
+                DELETE FROM {target}
                 WHERE date >= %s AND date <= %s
                 """,
                 (start_date, end_date),
             )
-            if ranked.empty:
-                return 0
-            last_updated_date = datetime.now(timezone.utc).date()
-            rows = (
-                (
-                    row["date"],
-                    str(row["symbol"]),
-                    int(row["rank"]),
-                    float(row["score"]),
-                    last_updated_date,
-                )
-                for _, row in ranked.iterrows()
-            )
-            copy_rows(
-                cur,
-                table=f'"platinum".{universe_service._quote_identifier(table_name)}',
-                columns=("date", "symbol", "rank", "score", "last_updated_date"),
-                rows=rows,
-            )
-            return int(len(ranked))
+            if staged:
+                column_list = ", ".join(columns)
+                cur.execute(f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {staging}")
+            return staged
+
+
+def _platinum_staging_identifier(table_name: str) -> str:
+    return universe_service._quote_identifier(build_scoped_identifier(table_name, "staging"))
 
 
 def _ensure_platinum_output_table(cursor: Any, table_name: str) -> None:
@@ -631,6 +793,7 @@ def _upsert_ranking_watermark(
     ranking_schema_version: int,
     output_table_name: str,
     last_ranked_date: date,
+    definition_fingerprint: str | None = None,
 ) -> None:
     with connect(dsn) as conn:
         with conn.cursor() as cur:
@@ -642,15 +805,17 @@ def _upsert_ranking_watermark(
                     ranking_schema_version,
                     output_table_name,
                     last_ranked_date,
+                    definition_fingerprint,
                     updated_at
                 )
-                VALUES (%s, %s, %s, %s, %s, NOW())
+                VALUES (%s, %s, %s, %s, %s, %s, NOW())
                 ON CONFLICT (strategy_name)
                 DO UPDATE SET
                     ranking_schema_name = EXCLUDED.ranking_schema_name,
                     ranking_schema_version = EXCLUDED.ranking_schema_version,
                     output_table_name = EXCLUDED.output_table_name,
                     last_ranked_date = EXCLUDED.last_ranked_date,
+                    definition_fingerprint = EXCLUDED.definition_fingerprint,
                     updated_at = NOW()
                 """,
                 (
@@ -659,5 +824,23 @@ def _upsert_ranking_watermark(
                     ranking_schema_version,
                     output_table_name,
                     last_ranked_date,
+                    definition_fingerprint,
                 ),
             )
+
+
+def _load_ranking_watermark(dsn: str, strategy_name: str) -> dict[str, Any] | None:
+    with connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT output_table_name, last_ranked_date, definition_fingerprint
+                FROM core.ranking_watermarks
+                WHERE strategy_name = %s
+                """,
+                (strategy_name,),
+            )
+            row = cur.fetchone()
+    if not row:
+        return None
+    return {"output_table_name": row[0], "last_ranked_date": row[1], "definition_fingerprint": row[2]}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from datetime import date, datetime, timezone
+from datetime import datetime, timezone
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pandas.tseries.offsets import BDay
@@ -79,6 +80,37 @@ class RegimeModelConfig(BaseModel):
     )
 
 
+_HISTORY_OUTPUT_COLUMNS = (
+    "as_of_date",
+    "effective_from_date",
+    "model_name",
+    "model_version",
+    "regime_code",
+    "regime_status",
+    "matched_rule_id",
+    "halt_flag",
+    "halt_reason",
+    "spy_return_20d",
+    "rvol_10d_ann",
+    "vix_spot_close",
+    "vix3m_close",
+    "vix_slope",
+    "trend_state",
+    "curve_state",
+    "vix_gt_32_streak",
+    "computed_at",
+)
+_TRANSITION_OUTPUT_COLUMNS = (
+    "model_name",
+    "model_version",
+    "effective_from_date",
+    "prior_regime_code",
+    "new_regime_code",
+    "trigger_rule_id",
+    "computed_at",
+)
+
+
 def default_regime_model_config() -> dict[str, Any]:
     return RegimeModelConfig().model_dump(mode="json")
 
@@ -129,6 +161,44 @@ def compute_curve_state(vix_slope: Any, *, config: RegimeModelConfig | Mapping[s
     return "flat"
 
 
+def compute_trend_states(
+    return_20d: pd.Series, *, config: RegimeModelConfig | Mapping[str, Any] | None = None
+) -> pd.Series:
+    cfg = config if isinstance(config, RegimeModelConfig) else RegimeModelConfig.model_validate(config or {})
+    values = pd.to_numeric(return_20d, errors="coerce").to_numpy(dtype=float)
+    states = np.select(
+        [values > cfg.trendPositiveThreshold, values < cfg.trendNegativeThreshold],
+        ["positive", "negative"],
+        default="near_zero",
+    )
+    return pd.Series(states, index=return_20d.index, dtype=object)
+
+
+def compute_curve_states(
+    vix_slope: pd.Series, *, config: RegimeModelConfig | Mapping[str, Any] | None = None
+) -> pd.Series:
+    cfg = config if isinstance(config, RegimeModelConfig) else RegimeModelConfig.model_validate(config or {})
+    values = pd.to_numeric(vix_slope, errors="coerce").to_numpy(dtype=float)
+    states = np.select(
+        [values >= cfg.curveContangoThreshold, values <= cfg.curveInvertedThreshold],
+        ["contango", "inverted"],
+        default="flat",
+    )
+    return pd.Series(states, index=vix_slope.index, dtype=object)
+
+
+def compute_threshold_streak(values: pd.Series, *, threshold: float) -> pd.Series:
+    """
+    Count consecutive rows whose value is strictly above ``threshold``.
+
+    Every row at or below the threshold (or missing) closes the current run, so the cumulative count
+    of breaks labels each run and a grouped cumulative sum yields its running length.
+    """
+    above = pd.to_numeric(values, errors="coerce").gt(threshold)
+    run_id = (~above).cumsum()
+    return above.astype("int64").groupby(run_id).cumsum().astype("int64")
+
+
 def classify_regime_row(
     row: Mapping[str, Any],
     *,
@@ -224,113 +294,142 @@ def build_regime_outputs(
     computed_at: datetime | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     cfg = config if isinstance(config, RegimeModelConfig) else RegimeModelConfig.model_validate(config or {})
-    if inputs.empty:
-        empty_history = pd.DataFrame(
-            columns=[
-                "as_of_date",
-                "effective_from_date",
-                "model_name",
-                "model_version",
-                "regime_code",
-                "regime_status",
-                "matched_rule_id",
-                "halt_flag",
-                "halt_reason",
-                "spy_return_20d",
-                "rvol_10d_ann",
-                "vix_spot_close",
-                "vix3m_close",
-                "vix_slope",
-                "trend_state",
-                "curve_state",
-                "vix_gt_32_streak",
-                "computed_at",
-            ]
-        )
+    frame = inputs.copy()
+    if not frame.empty:
+        frame["as_of_date"] = pd.to_datetime(frame["as_of_date"], errors="coerce").dt.date
+        frame = frame.dropna(subset=["as_of_date"]).sort_values("as_of_date").reset_index(drop=True)
+    if frame.empty:
+        empty_history = pd.DataFrame(columns=list(_HISTORY_OUTPUT_COLUMNS))
         empty_latest = pd.DataFrame(columns=empty_history.columns)
-        empty_transitions = pd.DataFrame(
-            columns=[
-                "model_name",
-                "model_version",
-                "effective_from_date",
-                "prior_regime_code",
-                "new_regime_code",
-                "trigger_rule_id",
-                "computed_at",
-            ]
-        )
+        empty_transitions = pd.DataFrame(columns=list(_TRANSITION_OUTPUT_COLUMNS))
         return empty_history, empty_latest, empty_transitions
 
-    computed = pd.Timestamp(computed_at or datetime.now(timezone.utc))
-    frame = inputs.copy()
-    frame["as_of_date"] = pd.to_datetime(frame["as_of_date"], errors="coerce").dt.date
-    frame = frame.dropna(subset=["as_of_date"]).sort_values("as_of_date").reset_index(drop=True)
-
-    as_of_dates = frame["as_of_date"].tolist()
-    effective_dates: list[date] = []
-    for index, as_of_date in enumerate(as_of_dates):
-        if index < len(as_of_dates) - 1:
-            effective_dates.append(as_of_dates[index + 1])
-            continue
-        next_business = (pd.Timestamp(as_of_date) + BDay(1)).date()
-        effective_dates.append(next_business)
+    computed = pd.Timestamp(computed_at or datetime.now(timezone.utc)).as_unit("ns")
+    effective_dates = frame["as_of_date"].shift(-1)
+    effective_dates.iloc[-1] = (pd.Timestamp(frame["as_of_date"].iloc[-1]) + BDay(1)).date()
     frame["effective_from_date"] = effective_dates
 
-    history_rows: list[dict[str, Any]] = []
-    transition_rows: list[dict[str, Any]] = []
-    prev_confirmed_regime: RegimeCode | None = None
-    last_recorded_confirmed: RegimeCode | None = None
-
-    for row in frame.to_dict("records"):
-        classification = classify_regime_row(
-            row,
-            prev_confirmed_regime=prev_confirmed_regime,
-            config=cfg,
-        )
-        regime_code = classification["regime_code"]
-        regime_status = classification["regime_status"]
-        matched_rule_id = classification["matched_rule_id"]
-
-        history_rows.append(
-            {
-                "as_of_date": row["as_of_date"],
-                "effective_from_date": row["effective_from_date"],
-                "model_name": model_name,
-                "model_version": int(model_version),
-                "regime_code": regime_code,
-                "regime_status": regime_status,
-                "matched_rule_id": matched_rule_id,
-                "halt_flag": bool(classification["halt_flag"]),
-                "halt_reason": classification["halt_reason"],
-                "spy_return_20d": _safe_float(row.get("return_20d")),
-                "rvol_10d_ann": _safe_float(row.get("rvol_10d_ann")),
-                "vix_spot_close": _safe_float(row.get("vix_spot_close")),
-                "vix3m_close": _safe_float(row.get("vix3m_close")),
-                "vix_slope": _safe_float(row.get("vix_slope")),
-                "trend_state": classification["trend_state"],
-                "curve_state": classification["curve_state"],
-                "vix_gt_32_streak": _safe_int(row.get("vix_gt_32_streak")),
-                "computed_at": computed,
-            }
-        )
-
-        if regime_status == "confirmed":
-            prev_confirmed_regime = regime_code
-            if last_recorded_confirmed != regime_code:
-                transition_rows.append(
-                    {
-                        "model_name": model_name,
-                        "model_version": int(model_version),
-                        "effective_from_date": row["effective_from_date"],
-                        "prior_regime_code": last_recorded_confirmed,
-                        "new_regime_code": regime_code,
-                        "trigger_rule_id": matched_rule_id,
-                        "computed_at": computed,
-                    }
-                )
-                last_recorded_confirmed = regime_code
-
-    history = pd.DataFrame(history_rows)
+    classification = _classify_regime_frame(frame, config=cfg)
+    streak = np.trunc(_numeric_column(frame, "vix_gt_32_streak"))
+    history = pd.DataFrame(
+        {
+            "as_of_date": frame["as_of_date"],
+            "effective_from_date": frame["effective_from_date"],
+            "model_name": model_name,
+            "model_version": int(model_version),
+            "regime_code": classification["regime_code"],
+            "regime_status": classification["regime_status"],
+            "matched_rule_id": classification["matched_rule_id"],
+            "halt_flag": classification["halt_flag"],
+            "halt_reason": classification["halt_reason"],
+            "spy_return_20d": _numeric_column(frame, "return_20d"),
+            "rvol_10d_ann": _numeric_column(frame, "rvol_10d_ann"),
+            "vix_spot_close": _numeric_column(frame, "vix_spot_close"),
+            "vix3m_close": _numeric_column(frame, "vix3m_close"),
+            "vix_slope": _numeric_column(frame, "vix_slope"),
+            "trend_state": classification["trend_state"],
+            "curve_state": classification["curve_state"],
+            "vix_gt_32_streak": streak.astype("int64") if streak.notna().all() else streak,
+            "computed_at": computed,
+        },
+        columns=list(_HISTORY_OUTPUT_COLUMNS),
+    )
     latest = history.tail(1).reset_index(drop=True)
-    transitions = pd.DataFrame(transition_rows)
+
+    # A transition is recorded whenever a confirmed regime differs from the previous confirmed one.
+    confirmed = history[history["regime_status"] == "confirmed"]
+    prior_codes = confirmed["regime_code"].shift(1)
+    changed = confirmed["regime_code"].ne(prior_codes)
+    transitions = pd.DataFrame(
+        {
+            "model_name": model_name,
+            "model_version": int(model_version),
+            "effective_from_date": confirmed.loc[changed, "effective_from_date"],
+            "prior_regime_code": prior_codes[changed].astype(object).where(prior_codes[changed].notna(), None),
+            "new_regime_code": confirmed.loc[changed, "regime_code"],
+            "trigger_rule_id": confirmed.loc[changed, "matched_rule_id"],
+            "computed_at": computed,
+        },
+        columns=list(_TRANSITION_OUTPUT_COLUMNS),
+    ).reset_index(drop=True)
     return history, latest, transitions
+
+
+def _numeric_column(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(np.nan, index=frame.index, dtype=float)
+    return pd.to_numeric(frame[column], errors="coerce").astype(float)
+
+
+def _classify_regime_frame(frame: pd.DataFrame, *, config: RegimeModelConfig) -> pd.DataFrame:
+    """
+    Column-wise equivalent of applying ``classify_regime_row`` down ``frame`` in date order.
+
+    Only the transition band depends on earlier rows, and only on the most recent confirmed regime.
+    Confirmed rows never depend on history, so that regime is a forward fill of the confirmed codes.
+    """
+    cfg = config
+    index = frame.index
+    trend_state = compute_trend_states(frame.get("return_20d", pd.Series(np.nan, index=index)), config=cfg)
+    curve_state = compute_curve_states(frame.get("vix_slope", pd.Series(np.nan, index=index)), config=cfg)
+    if "inputs_complete_flag" in frame.columns:
+        inputs_complete = frame["inputs_complete_flag"].astype(bool).to_numpy()
+    else:
+        inputs_complete = np.zeros(len(frame), dtype=bool)
+    rvol = _numeric_column(frame, "rvol_10d_ann").to_numpy()
+    vix_spot = _numeric_column(frame, "vix_spot_close").to_numpy()
+    streak = np.trunc(_numeric_column(frame, "vix_gt_32_streak").fillna(0.0).to_numpy())
+    trend = trend_state.to_numpy()
+    curve = curve_state.to_numpy()
+
+    halt_flag = inputs_complete & (vix_spot > cfg.haltVixThreshold) & (streak >= cfg.haltVixStreakDays)
+
+    high_vol = (rvol >= cfg.highVolEnterThreshold) & (curve == "inverted")
+    transition_band = (rvol >= cfg.highVolExitThreshold) & (rvol < cfg.highVolEnterThreshold)
+    trending_bear = (
+        (rvol >= cfg.bearVolMin)
+        & (rvol < cfg.bearVolMaxExclusive)
+        & (trend == "negative")
+        & ((curve == "flat") | (curve == "inverted"))
+    )
+    trending_bull = (rvol < cfg.bullVolMaxExclusive) & (trend == "positive") & (curve == "contango")
+    choppy = (
+        (rvol >= cfg.choppyVolMin)
+        & (rvol < cfg.choppyVolMaxExclusive)
+        & (trend == "near_zero")
+        & (curve == "contango")
+    )
+    rules = [
+        inputs_complete & high_vol,
+        inputs_complete & transition_band,
+        inputs_complete & trending_bear,
+        inputs_complete & trending_bull,
+        inputs_complete & choppy,
+    ]
+    rule_ids = ["high_vol", "transition_band", "trending_bear", "trending_bull", "choppy_mean_reversion"]
+    matched_rule_id = np.select(rules, rule_ids, default="")
+    in_transition = matched_rule_id == "transition_band"
+    confirmed = (matched_rule_id != "") & ~in_transition
+
+    confirmed_codes = pd.Series(np.where(confirmed, matched_rule_id, None), index=index, dtype=object)
+    prev_confirmed = confirmed_codes.ffill().to_numpy()
+    has_prev = pd.notna(prev_confirmed)
+
+    regime_code = np.where(confirmed, matched_rule_id, "unclassified").astype(object)
+    regime_code[in_transition & has_prev] = prev_confirmed[in_transition & has_prev]
+    regime_status = np.where(
+        confirmed, "confirmed", np.where(in_transition & has_prev, "transition", "unclassified")
+    ).astype(object)
+
+    return pd.DataFrame(
+        {
+            "regime_code": regime_code,
+            "regime_status": regime_status,
+            "matched_rule_id": np.where(matched_rule_id == "", None, matched_rule_id).astype(object),
+            "halt_flag": halt_flag,
+            "halt_reason": np.where(halt_flag, DEFAULT_HALT_REASON, None).astype(object),
+            "trend_state": trend_state,
+            "curve_state": curve_state,
+        },
+        index=index,
+    )
@@ -113,8 +113,11 @@ def preview_gold_universe(
         raise ValueError("sample_limit must be >= 1.")
 
     table_specs = _load_gold_table_specs(dsn)
+    query, params, tables_used = _compile_universe_query(universe.root, table_specs)
     with connect(dsn) as conn:
-        symbols, tables_used = _evaluate_node(conn, universe.root, table_specs)
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            symbols = {str(row[0]) for row in cur.fetchall()}
 
     ordered_symbols = sorted(symbols)
     warnings: list[str] = []
@@ -205,90 +208,105 @@ def is_intraday_table_spec(spec: UniverseTableSpec) -> bool:
     return spec.as_of_kind == "intraday"
 
 
-def _evaluate_node(
-    conn: Any,
-    node: UniverseGroup | UniverseCondition,
-    table_specs: dict[str, UniverseTableSpec],
-) -> tuple[set[str], set[str]]:
-    if isinstance(node, UniverseCondition):
-        table_name = _normalize_identifier(node.table, "table")
-        table_spec = table_specs.get(table_name)
-        if table_spec is None:
-            raise ValueError(f"Unknown gold table '{node.table}'.")
-        symbols = _fetch_condition_symbols(conn, table_spec, node)
-        return symbols, {table_spec.name}
-
-    child_symbols: list[set[str]] = []
-    tables_used: set[str] = set()
-    for clause in node.clauses:
-        clause_symbols, clause_tables = _evaluate_node(conn, clause, table_specs)
-        child_symbols.append(clause_symbols)
-        tables_used.update(clause_tables)
-
-    if node.operator == "and":
-        resolved = set(child_symbols[0])
-        for item in child_symbols[1:]:
-            resolved.intersection_update(item)
-        return resolved, tables_used
-
-    resolved = set()
-    for item in child_symbols:
-        resolved.update(item)
-    return resolved, tables_used
-
-
-def _fetch_condition_symbols(
-    conn: Any,
-    table_spec: UniverseTableSpec,
-    condition: UniverseCondition,
-) -> set[str]:
-    column_name = _normalize_identifier(condition.column, "column")
-    column_spec = table_spec.columns.get(column_name)
-    if column_spec is None:
-        raise ValueError(f"Unknown column '{condition.column}' for gold.{table_spec.name}.")
-    if condition.operator not in column_spec.operators:
-        raise ValueError(
-            f"Operator '{condition.operator}' is not supported for gold.{table_spec.name}.{column_spec.name}."
-        )
+class _UniverseQueryCompiler:
+    """
+    Compiles a universe expression tree into one SQL statement.
 
-    predicate_sql, params = _build_predicate(condition, column_spec)
-    symbol_identifier = _quote_identifier("symbol")
-    column_identifier = _quote_identifier(column_spec.name)
-    as_of_identifier = _quote_identifier(table_spec.as_of_column)
-    query = f"""
-        WITH latest AS (
+    Each referenced table is scanned once in a CTE that keeps the latest row per symbol with every
+    referenced column, each condition becomes a SELECT over that CTE, and groups combine their
+    clauses with INTERSECT (and) / UNION (or). Symbols are trimmed and upper-cased per condition so
+    the set operations compare normalized tickers.
+    """
+
+    def __init__(self, table_specs: dict[str, UniverseTableSpec]) -> None:
+        self._table_specs = table_specs
+        self._table_aliases: dict[str, str] = {}
+        self._column_aliases: dict[str, dict[str, str]] = {}
+        self.params: list[Any] = []
+
+    def compile(self, root: UniverseGroup | UniverseCondition) -> tuple[str, list[Any], set[str]]:
+        expression = self._compile_node(root)
+        symbol_identifier = _quote_identifier("symbol")
+        ctes: list[str] = []
+        for table_name, alias in self._table_aliases.items():
+            table_spec = self._table_specs[table_name]
+            selected = [f"{symbol_identifier} AS symbol"]
+            selected.extend(
+                f"{_quote_identifier(column_name)} AS {value_alias}"
+                for column_name, value_alias in self._column_aliases[table_name].items()
+            )
+            ctes.append(
+                f"""{alias} AS (
             SELECT DISTINCT ON ({symbol_identifier})
-              {symbol_identifier} AS symbol,
-              {column_identifier} AS candidate_value
+              {", ".join(selected)}
             FROM "gold".{_quote_identifier(table_spec.name)}
             WHERE {symbol_identifier} IS NOT NULL
-            ORDER BY {symbol_identifier}, {as_of_identifier} DESC NULLS LAST
-        )
+            ORDER BY {symbol_identifier}, {_quote_identifier(table_spec.as_of_column)} DESC NULLS LAST
+        )"""
+            )
+        query = f"""
+        WITH {", ".join(ctes)}
         SELECT symbol
-        FROM latest
-        WHERE {predicate_sql}
+        FROM ({expression}) AS universe
         ORDER BY symbol
     """
-    with conn.cursor() as cur:
-        cur.execute(query, params)
-        return {str(row[0]).strip().upper() for row in cur.fetchall() if str(row[0]).strip()}
+        return query, self.params, set(self._table_aliases)
+
+    def _compile_node(self, node: UniverseGroup | UniverseCondition) -> str:
+        if isinstance(node, UniverseCondition):
+            return self._compile_condition(node)
+        set_operator = " INTERSECT " if node.operator == "and" else " UNION "
+        return set_operator.join(f"({self._compile_node(clause)})" for clause in node.clauses)
+
+    def _compile_condition(self, condition: UniverseCondition) -> str:
+        table_name = _normalize_identifier(condition.table, "table")
+        table_spec = self._table_specs.get(table_name)
+        if table_spec is None:
+            raise ValueError(f"Unknown gold table '{condition.table}'.")
+        column_name = _normalize_identifier(condition.column, "column")
+        column_spec = table_spec.columns.get(column_name)
+        if column_spec is None:
+            raise ValueError(f"Unknown column '{condition.column}' for gold.{table_spec.name}.")
+        if condition.operator not in column_spec.operators:
+            raise ValueError(
+                f"Operator '{condition.operator}' is not supported for gold.{table_spec.name}.{column_spec.name}."
+            )
+
+        table_alias = self._table_aliases.setdefault(table_name, f"latest_{len(self._table_aliases)}")
+        column_aliases = self._column_aliases.setdefault(table_name, {})
+        value_alias = column_aliases.setdefault(column_spec.name, f"value_{len(column_aliases)}")
+        predicate_sql, params = _build_predicate(condition, column_spec, value_expression=value_alias)
+        self.params.extend(params)
+        return (
+            f"SELECT UPPER(BTRIM(symbol)) AS symbol FROM {table_alias} "
+            f"WHERE BTRIM(symbol) <> '' AND {predicate_sql}"
+        )
+
+
+def _compile_universe_query(
+    root: UniverseGroup | UniverseCondition,
+    table_specs: dict[str, UniverseTableSpec],
+) -> tuple[str, list[Any], set[str]]:
+    return _UniverseQueryCompiler(table_specs).compile(root)
 
 
 def _build_predicate(
     condition: UniverseCondition,
     column_spec: UniverseColumnSpec,
+    *,
+    value_expression: str = "candidate_value",
 ) -> tuple[str, list[Any]]:
     if condition.operator == "is_null":
-        return "candidate_value IS NULL", []
+        return f"{value_expression} IS NULL", []
     if condition.operator == "is_not_null":
-        return "candidate_value IS NOT NULL", []
+        return f"{value_expression} IS NOT NULL", []
 
     if condition.operator in {"in", "not_in"}:
         assert condition.values is not None
         coerced = _coerce_values(condition.values, column_spec)
         placeholders = ", ".join(["%s"] * len(coerced))
         comparator = "IN" if condition.operator == "in" else "NOT IN"
-        return f"candidate_value {comparator} ({placeholders})", coerced
+        return f"{value_expression} {comparator} ({placeholders})", coerced
 
     assert condition.value is not None
     coerced_value = _coerce_value(condition.value, column_spec)
@@ -302,7 +320,7 @@ def _build_predicate(
     }.get(condition.operator)
     if comparator is None:
         raise ValueError(f"Unsupported operator '{condition.operator}'.")
-    return f"candidate_value {comparator} %s", [coerced_value]
+    return f"{value_expression} {comparator} %s", [coerced_value]
 
 
 def _coerce_values(values: list[Any], column_spec: UniverseColumnSpec) -> list[Any]:
@@ -0,0 +1,6 @@
+BEGIN;
+
+ALTER TABLE IF EXISTS core.gold_sync_state
+    ADD COLUMN IF NOT EXISTS symbol_watermarks JSONB;
+
+COMMIT;
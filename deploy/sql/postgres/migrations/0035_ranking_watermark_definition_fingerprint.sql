@@ -0,0 +1,6 @@
+BEGIN;
+
+ALTER TABLE IF EXISTS core.ranking_watermarks
+    ADD COLUMN IF NOT EXISTS definition_fingerprint TEXT;
+
+COMMIT;
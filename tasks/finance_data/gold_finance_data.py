@@ -13,6 +13,7 @@ from tasks.common.silver_contracts import coerce_to_naive_datetime, normalize_co
 from core import domain_artifacts
 from tasks.common import gold_checkpoint_publication
 from core import layer_bucketing
+from core.finance_asof import daily_asof_view, utc_today
 from core.finance_contracts import SILVER_FINANCE_SUBDOMAINS, VALUATION_FINANCE_COLUMNS
 from tasks.common.market_reconciliation import (
     collect_delta_market_symbols,
@@ -157,15 +158,22 @@ def _append_unique(values: List[str], item: str) -> None:
         values.append(item)
 
 
+_MISSING_NUMBER_TEXT = frozenset({"nan", "none", "n/a", "na", "-", "--"})
+_NUMBER_SUFFIX_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
+_PLAIN_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+
 def _parse_human_number(value: Any) -> float:
+    """Scalar parser; `_coerce_numeric` applies the same rules column-wise."""
+
     if value is None:
         return float("nan")
 
-    if isinstance(value, (int, float, np.integer, np.floating)):
+    if isinstance(value, _PLAIN_NUMBER_TYPES):
         return float(value)
 
     text = str(value).strip()
-    if not text or text.lower() in {"nan", "none", "n/a", "na", "-", "--"}:
+    if not text or text.lower() in _MISSING_NUMBER_TEXT:
         return float("nan")
 
     negative = False
@@ -188,7 +196,7 @@ def _parse_human_number(value: Any) -> float:
     else:
         parsed = float(match.group(1))
         suffix = (match.group(2) or "").lower()
-        multiplier = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}.get(suffix, 1.0)
+        multiplier = _NUMBER_SUFFIX_MULTIPLIERS.get(suffix, 1.0)
         parsed *= multiplier
 
     if percent:
@@ -199,9 +207,45 @@ def _parse_human_number(value: Any) -> float:
 
 
 def _coerce_numeric(series: pd.Series) -> pd.Series:
+    """Parse human-formatted numbers (`1.5M`, `(12%)`, `1,200`) into float64, NaN when unparseable.
+
+    Numeric columns are converted directly. In object columns plain numbers take one float64
+    cast, each distinct string is parsed once, and any other objects go through
+    `_parse_human_number` individually.
+    """
+
     if series is None:
         return pd.Series(dtype="float64")
-    return series.apply(_parse_human_number).astype("float64")
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_complex_dtype(series.dtype):
+        return pd.Series(series.to_numpy(dtype="float64", na_value=np.nan), index=series.index, name=series.name)
+
+    values = series.astype(object)
+    parsed = np.full(len(values), np.nan, dtype="float64")
+    present = values.notna().to_numpy()
+    value_types = values.map(type)
+    unique_types = value_types.unique().tolist()
+    is_text = value_types.isin([kind for kind in unique_types if issubclass(kind, str)]).to_numpy() & present
+    is_number = value_types.isin([kind for kind in unique_types if issubclass(kind, _PLAIN_NUMBER_TYPES)]).to_numpy()
+    is_number &= present
+    is_other = present & ~is_text & ~is_number
+
+    if is_text.any():
+        # Daily as-of views repeat each reported value until the next filing; parse each string once.
+        codes, uniques = pd.factorize(values[is_text].astype(str))
+        parsed[is_text] = np.fromiter((_parse_human_number(text) for text in uniques), dtype="float64")[codes]
+    if is_number.any():
+        parsed[is_number] = values[is_number].to_numpy(dtype=object).astype("float64")
+    if is_other.any():
+        parsed[is_other] = [_parse_human_number(value) for value in values[is_other].tolist()]
+    return pd.Series(parsed, index=series.index, name=series.name)
+
+
+def _silver_daily_view(df: Optional[pd.DataFrame], *, extend_to: pd.Timestamp) -> pd.DataFrame:
+    """Forward-fill a sparse Silver finance bucket to one row per symbol/timeframe and day."""
+
+    if df is None or df.empty:
+        return pd.DataFrame()
+    return daily_asof_view(normalize_columns_to_snake_case(df), extend_to=extend_to)
 
 
 def _prepare_table(df: Optional[pd.DataFrame], ticker: str, *, source_label: str) -> pd.DataFrame:
@@ -608,6 +652,7 @@ def _run_alpha26_finance_gold(
     from core import delta_core
 
     backfill_start = pd.to_datetime(backfill_start_iso).normalize() if backfill_start_iso else None
+    daily_view_end = utc_today()
     processed = 0
     skipped_unchanged = 0
     skipped_missing_source = 0
@@ -698,7 +743,7 @@ def _run_alpha26_finance_gold(
 
         if df_gold_bucket is None:
             tables = {
-                key: delta_core.load_delta(silver_container, path)
+                key: _silver_daily_view(delta_core.load_delta(silver_container, path), extend_to=daily_view_end)
                 for key, path in silver_paths.items()
             }
             symbol_candidates: set[str] = set()
@@ -19,11 +19,7 @@ from tasks.finance_data.silver_frames import (
     _repair_symbol_column_aliases,
     _split_finance_bucket_rows,
 )
-from tasks.finance_data.silver_parsing import (
-    _read_finance_json,
-    _utc_today,
-    resample_daily_ffill,
-)
+from tasks.finance_data.silver_parsing import _read_finance_json
 from core.pipeline import DataPaths
 from core import bronze_bucketing
 from core import domain_artifacts
@@ -643,7 +639,6 @@ def _process_finance_frame(
     suffix: str,
     silver_path: str,
     df_raw: pd.DataFrame,
-    desired_end: pd.Timestamp,
     backfill_start: Optional[pd.Timestamp],
     signature: Optional[dict[str, Optional[str]]],
     persist: bool = True,
@@ -754,14 +749,14 @@ def _process_finance_frame(
             error=f"Storage client unavailable for cutoff purge {silver_path}.",
         )
 
-    df_clean = resample_daily_ffill(df_clean, extend_to=desired_end)
+    # Rows stay at their report/effective dates; daily views come from core.finance_asof on read.
     if df_clean is None or df_clean.empty:
         return BlobProcessResult(
             blob_name=blob_name,
             silver_path=silver_path,
             ticker=ticker,
             status="skipped" if is_optional_valuation else "failed",
-            error=None if is_optional_valuation else "No valid dated rows after cleaning/resample.",
+            error=None if is_optional_valuation else "No valid dated rows after cleaning.",
         )
 
     df_clean = _align_finance_frame_to_contract(df_clean, sub_domain=sub_domain, path=silver_path)
@@ -854,7 +849,6 @@ def _process_finance_frame(
 def process_alpha26_bucket_blob(
     blob: dict,
     *,
-    desired_end: pd.Timestamp,
     backfill_start: Optional[pd.Timestamp],
     watermarks: dict,
     persist: bool = True,
@@ -933,7 +927,6 @@ def process_alpha26_bucket_blob(
                 suffix=suffix,
                 silver_path=silver_path,
                 df_raw=df_raw,
-                desired_end=desired_end,
                 backfill_start=backfill_start,
                 signature=None,
                 persist=persist,
@@ -960,7 +953,6 @@ def process_alpha26_bucket_blob(
 def _process_alpha26_candidate_blobs(
     *,
     candidate_blobs: list[dict],
-    desired_end: pd.Timestamp,
     backfill_start: Optional[pd.Timestamp],
     watermarks: dict,
     persist: bool = True,
@@ -970,7 +962,6 @@ def _process_alpha26_candidate_blobs(
     ingest_started = time.perf_counter()
     results: list[BlobProcessResult] = []
     call_kwargs = {
-        "desired_end": desired_end,
         "backfill_start": backfill_start,
         "watermarks": watermarks,
     }
@@ -1043,7 +1034,6 @@ def main() -> int:
     layer_bucketing.silver_layout_mode()
     force_rebuild = layer_bucketing.silver_alpha26_force_rebuild()
 
-    desired_end = _utc_today()
     backfill_start, _ = get_backfill_range()
     if backfill_start is not None:
         mdc.write_line(f"Applying historical cutoff to silver finance data: {backfill_start.date().isoformat()}")
@@ -1072,7 +1062,6 @@ def main() -> int:
     if candidate_blobs:
         all_results, total_ingest_elapsed = _process_alpha26_candidate_blobs(
             candidate_blobs=candidate_blobs,
-            desired_end=desired_end,
             backfill_start=backfill_start,
             watermarks=watermarks,
             persist=False,
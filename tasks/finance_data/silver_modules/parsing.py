@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 import json
 import re
 from typing import Any, Optional
@@ -226,45 +225,3 @@ def _read_finance_json(raw_bytes: bytes, *, ticker: str, report_type: str) -> pd
 
     return _read_statement_payload(payload, ticker=ticker, report_type=sub_domain)
 
-
-def _utc_today() -> pd.Timestamp:
-    return pd.Timestamp(datetime.now(timezone.utc).date())
-
-
-def resample_daily_ffill(df: pd.DataFrame, *, extend_to: Optional[pd.Timestamp] = None) -> pd.DataFrame:
-    if "Date" not in df.columns:
-        return df
-
-    df = df.copy()
-    df["Date"] = coerce_to_naive_datetime(df["Date"])
-    df = df.dropna(subset=["Date"])
-    if df.empty:
-        return df
-
-    group_columns = [column for column in ("Symbol", "timeframe") if column in df.columns]
-    grouped_frames: list[pd.DataFrame] = []
-    grouped = [(None, df)] if not group_columns else list(df.groupby(group_columns, dropna=False, sort=True))
-
-    for group_key, group_frame in grouped:
-        group = group_frame.copy()
-        group = group.sort_values(["Date"]).drop_duplicates(subset=["Date"], keep="last")
-        group = group.set_index("Date").sort_index()
-        if group.empty:
-            continue
-
-        end = group.index.max()
-        if extend_to is not None and extend_to > end:
-            end = extend_to
-
-        full_range = pd.date_range(start=group.index.min(), end=end, freq="D", name="Date")
-        group_daily = group.reindex(full_range).ffill().reset_index()
-
-        if group_columns:
-            key_values = group_key if isinstance(group_key, tuple) else (group_key,)
-            for column, value in zip(group_columns, key_values):
-                group_daily[column] = value
-        grouped_frames.append(group_daily)
-
-    if not grouped_frames:
-        return pd.DataFrame(columns=df.reset_index(drop=True).columns)
-    return pd.concat(grouped_frames, ignore_index=True)
@@ -5,14 +5,17 @@ features, and writes bucketed Delta tables for downstream consumers.
 
 Execution flow:
 1. `main()` loads diagnostics, runtime config, and backfill settings.
-2. `_run_alpha26_market_gold()` iterates alphabet buckets and symbols.
-3. `compute_features()` derives technical indicators from OHLCV bars.
+2. `_run_alpha26_market_gold()` iterates alphabet buckets and symbols, optionally
+   computing changed buckets concurrently in a process pool.
+3. `compute_features()` derives technical indicators from OHLCV bars, one batch of
+   symbols per call.
 4. Bucket tables are written to gold storage and watermarks are updated.
 5. Health marker updates run at exit.
 """
 
 import os
 import re
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import Any, Iterator, Optional
@@ -27,7 +30,7 @@ from core import domain_artifacts
 from tasks.common import gold_checkpoint_publication
 from core import layer_bucketing
 from core.market_symbols import REGIME_REQUIRED_MARKET_SYMBOLS
-from tasks.technical_analysis.market_structure import add_market_structure_features
+from tasks.technical_analysis.market_structure import _symbol_group_codes, add_market_structure_features
 from tasks.technical_analysis.technical_indicators import (
     add_candlestick_patterns,
     add_heikin_ashi_and_ichimoku,
@@ -92,6 +95,7 @@ class BucketStageResult:
     bucket_symbol_to_bucket: dict[str, str]
     critical_compute_failure_symbol: Optional[str]
     chunk_summaries: list[dict[str, Any]]
+    latest_frame: Optional[pd.DataFrame] = None
 
 
 _SILVER_TO_GOLD_REQUIRED_COLUMNS = {
@@ -116,6 +120,9 @@ _BUCKET_PROGRESS_LOG_INTERVAL = 100
 _REGIME_REQUIRED_MARKET_SYMBOL_SET = frozenset(REGIME_REQUIRED_MARKET_SYMBOLS)
 _MARKET_CHUNK_SYMBOL_LIMIT = 25
 _MARKET_CHUNK_ROW_LIMIT = 100_000
+_DEFAULT_BUCKET_WORKERS = 1
+_MAX_BUCKET_WORKERS = 26
+_DEFAULT_BUCKET_WORKER_MEMORY_MB = 1536
 
 
 def _frame_memory_mb(df: Optional[pd.DataFrame]) -> float:
@@ -178,6 +185,60 @@ def _log_bucket_progress(
     mdc.write_line("gold_market_bucket_progress " + " ".join(fields))
 
 
+def _available_memory_mb() -> Optional[float]:
+    return layer_bucketing.available_memory_mb()
+
+
+def _resolve_bucket_workers(bucket_count: int) -> int:
+    """Resolve how many buckets to compute concurrently.
+
+    `GOLD_MARKET_BUCKET_WORKERS` sets the requested worker count (default 1, i.e. sequential).
+    The result is capped by CPU count and by available memory divided by
+    `GOLD_MARKET_BUCKET_WORKER_MEMORY_MB`, the expected peak footprint of one bucket worker.
+    """
+
+    if bucket_count <= 0:
+        return 1
+    raw = str(os.environ.get("GOLD_MARKET_BUCKET_WORKERS") or "").strip()
+    try:
+        requested = int(raw) if raw else _DEFAULT_BUCKET_WORKERS
+    except ValueError:
+        requested = _DEFAULT_BUCKET_WORKERS
+    workers = max(1, min(requested, _MAX_BUCKET_WORKERS, bucket_count, os.cpu_count() or 1))
+    if workers <= 1:
+        return 1
+
+    raw_memory = str(os.environ.get("GOLD_MARKET_BUCKET_WORKER_MEMORY_MB") or "").strip()
+    try:
+        per_worker_mb = float(raw_memory) if raw_memory else float(_DEFAULT_BUCKET_WORKER_MEMORY_MB)
+    except ValueError:
+        per_worker_mb = float(_DEFAULT_BUCKET_WORKER_MEMORY_MB)
+    available_mb = _available_memory_mb()
+    if available_mb is not None and per_worker_mb > 0:
+        workers = max(1, min(workers, int(available_mb // per_worker_mb)))
+    return workers
+
+
+def _bucket_stage_executor(workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _bucket_is_unchanged(
+    *,
+    prior: dict[str, Any],
+    silver_commit: Optional[float],
+    gold_commit: Optional[float],
+    postgres_sync_current: bool,
+) -> bool:
+    return (
+        silver_commit is not None
+        and prior.get("silver_last_commit") is not None
+        and prior.get("silver_last_commit") >= silver_commit
+        and gold_commit is not None
+        and postgres_sync_current
+    )
+
+
 def _coerce_datetime(series: pd.Series) -> pd.Series:
     """Parse a series to datetimes and normalize timezone-aware values to naive."""
 
@@ -228,8 +289,14 @@ def _snake_case_columns(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
+_PERCENTILE_RANK_ROW_BLOCK = 4096
+
+
 def _percentile_rank_last(window: np.ndarray) -> float:
-    """Return percentile rank of the window's last value within valid samples."""
+    """Return percentile rank of the window's last value within valid samples.
+
+    Scalar reference for `_rolling_percentile_rank`; kept for equivalence tests.
+    """
 
     if window.size == 0:
         return np.nan
@@ -242,6 +309,76 @@ def _percentile_rank_last(window: np.ndarray) -> float:
     return float((valid <= last).sum() / valid.size)
 
 
+def _group_start_positions(group_codes: np.ndarray) -> np.ndarray:
+    """Position of the first row of each row's contiguous group."""
+
+    positions = np.arange(group_codes.size)
+    if group_codes.size == 0:
+        return positions
+    boundaries = np.concatenate([[True], group_codes[1:] != group_codes[:-1]])
+    return np.maximum.accumulate(np.where(boundaries, positions, 0))
+
+
+def _rolling_percentile_rank(
+    series: pd.Series,
+    window: int,
+    group_codes: Optional[np.ndarray] = None,
+) -> pd.Series:
+    """Vectorized `rolling(window, min_periods=1).apply(_percentile_rank_last, raw=True)`.
+
+    Each row's trailing window is compared against its last value with a strided view, so
+    the rank is computed in numpy instead of one Python call per row. Rows are processed in
+    blocks to bound the (rows x window) comparison matrix. With `group_codes`, windows stop
+    at the start of each row's group, matching a per-group rolling apply.
+    """
+
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    # pandas rolling treats +/-inf as missing before applying the window function.
+    values = np.where(np.isinf(values), np.nan, values)
+    result = np.full(values.size, np.nan, dtype="float64")
+    if values.size == 0:
+        return pd.Series(result, index=series.index)
+
+    positions = np.arange(values.size)
+    if group_codes is None:
+        group_start = np.zeros(values.size, dtype=positions.dtype)
+    else:
+        group_start = _group_start_positions(np.asarray(group_codes))
+
+    # Trailing count of valid samples per window, from a running total of non-NaN flags.
+    valid_cumsum = np.concatenate([[0], np.cumsum(~np.isnan(values))])
+    upper = positions + 1
+    valid_counts = valid_cumsum[upper] - valid_cumsum[np.maximum(upper - window, group_start)]
+
+    padded = np.concatenate([np.full(window - 1, np.nan), values])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+    window_offsets = np.arange(window)
+    for start in range(0, values.size, _PERCENTILE_RANK_ROW_BLOCK):
+        stop = min(start + _PERCENTILE_RANK_ROW_BLOCK, values.size)
+        last = values[start:stop]
+        counts = valid_counts[start:stop]
+        # Window slots that precede the row's group start belong to another symbol.
+        history = positions[start:stop] - group_start[start:stop]
+        in_group = window_offsets[None, :] >= (window - 1 - history)[:, None]
+        # NaN compares False, so only valid samples count toward the numerator.
+        at_or_below = np.count_nonzero((windows[start:stop] <= last[:, None]) & in_group, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ranks = at_or_below / counts
+        result[start:stop] = np.where(np.isnan(last) | (counts == 0), np.nan, ranks)
+    return pd.Series(result, index=series.index)
+
+
+def _grouped_rolling(series: pd.Series, group_codes: np.ndarray, window: int, *, min_periods: int):
+    return series.groupby(group_codes, sort=False).rolling(window=window, min_periods=min_periods)
+
+
+def _grouped_pct_change(series: pd.Series, group_codes: np.ndarray, periods: int) -> pd.Series:
+    """Per-group `Series.pct_change(periods)`, including its forward-fill of interior gaps."""
+
+    filled = series.groupby(group_codes, sort=False).ffill()
+    return filled / filled.groupby(group_codes, sort=False).shift(periods) - 1
+
+
 def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     """Compute gold-layer technical features from OHLCV market rows.
 
@@ -251,6 +388,9 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     Output includes return, volatility, drawdown, ATR/gap, moving-average trend,
     range/compression, volume context, market-structure, and candlestick/Ichimoku
     features.
+
+    Input may hold one symbol or a whole bucket. Every window, shift, and diff is
+    keyed by symbol, so each symbol's rows match what a single-symbol call returns.
     """
 
     # Normalize schema once so the rest of the function can use fixed names.
@@ -260,9 +400,6 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     missing = required.difference(out.columns)
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
-    symbols = out["symbol"].astype("string").str.strip().str.upper().replace("", pd.NA).dropna().unique().tolist()
-    if len(symbols) > 1:
-        raise ValueError(f"compute_features expects single-symbol input; received symbols={sorted(symbols)}")
 
     # Coerce input types early. Invalid values become NaN and are handled later.
     out["date"] = _coerce_datetime(out["date"])
@@ -274,6 +411,7 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     out = out.dropna(subset=["date"]).sort_values(["symbol", "date"]).reset_index(drop=True)
     out = out.drop_duplicates(subset=["symbol", "date"], keep="last").reset_index(drop=True)
 
+    codes = _symbol_group_codes(out["symbol"])
     close = out["close"]
     high = out["high"]
     low = out["low"]
@@ -281,20 +419,20 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
 
     # Returns over multiple lookback windows.
     for window in (1, 5, 20, 60):
-        out[f"return_{window}d"] = close.pct_change(periods=window)
+        out[f"return_{window}d"] = _grouped_pct_change(close, codes, window)
 
     daily_return = out["return_1d"]
 
     # Volatility measured as rolling standard deviation of daily return.
     for window in (20, 60):
-        out[f"vol_{window}d"] = daily_return.rolling(window=window, min_periods=window).std()
+        out[f"vol_{window}d"] = _grouped_rolling(daily_return, codes, window, min_periods=window).std().droplevel(0)
 
     # Drawdown relative to rolling 1-year high.
-    out["rolling_max_252d"] = close.rolling(window=252, min_periods=1).max()
+    out["rolling_max_252d"] = _grouped_rolling(close, codes, 252, min_periods=1).max().droplevel(0)
     out["drawdown_1y"] = _safe_div(close, out["rolling_max_252d"]) - 1.0
 
     # ATR (14-day simple average true range) and normalized opening gap.
-    prev_close = close.shift(1)
+    prev_close = close.groupby(codes, sort=False).shift(1)
     true_range_components = pd.concat(
         [
             (high - low),
@@ -304,25 +442,27 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
         axis=1,
     )
     out["true_range"] = true_range_components.max(axis=1)
-    out["atr_14d"] = out["true_range"].rolling(window=14, min_periods=14).mean()
+    out["atr_14d"] = _grouped_rolling(out["true_range"], codes, 14, min_periods=14).mean().droplevel(0)
     out["gap_atr"] = _safe_div((out["open"] - prev_close).abs(), out["atr_14d"])
 
     # Moving-average trend state and crossover event flags.
     for window in (20, 50, 200):
-        out[f"sma_{window}d"] = close.rolling(window=window, min_periods=window).mean()
+        out[f"sma_{window}d"] = _grouped_rolling(close, codes, window, min_periods=window).mean().droplevel(0)
 
     out["sma_20_gt_sma_50"] = (out["sma_20d"] > out["sma_50d"]).astype(int)
     out["sma_50_gt_sma_200"] = (out["sma_50d"] > out["sma_200d"]).astype(int)
     out["trend_50_200"] = _safe_div(out["sma_50d"], out["sma_200d"]) - 1.0
     out["above_sma_50"] = (close > out["sma_50d"]).astype(int)
 
-    out["sma_20_crosses_above_sma_50"] = (out["sma_20_gt_sma_50"].diff() == 1).astype(int)
-    out["sma_20_crosses_below_sma_50"] = (out["sma_20_gt_sma_50"].diff() == -1).astype(int)
-    out["sma_50_crosses_above_sma_200"] = (out["sma_50_gt_sma_200"].diff() == 1).astype(int)
-    out["sma_50_crosses_below_sma_200"] = (out["sma_50_gt_sma_200"].diff() == -1).astype(int)
+    sma_20_50_change = out["sma_20_gt_sma_50"].groupby(codes, sort=False).diff()
+    sma_50_200_change = out["sma_50_gt_sma_200"].groupby(codes, sort=False).diff()
+    out["sma_20_crosses_above_sma_50"] = (sma_20_50_change == 1).astype(int)
+    out["sma_20_crosses_below_sma_50"] = (sma_20_50_change == -1).astype(int)
+    out["sma_50_crosses_above_sma_200"] = (sma_50_200_change == 1).astype(int)
+    out["sma_50_crosses_below_sma_200"] = (sma_50_200_change == -1).astype(int)
 
     # Compression context from Bollinger-band width and intraday range.
-    close_std_20 = close.rolling(window=20, min_periods=20).std()
+    close_std_20 = _grouped_rolling(close, codes, 20, min_periods=20).std().droplevel(0)
     bb_mid_20 = out["sma_20d"]
     bb_upper_20 = bb_mid_20 + 2 * close_std_20
     bb_lower_20 = bb_mid_20 - 2 * close_std_20
@@ -330,16 +470,16 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     out["range_close"] = _safe_div((high - low), close)
 
     # Additional range-compression score as 1-year percentile rank.
-    high_20 = high.rolling(window=20, min_periods=20).max()
-    low_20 = low.rolling(window=20, min_periods=20).min()
+    high_20 = _grouped_rolling(high, codes, 20, min_periods=20).max().droplevel(0)
+    low_20 = _grouped_rolling(low, codes, 20, min_periods=20).min().droplevel(0)
     out["range_20"] = _safe_div((high_20 - low_20), close)
-    out["compression_score"] = out["range_20"].rolling(window=252, min_periods=1).apply(_percentile_rank_last, raw=True)
+    out["compression_score"] = _rolling_percentile_rank(out["range_20"], 252, codes)
 
     # Volume context from short-window z-score and long-window percentile rank.
-    vol_mean_20 = volume.rolling(window=20, min_periods=20).mean()
-    vol_std_20 = volume.rolling(window=20, min_periods=20).std()
+    vol_mean_20 = _grouped_rolling(volume, codes, 20, min_periods=20).mean().droplevel(0)
+    vol_std_20 = _grouped_rolling(volume, codes, 20, min_periods=20).std().droplevel(0)
     out["volume_z_20d"] = _safe_div((volume - vol_mean_20), vol_std_20)
-    out["volume_pct_rank_252d"] = volume.rolling(window=252, min_periods=1).apply(_percentile_rank_last, raw=True)
+    out["volume_pct_rank_252d"] = _rolling_percentile_rank(volume, 252, codes)
 
     # Market structure features use confirmed pivots only to avoid look-ahead.
     out = add_market_structure_features(out)
@@ -776,6 +916,140 @@ def _persist_gold_market_bucket_checkpoint(
     return checkpoint.symbol_to_bucket, checkpoint.index_path
 
 
+def _latest_market_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return each symbol's most recent dated row from a projected gold market frame."""
+
+    dated = frame[frame["date"].notna()]
+    return dated.sort_values(["symbol", "date"], kind="stable").drop_duplicates(subset=["symbol"], keep="last")
+
+
+def _write_gold_market_latest_snapshot(
+    *,
+    gold_container: str,
+    bucket: str,
+    latest_frame: Optional[pd.DataFrame],
+) -> int:
+    """Replace one bucket's rows in the latest-row-per-symbol snapshot table.
+
+    The snapshot keeps the full gold market contract plus a `bucket` column, so each bucket
+    write only overwrites its own slice and readers such as the screener scan O(symbols) rows.
+    """
+
+    from core import delta_core
+    from core.pipeline import DataPaths
+
+    clean_bucket = str(bucket or "").strip().upper()
+    snapshot = (
+        latest_frame
+        if latest_frame is not None and not latest_frame.empty
+        else project_gold_output_frame(None, domain="market")
+    )
+    snapshot = snapshot.reset_index(drop=True).assign(bucket=pd.Series(clean_bucket, index=snapshot.index, dtype="string"))
+    delta_core.store_delta(
+        snapshot,
+        gold_container,
+        DataPaths.get_gold_market_latest_path(),
+        mode="overwrite",
+        predicate=f"bucket = '{clean_bucket}'",
+    )
+    return int(len(snapshot))
+
+
+def _load_gold_market_snapshot_buckets(*, gold_container: str) -> set[str]:
+    """Return the buckets that currently have rows in the latest-row snapshot table."""
+
+    from core import delta_core
+    from core.pipeline import DataPaths
+
+    try:
+        snapshot = delta_core.load_delta(gold_container, DataPaths.get_gold_market_latest_path(), columns=["bucket"])
+    except Exception:
+        return set()
+    if snapshot is None or snapshot.empty or "bucket" not in snapshot.columns:
+        return set()
+    return {str(bucket).strip().upper() for bucket in snapshot["bucket"].dropna().unique()}
+
+
+def _backfill_gold_market_latest_snapshot(*, gold_container: str, bucket: str) -> int:
+    """Seed one bucket's snapshot slice from its existing gold table.
+
+    Buckets skipped as unchanged are never restaged, so without this their symbols would be
+    missing from the snapshot until the bucket next changes.
+    """
+
+    from core import delta_core
+    from core.pipeline import DataPaths
+
+    existing = delta_core.load_delta(gold_container, DataPaths.get_gold_market_bucket_path(bucket))
+    if existing is None or existing.empty:
+        return 0
+    latest_frame = _latest_market_rows(project_gold_output_frame(existing, domain="market"))
+    return _write_gold_market_latest_snapshot(
+        gold_container=gold_container,
+        bucket=bucket,
+        latest_frame=latest_frame.reset_index(drop=True),
+    )
+
+
+def _compute_market_feature_batch(
+    batch: list[tuple[Any, pd.DataFrame]],
+    *,
+    bucket: str,
+) -> Iterator[tuple[Any, Optional[pd.DataFrame], Optional[Exception]]]:
+    if len(batch) > 1:
+        try:
+            df_features = compute_features(pd.concat([group for _, group in batch], ignore_index=True))
+        except Exception as exc:
+            from core import core as mdc
+
+            mdc.write_warning(
+                f"Gold market alpha26 batch compute failed for bucket={bucket} symbols={len(batch)}; "
+                f"retrying per symbol: {exc}"
+            )
+        else:
+            features_by_symbol = dict(tuple(df_features.groupby("symbol", sort=False)))
+            for symbol, _ in batch:
+                features = features_by_symbol.get(symbol)
+                if features is None:
+                    yield symbol, df_features.iloc[0:0], None
+                else:
+                    yield symbol, features.reset_index(drop=True), None
+            return
+
+    for symbol, group in batch:
+        try:
+            df_features = compute_features(group)
+        except Exception as exc:
+            yield symbol, None, exc
+        else:
+            yield symbol, df_features, None
+
+
+def _iter_market_symbol_features(
+    df_silver_bucket: pd.DataFrame,
+    *,
+    bucket: str,
+) -> Iterator[tuple[Any, Optional[pd.DataFrame], Optional[Exception]]]:
+    """Yield `(symbol, features, error)` for each silver symbol in bucket order.
+
+    `compute_features` runs once per batch of symbols holding up to `_MARKET_CHUNK_ROW_LIMIT`
+    input rows instead of once per symbol. When a batch fails, its symbols are recomputed one
+    at a time so only the offending symbol is reported as failed.
+    """
+
+    batch: list[tuple[Any, pd.DataFrame]] = []
+    batch_rows = 0
+    for symbol, group in df_silver_bucket.groupby("symbol"):
+        batch.append((symbol, group))
+        batch_rows += int(len(group))
+        if batch_rows >= _MARKET_CHUNK_ROW_LIMIT:
+            yield from _compute_market_feature_batch(batch, bucket=bucket)
+            batch = []
+            batch_rows = 0
+    if batch:
+        yield from _compute_market_feature_batch(batch, bucket=bucket)
+
+
 def _stage_market_bucket_outputs(
     *,
     bucket: str,
@@ -826,19 +1100,22 @@ def _stage_market_bucket_outputs(
     chunk_number = 0
     chunk_write_results: list[BucketChunkWriteResult] = []
     chunk_summaries: list[dict[str, Any]] = []
+    latest_frames: list[pd.DataFrame] = []
     staging_root = _gold_market_staging_root(run_id=run_id, bucket=bucket)
     staging_delta_path = _gold_market_staging_delta_path(run_id=run_id, bucket=bucket)
     staging_chunk_prefix = _gold_market_staging_chunk_prefix(run_id=run_id, bucket=bucket)
 
     try:
-        for processed_symbols, (symbol, group) in enumerate(df_silver_bucket.groupby("symbol"), start=1):
+        symbol_features = _iter_market_symbol_features(df_silver_bucket, bucket=bucket)
+        for processed_symbols, (symbol, computed_features, compute_error) in enumerate(symbol_features, start=1):
             ticker = str(symbol or "").strip().upper()
             if not ticker:
                 continue
             try:
-                df_features = compute_features(group)
+                if compute_error is not None:
+                    raise compute_error
                 df_features, _ = apply_backfill_start_cutoff(
-                    df_features,
+                    computed_features,
                     date_col="date",
                     backfill_start=backfill_start,
                     context=f"gold market alpha26 {ticker}",
@@ -879,6 +1156,7 @@ def _stage_market_bucket_outputs(
                     continue
 
                 chunk_frames.append(df_projected)
+                latest_frames.append(_latest_market_rows(df_projected))
                 chunk_row_count += int(len(df_projected))
                 bucket_output_rows += int(len(df_projected))
                 bucket_symbol_to_bucket[ticker] = bucket
@@ -1031,6 +1309,7 @@ def _stage_market_bucket_outputs(
         bucket_symbol_to_bucket=bucket_symbol_to_bucket,
         critical_compute_failure_symbol=critical_compute_failure_symbol,
         chunk_summaries=chunk_summaries,
+        latest_frame=pd.concat(latest_frames, ignore_index=True) if latest_frames else None,
     )
 
 
@@ -1152,6 +1431,8 @@ def _run_alpha26_market_gold(
     - Iterate alphabetical buckets from `layer_bucketing.ALPHABET_BUCKETS`.
     - Skip unchanged buckets via commit watermarks unless force-rebuild is enabled.
     - Compute features for each symbol, then write one consolidated Delta table per bucket.
+    - With `GOLD_MARKET_BUCKET_WORKERS` > 1, changed buckets are computed and staged in a
+      process pool; promotion, Postgres sync and watermark checkpoints still run in bucket order.
 
     Returns:
     - processed bucket count
@@ -1184,489 +1465,572 @@ def _run_alpha26_market_gold(
     watermarks_dirty = False
     bucket_results: list[BucketExecutionResult] = []
     index_path: Optional[str] = None
+    # Buckets present in the latest-row snapshot; read lazily, only once a bucket is skipped.
+    snapshot_buckets: Optional[set[str]] = None
 
-    # Each bucket maps to one silver source table and one gold destination table.
+    # Resolve commits up front so buckets that need compute can be staged concurrently. Staging
+    # only touches run-scoped paths; promotion, sync and watermarks stay sequential in bucket order.
+    bucket_commits: dict[str, tuple[Optional[float], Optional[float]]] = {}
+    stage_candidates: list[str] = []
     for bucket in layer_bucketing.ALPHABET_BUCKETS:
-        silver_path = DataPaths.get_silver_market_bucket_path(bucket)
-        gold_path = DataPaths.get_gold_market_bucket_path(bucket)
-        watermark_key = f"bucket::{bucket}"
-        silver_commit = delta_core.get_delta_last_commit(silver_container, silver_path)
-        gold_commit = delta_core.get_delta_last_commit(gold_container, gold_path)
-        prior = watermarks.get(watermark_key, {})
-        postgres_sync_current = (
-            bucket_sync_is_current(sync_state, bucket=bucket, source_commit=silver_commit) if postgres_dsn else True
+        silver_commit = delta_core.get_delta_last_commit(
+            silver_container, DataPaths.get_silver_market_bucket_path(bucket)
         )
-        _log_bucket_progress(
-            bucket=bucket,
-            stage="bucket_start",
-            silver_path=silver_path,
-            gold_path=gold_path,
-            silver_commit_present=silver_commit is not None,
-            gold_commit_present=gold_commit is not None,
-        )
-
-        # Skip stable buckets to reduce compute/write overhead on no-change runs.
-        if (
-            silver_commit is not None
-            and prior.get("silver_last_commit") is not None
-            and prior.get("silver_last_commit") >= silver_commit
-            and gold_commit is not None
-            and postgres_sync_current
+        gold_commit = delta_core.get_delta_last_commit(gold_container, DataPaths.get_gold_market_bucket_path(bucket))
+        bucket_commits[bucket] = (silver_commit, gold_commit)
+        if silver_commit is not None and not _bucket_is_unchanged(
+            prior=watermarks.get(f"bucket::{bucket}", {}),
+            silver_commit=silver_commit,
+            gold_commit=gold_commit,
+            postgres_sync_current=(
+                bucket_sync_is_current(sync_state, bucket=bucket, source_commit=silver_commit)
+                if postgres_dsn
+                else True
+            ),
         ):
-            skipped_unchanged += 1
-            bucket_results.append(
-                BucketExecutionResult(
+            stage_candidates.append(bucket)
+
+    bucket_workers = _resolve_bucket_workers(len(stage_candidates))
+    stage_executor: Optional[Executor] = None
+    staged_futures: dict[str, Future] = {}
+    try:
+        if bucket_workers > 1:
+            mdc.write_line(
+                f"gold_market_bucket_parallelism workers={bucket_workers} buckets={len(stage_candidates)}"
+            )
+            stage_executor = _bucket_stage_executor(bucket_workers)
+            for bucket in stage_candidates:
+                staged_futures[bucket] = stage_executor.submit(
+                    _stage_market_bucket_outputs,
                     bucket=bucket,
-                    status="skipped_unchanged",
-                    symbols_written=0,
-                    watermark_updated=False,
+                    silver_container=silver_container,
+                    gold_container=gold_container,
+                    silver_path=DataPaths.get_silver_market_bucket_path(bucket),
+                    backfill_start=backfill_start,
+                    run_id=run_id,
                 )
-            )
-            _log_bucket_progress(
-                bucket=bucket,
-                stage="skipped_unchanged",
-                silver_commit_present=True,
-                gold_commit_present=True,
-            )
-            continue
 
-        prior_bucket_symbols = sorted(
-            symbol for symbol, current_bucket in symbol_to_bucket.items() if current_bucket == bucket
-        )
-        scope_symbols = sorted(set(prior_bucket_symbols))
-        stage_result: Optional[BucketStageResult] = None
-        bucket_input_symbols = 0
-        bucket_symbol_failures = 0
-        bucket_output_rows = 0
-        bucket_symbol_to_bucket: dict[str, str] = {}
-        write_rows = 0
-        write_columns = 0
-        write_memory_mb = 0.0
-
-        # Missing source still writes an empty table to keep state deterministic.
-        if silver_commit is None:
-            skipped_missing_source += 1
+        # Each bucket maps to one silver source table and one gold destination table.
+        for bucket in layer_bucketing.ALPHABET_BUCKETS:
+            silver_path = DataPaths.get_silver_market_bucket_path(bucket)
+            gold_path = DataPaths.get_gold_market_bucket_path(bucket)
+            watermark_key = f"bucket::{bucket}"
+            silver_commit, gold_commit = bucket_commits[bucket]
+            prior = watermarks.get(watermark_key, {})
+            postgres_sync_current = (
+                bucket_sync_is_current(sync_state, bucket=bucket, source_commit=silver_commit) if postgres_dsn else True
+            )
             _log_bucket_progress(
                 bucket=bucket,
-                stage="missing_source",
+                stage="bucket_start",
                 silver_path=silver_path,
                 gold_path=gold_path,
+                silver_commit_present=silver_commit is not None,
+                gold_commit_present=gold_commit is not None,
             )
-            final_frame = project_gold_output_frame(pd.DataFrame(columns=["date", "symbol"]), domain="market")
-            stage_result = BucketStageResult(
-                final_frame=final_frame,
-                staging_used=False,
-                staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
-                staging_delta_path=_gold_market_staging_delta_path(run_id=run_id, bucket=bucket),
-                staging_chunk_prefix=_gold_market_staging_chunk_prefix(run_id=run_id, bucket=bucket),
-                final_rows=int(len(final_frame)),
-                final_columns=int(len(final_frame.columns)),
-                final_memory_mb=_frame_memory_mb(final_frame),
-                bucket_input_symbols=0,
-                bucket_output_rows=0,
-                bucket_symbol_failures=0,
-                bucket_symbol_to_bucket={},
-                critical_compute_failure_symbol=None,
-                chunk_summaries=[],
+
+            # Skip stable buckets to reduce compute/write overhead on no-change runs.
+            if _bucket_is_unchanged(
+                prior=prior,
+                silver_commit=silver_commit,
+                gold_commit=gold_commit,
+                postgres_sync_current=postgres_sync_current,
+            ):
+                skipped_unchanged += 1
+                bucket_results.append(
+                    BucketExecutionResult(
+                        bucket=bucket,
+                        status="skipped_unchanged",
+                        symbols_written=0,
+                        watermark_updated=False,
+                    )
+                )
+                _log_bucket_progress(
+                    bucket=bucket,
+                    stage="skipped_unchanged",
+                    silver_commit_present=True,
+                    gold_commit_present=True,
+                )
+                if snapshot_buckets is None:
+                    snapshot_buckets = _load_gold_market_snapshot_buckets(gold_container=gold_container)
+                if bucket not in snapshot_buckets:
+                    try:
+                        backfilled_rows = _backfill_gold_market_latest_snapshot(
+                            gold_container=gold_container,
+                            bucket=bucket,
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market latest snapshot backfill failed bucket={bucket}: {exc}")
+                    else:
+                        mdc.write_line(f"gold_market_latest_snapshot_backfill bucket={bucket} rows={backfilled_rows}")
+                continue
+
+            prior_bucket_symbols = sorted(
+                symbol for symbol, current_bucket in symbol_to_bucket.items() if current_bucket == bucket
             )
-        else:
-            try:
-                stage_result = _stage_market_bucket_outputs(
+            scope_symbols = sorted(set(prior_bucket_symbols))
+            stage_result: Optional[BucketStageResult] = None
+            bucket_input_symbols = 0
+            bucket_symbol_failures = 0
+            bucket_output_rows = 0
+            bucket_symbol_to_bucket: dict[str, str] = {}
+            write_rows = 0
+            write_columns = 0
+            write_memory_mb = 0.0
+
+            # Missing source still writes an empty table to keep state deterministic.
+            if silver_commit is None:
+                skipped_missing_source += 1
+                _log_bucket_progress(
                     bucket=bucket,
-                    silver_container=silver_container,
-                    gold_container=gold_container,
+                    stage="missing_source",
                     silver_path=silver_path,
-                    backfill_start=backfill_start,
-                    run_id=run_id,
+                    gold_path=gold_path,
+                )
+                final_frame = project_gold_output_frame(pd.DataFrame(columns=["date", "symbol"]), domain="market")
+                stage_result = BucketStageResult(
+                    final_frame=final_frame,
+                    staging_used=False,
+                    staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                    staging_delta_path=_gold_market_staging_delta_path(run_id=run_id, bucket=bucket),
+                    staging_chunk_prefix=_gold_market_staging_chunk_prefix(run_id=run_id, bucket=bucket),
+                    final_rows=int(len(final_frame)),
+                    final_columns=int(len(final_frame.columns)),
+                    final_memory_mb=_frame_memory_mb(final_frame),
+                    bucket_input_symbols=0,
+                    bucket_output_rows=0,
+                    bucket_symbol_failures=0,
+                    bucket_symbol_to_bucket={},
+                    critical_compute_failure_symbol=None,
+                    chunk_summaries=[],
                 )
-            except RuntimeError as exc:
-                message = str(exc)
-                if message.startswith("contract_validation::"):
-                    _, raw_symbol_count, detail = message.split("::", 2)
-                    bucket_input_symbols = int(raw_symbol_count or 0)
+            else:
+                try:
+                    staged_future = staged_futures.pop(bucket, None)
+                    if staged_future is not None:
+                        stage_result = staged_future.result()
+                    else:
+                        stage_result = _stage_market_bucket_outputs(
+                            bucket=bucket,
+                            silver_container=silver_container,
+                            gold_container=gold_container,
+                            silver_path=silver_path,
+                            backfill_start=backfill_start,
+                            run_id=run_id,
+                        )
+                except RuntimeError as exc:
+                    message = str(exc)
+                    if message.startswith("contract_validation::"):
+                        _, raw_symbol_count, detail = message.split("::", 2)
+                        bucket_input_symbols = int(raw_symbol_count or 0)
+                        failed += 1
+                        failed_buckets += 1
+                        mdc.write_error(detail)
+                        mdc.write_line(
+                            f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
+                            f"reason=contract_validation symbols_in={bucket_input_symbols} symbols_out=0 "
+                            f"failures={max(bucket_input_symbols, 1)}"
+                        )
+                        mdc.write_line(
+                            f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                            "status=blocked reason=contract_validation"
+                        )
+                        bucket_results.append(
+                            BucketExecutionResult(
+                                bucket=bucket,
+                                status="failed_contract",
+                                symbols_written=0,
+                                watermark_updated=False,
+                            )
+                        )
+                        continue
                     failed += 1
                     failed_buckets += 1
-                    mdc.write_error(detail)
+                    mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
                     mdc.write_line(
                         f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
-                        f"reason=contract_validation symbols_in={bucket_input_symbols} symbols_out=0 "
-                        f"failures={max(bucket_input_symbols, 1)}"
+                        "reason=write_failure symbols_in=0 symbols_out=0 failures=1"
                     )
                     mdc.write_line(
                         f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                        "status=blocked reason=contract_validation"
+                        "status=blocked reason=write_failure"
                     )
                     bucket_results.append(
                         BucketExecutionResult(
                             bucket=bucket,
-                            status="failed_contract",
+                            status="failed_write",
                             symbols_written=0,
                             watermark_updated=False,
                         )
                     )
+                    try:
+                        _cleanup_staged_market_bucket(
+                            gold_container=gold_container,
+                            staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                        )
+                    except Exception as cleanup_exc:
+                        mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {cleanup_exc}")
                     continue
-                failed += 1
-                failed_buckets += 1
-                mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
-                mdc.write_line(
-                    f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
-                    "reason=write_failure symbols_in=0 symbols_out=0 failures=1"
-                )
-                mdc.write_line(
-                    f"watermark_update_status layer=gold domain=market bucket={bucket} status=blocked reason=write_failure"
-                )
-                bucket_results.append(
-                    BucketExecutionResult(
-                        bucket=bucket,
-                        status="failed_write",
-                        symbols_written=0,
-                        watermark_updated=False,
+                except Exception as exc:
+                    failed += 1
+                    failed_buckets += 1
+                    mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
+                    mdc.write_line(
+                        f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
+                        "reason=write_failure symbols_in=0 symbols_out=0 failures=1"
                     )
-                )
-                try:
-                    _cleanup_staged_market_bucket(
-                        gold_container=gold_container,
-                        staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                    mdc.write_line(
+                        f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                        "status=blocked reason=write_failure"
                     )
-                except Exception as cleanup_exc:
-                    mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {cleanup_exc}")
-                continue
-            except Exception as exc:
-                failed += 1
-                failed_buckets += 1
-                mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
+                    bucket_results.append(
+                        BucketExecutionResult(
+                            bucket=bucket,
+                            status="failed_write",
+                            symbols_written=0,
+                            watermark_updated=False,
+                        )
+                    )
+                    try:
+                        _cleanup_staged_market_bucket(
+                            gold_container=gold_container,
+                            staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                        )
+                    except Exception as cleanup_exc:
+                        mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {cleanup_exc}")
+                    continue
+
+            bucket_input_symbols = stage_result.bucket_input_symbols
+            bucket_symbol_failures = stage_result.bucket_symbol_failures
+            bucket_output_rows = stage_result.bucket_output_rows
+            bucket_symbol_to_bucket = stage_result.bucket_symbol_to_bucket
+            scope_symbols = sorted(set(scope_symbols).union(bucket_symbol_to_bucket.keys()))
+            failed += bucket_symbol_failures
+            failed_symbols += bucket_symbol_failures
+
+            critical_compute_failure_symbol = stage_result.critical_compute_failure_symbol
+            if critical_compute_failure_symbol is not None:
                 mdc.write_line(
                     f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
-                    "reason=write_failure symbols_in=0 symbols_out=0 failures=1"
+                    f"reason=compute_failure symbols_in={bucket_input_symbols} symbols_out=0 "
+                    f"failures={bucket_symbol_failures} critical_symbol=true symbol={critical_compute_failure_symbol}"
                 )
                 mdc.write_line(
-                    f"watermark_update_status layer=gold domain=market bucket={bucket} status=blocked reason=write_failure"
+                    f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                    "status=blocked reason=compute_failure critical_symbol=true "
+                    f"symbol={critical_compute_failure_symbol}"
                 )
                 bucket_results.append(
                     BucketExecutionResult(
                         bucket=bucket,
-                        status="failed_write",
+                        status="failed_compute",
                         symbols_written=0,
                         watermark_updated=False,
                     )
                 )
-                try:
-                    _cleanup_staged_market_bucket(
-                        gold_container=gold_container,
-                        staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
-                    )
-                except Exception as cleanup_exc:
-                    mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {cleanup_exc}")
+                if silver_commit is not None:
+                    try:
+                        _cleanup_staged_market_bucket(
+                            gold_container=gold_container,
+                            staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {exc}")
                 continue
 
-        bucket_input_symbols = stage_result.bucket_input_symbols
-        bucket_symbol_failures = stage_result.bucket_symbol_failures
-        bucket_output_rows = stage_result.bucket_output_rows
-        bucket_symbol_to_bucket = stage_result.bucket_symbol_to_bucket
-        scope_symbols = sorted(set(scope_symbols).union(bucket_symbol_to_bucket.keys()))
-        failed += bucket_symbol_failures
-        failed_symbols += bucket_symbol_failures
-
-        critical_compute_failure_symbol = stage_result.critical_compute_failure_symbol
-        if critical_compute_failure_symbol is not None:
-            mdc.write_line(
-                f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
-                f"reason=compute_failure symbols_in={bucket_input_symbols} symbols_out=0 "
-                f"failures={bucket_symbol_failures} critical_symbol=true symbol={critical_compute_failure_symbol}"
-            )
-            mdc.write_line(
-                f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                f"status=blocked reason=compute_failure critical_symbol=true symbol={critical_compute_failure_symbol}"
-            )
-            bucket_results.append(
-                BucketExecutionResult(
-                    bucket=bucket,
-                    status="failed_compute",
-                    symbols_written=0,
-                    watermark_updated=False,
-                )
-            )
-            if silver_commit is not None:
-                try:
-                    _cleanup_staged_market_bucket(
-                        gold_container=gold_container,
-                        staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
-                    )
-                except Exception as exc:
-                    mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {exc}")
-            continue
-
-        # Persist bucket output and checkpoint after successful write/sync.
-        try:
-            if stage_result.staging_used:
-                write_rows = stage_result.final_rows
-                write_columns = stage_result.final_columns
-                write_memory_mb = stage_result.final_memory_mb
-                _log_bucket_progress(
-                    bucket=bucket,
-                    stage="write_ready",
-                    rows=write_rows,
-                    columns=write_columns,
-                    memory_mb=write_memory_mb,
-                    output_symbols=len(bucket_symbol_to_bucket),
-                )
-                mdc.write_line(
-                    "delta_write_decision layer=gold domain=market "
-                    f"bucket={bucket} action=write reason=chunked_staged_publish path={gold_path}"
-                )
-                _promote_staged_market_bucket(
-                    gold_container=gold_container,
-                    staging_delta_path=stage_result.staging_delta_path,
-                    gold_path=gold_path,
-                )
-                if backfill_start is not None:
-                    delta_core.vacuum_delta_table(
-                        gold_container,
-                        gold_path,
-                        retention_hours=0,
-                        dry_run=False,
-                        enforce_retention_duration=False,
-                        full=True,
-                    )
-                try:
-                    _write_gold_market_bucket_artifact_from_summaries(
-                        gold_container=gold_container,
-                        bucket=bucket,
-                        summaries=stage_result.chunk_summaries,
-                        symbol_count=len(bucket_symbol_to_bucket),
-                        job_run_id=run_id,
-                        data_path=gold_path,
-                    )
-                except Exception as exc:
-                    mdc.write_warning(f"Gold market metadata bucket artifact write failed bucket={bucket}: {exc}")
-                if postgres_dsn:
-                    sync_result = sync_gold_bucket_chunks(
-                        domain="market",
+            # Persist bucket output and checkpoint after successful write/sync.
+            try:
+                if stage_result.staging_used:
+                    write_rows = stage_result.final_rows
+                    write_columns = stage_result.final_columns
+                    write_memory_mb = stage_result.final_memory_mb
+                    _log_bucket_progress(
                         bucket=bucket,
-                        frames=lambda: _iter_staged_market_chunk_frames(
-                            gold_container=gold_container,
-                            chunk_prefix=stage_result.staging_chunk_prefix,
-                        ),
-                        scope_symbols=scope_symbols,
-                        source_commit=silver_commit,
-                        dsn=postgres_dsn,
-                    )
-                    sync_state[bucket] = sync_state_cache_entry(sync_result)
-                    mdc.write_line(
-                        "postgres_gold_sync_status "
-                        f"domain=market bucket={bucket} status={sync_result.status} "
-                        f"rows_out={sync_result.row_count} symbols_out={sync_result.symbol_count} "
-                        f"scope_symbols={sync_result.scope_symbol_count} source_commit={silver_commit}"
+                        stage="write_ready",
+                        rows=write_rows,
+                        columns=write_columns,
+                        memory_mb=write_memory_mb,
+                        output_symbols=len(bucket_symbol_to_bucket),
                     )
-            else:
-                write_decision = prepare_delta_write_frame(
-                    stage_result.final_frame,
-                    container=gold_container,
-                    path=gold_path,
-                )
-                write_rows = int(len(write_decision.frame))
-                write_columns = int(len(write_decision.frame.columns))
-                write_memory_mb = _frame_memory_mb(write_decision.frame)
-                _log_bucket_progress(
-                    bucket=bucket,
-                    stage="write_ready",
-                    rows=write_rows,
-                    columns=write_columns,
-                    memory_mb=write_memory_mb,
-                    output_symbols=len(bucket_symbol_to_bucket),
-                )
-                mdc.write_line(
-                    "delta_write_decision layer=gold domain=market "
-                    f"bucket={bucket} action={'skip' if write_decision.action == 'skip_empty_no_schema' else 'write'} "
-                    f"reason={write_decision.reason} path={gold_path}"
-                )
-                if write_decision.action == "skip_empty_no_schema":
-                    mdc.write_line(f"Skipping Gold market empty bucket write for {gold_path}: no existing Delta schema.")
                     mdc.write_line(
-                        f"layer_handoff_status transition=silver_to_gold status=skipped bucket={bucket} "
-                        "reason=empty_bucket_no_existing_schema symbols_in=0 symbols_out=0 failures=0"
+                        "delta_write_decision layer=gold domain=market "
+                        f"bucket={bucket} action=write reason=chunked_staged_publish path={gold_path}"
                     )
-                    mdc.write_line(
-                        f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                        "status=blocked reason=empty_bucket_no_existing_schema"
+                    _promote_staged_market_bucket(
+                        gold_container=gold_container,
+                        staging_delta_path=stage_result.staging_delta_path,
+                        gold_path=gold_path,
                     )
-                    bucket_results.append(
-                        BucketExecutionResult(
+                    try:
+                        _write_gold_market_latest_snapshot(
+                            gold_container=gold_container,
                             bucket=bucket,
-                            status="skipped_empty_no_schema",
-                            symbols_written=0,
-                            watermark_updated=False,
+                            latest_frame=stage_result.latest_frame,
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market latest snapshot write failed bucket={bucket}: {exc}")
+                    if backfill_start is not None:
+                        delta_core.vacuum_delta_table(
+                            gold_container,
+                            gold_path,
+                            retention_hours=0,
+                            dry_run=False,
+                            enforce_retention_duration=False,
+                            full=True,
+                        )
+                    try:
+                        _write_gold_market_bucket_artifact_from_summaries(
+                            gold_container=gold_container,
+                            bucket=bucket,
+                            summaries=stage_result.chunk_summaries,
+                            symbol_count=len(bucket_symbol_to_bucket),
+                            job_run_id=run_id,
+                            data_path=gold_path,
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market metadata bucket artifact write failed bucket={bucket}: {exc}")
+                    if postgres_dsn:
+                        sync_result = sync_gold_bucket_chunks(
+                            domain="market",
+                            bucket=bucket,
+                            frames=lambda: _iter_staged_market_chunk_frames(
+                                gold_container=gold_container,
+                                chunk_prefix=stage_result.staging_chunk_prefix,
+                            ),
+                            scope_symbols=scope_symbols,
+                            source_commit=silver_commit,
+                            dsn=postgres_dsn,
                         )
+                        sync_state[bucket] = sync_state_cache_entry(sync_result)
+                        mdc.write_line(
+                            "postgres_gold_sync_status "
+                            f"domain=market bucket={bucket} status={sync_result.status} "
+                            f"rows_out={sync_result.row_count} symbols_out={sync_result.symbol_count} "
+                            f"scope_symbols={sync_result.scope_symbol_count} source_commit={silver_commit}"
+                        )
+                else:
+                    write_decision = prepare_delta_write_frame(
+                        stage_result.final_frame,
+                        container=gold_container,
+                        path=gold_path,
                     )
+                    write_rows = int(len(write_decision.frame))
+                    write_columns = int(len(write_decision.frame.columns))
+                    write_memory_mb = _frame_memory_mb(write_decision.frame)
                     _log_bucket_progress(
                         bucket=bucket,
-                        stage="skipped_empty_no_schema",
+                        stage="write_ready",
                         rows=write_rows,
-                        output_symbols=0,
-                    )
-                    continue
-
-                delta_core.store_delta(write_decision.frame, gold_container, gold_path, mode="overwrite")
-                if backfill_start is not None:
-                    delta_core.vacuum_delta_table(
-                        gold_container,
-                        gold_path,
-                        retention_hours=0,
-                        dry_run=False,
-                        enforce_retention_duration=False,
-                        full=True,
-                    )
-                try:
-                    domain_artifacts.write_bucket_artifact(
-                        layer="gold",
-                        domain="market",
-                        bucket=bucket,
-                        df=write_decision.frame,
-                        date_column="date",
-                        job_name="gold-market-job",
-                        job_run_id=run_id,
-                        run_id=run_id,
-                        data_path=gold_path,
-                    )
-                except Exception as exc:
-                    mdc.write_warning(f"Gold market metadata bucket artifact write failed bucket={bucket}: {exc}")
-                if postgres_dsn:
-                    sync_result = sync_gold_bucket(
-                        domain="market",
-                        bucket=bucket,
-                        frame=write_decision.frame,
-                        scope_symbols=scope_symbols,
-                        source_commit=silver_commit,
-                        dsn=postgres_dsn,
+                        columns=write_columns,
+                        memory_mb=write_memory_mb,
+                        output_symbols=len(bucket_symbol_to_bucket),
                     )
-                    sync_state[bucket] = sync_state_cache_entry(sync_result)
                     mdc.write_line(
-                        "postgres_gold_sync_status "
-                        f"domain=market bucket={bucket} status={sync_result.status} "
-                        f"rows_out={sync_result.row_count} symbols_out={sync_result.symbol_count} "
-                        f"scope_symbols={sync_result.scope_symbol_count} source_commit={silver_commit}"
+                        "delta_write_decision layer=gold domain=market "
+                        f"bucket={bucket} "
+                        f"action={'skip' if write_decision.action == 'skip_empty_no_schema' else 'write'} "
+                        f"reason={write_decision.reason} path={gold_path}"
                     )
+                    if write_decision.action == "skip_empty_no_schema":
+                        mdc.write_line(f"Skipping Gold market empty bucket write for {gold_path}: no existing Delta schema.")
+                        mdc.write_line(
+                            f"layer_handoff_status transition=silver_to_gold status=skipped bucket={bucket} "
+                            "reason=empty_bucket_no_existing_schema symbols_in=0 symbols_out=0 failures=0"
+                        )
+                        mdc.write_line(
+                            f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                            "status=blocked reason=empty_bucket_no_existing_schema"
+                        )
+                        bucket_results.append(
+                            BucketExecutionResult(
+                                bucket=bucket,
+                                status="skipped_empty_no_schema",
+                                symbols_written=0,
+                                watermark_updated=False,
+                            )
+                        )
+                        _log_bucket_progress(
+                            bucket=bucket,
+                            stage="skipped_empty_no_schema",
+                            rows=write_rows,
+                            output_symbols=0,
+                        )
+                        continue
 
-            watermark_updated = False
-            updated_symbol_to_bucket = layer_bucketing.merge_symbol_to_bucket_map(
-                symbol_to_bucket,
-                touched_buckets={bucket},
-                touched_symbol_to_bucket=bucket_symbol_to_bucket,
-            )
-            if silver_commit is not None and bucket_symbol_failures == 0:
-                try:
-                    symbol_to_bucket, index_path = _persist_gold_market_bucket_checkpoint(
-                        bucket=bucket,
-                        watermark_key=watermark_key,
-                        silver_commit=silver_commit,
-                        watermarks=watermarks,
-                        symbol_to_bucket=symbol_to_bucket,
-                        bucket_symbol_to_bucket=bucket_symbol_to_bucket,
-                        run_id=run_id,
+                    delta_core.store_delta(write_decision.frame, gold_container, gold_path, mode="overwrite")
+                    try:
+                        _write_gold_market_latest_snapshot(
+                            gold_container=gold_container,
+                            bucket=bucket,
+                            latest_frame=stage_result.latest_frame,
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market latest snapshot write failed bucket={bucket}: {exc}")
+                    if backfill_start is not None:
+                        delta_core.vacuum_delta_table(
+                            gold_container,
+                            gold_path,
+                            retention_hours=0,
+                            dry_run=False,
+                            enforce_retention_duration=False,
+                            full=True,
+                        )
+                    try:
+                        domain_artifacts.write_bucket_artifact(
+                            layer="gold",
+                            domain="market",
+                            bucket=bucket,
+                            df=write_decision.frame,
+                            date_column="date",
+                            job_name="gold-market-job",
+                            job_run_id=run_id,
+                            run_id=run_id,
+                            data_path=gold_path,
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market metadata bucket artifact write failed bucket={bucket}: {exc}")
+                    if postgres_dsn:
+                        sync_result = sync_gold_bucket(
+                            domain="market",
+                            bucket=bucket,
+                            frame=write_decision.frame,
+                            scope_symbols=scope_symbols,
+                            source_commit=silver_commit,
+                            dsn=postgres_dsn,
+                        )
+                        sync_state[bucket] = sync_state_cache_entry(sync_result)
+                        mdc.write_line(
+                            "postgres_gold_sync_status "
+                            f"domain=market bucket={bucket} status={sync_result.status} "
+                            f"rows_out={sync_result.row_count} symbols_out={sync_result.symbol_count} "
+                            f"scope_symbols={sync_result.scope_symbol_count} source_commit={silver_commit}"
+                        )
+
+                watermark_updated = False
+                updated_symbol_to_bucket = layer_bucketing.merge_symbol_to_bucket_map(
+                    symbol_to_bucket,
+                    touched_buckets={bucket},
+                    touched_symbol_to_bucket=bucket_symbol_to_bucket,
+                )
+                if silver_commit is not None and bucket_symbol_failures == 0:
+                    try:
+                        symbol_to_bucket, index_path = _persist_gold_market_bucket_checkpoint(
+                            bucket=bucket,
+                            watermark_key=watermark_key,
+                            silver_commit=silver_commit,
+                            watermarks=watermarks,
+                            symbol_to_bucket=symbol_to_bucket,
+                            bucket_symbol_to_bucket=bucket_symbol_to_bucket,
+                            run_id=run_id,
+                        )
+                    except Exception as exc:
+                        failed += 1
+                        failed_buckets += 1
+                        mdc.write_error(f"Gold market alpha26 checkpoint failed bucket={bucket}: {exc}")
+                        mdc.write_line(
+                            f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                            "status=blocked reason=checkpoint_failure"
+                        )
+                        bucket_results.append(
+                            BucketExecutionResult(
+                                bucket=bucket,
+                                status="failed_checkpoint",
+                                symbols_written=0,
+                                watermark_updated=False,
+                            )
+                        )
+                        _log_bucket_progress(
+                            bucket=bucket,
+                            stage="checkpoint_failed",
+                            output_symbols=len(bucket_symbol_to_bucket),
+                            output_rows=bucket_output_rows,
+                            failed_symbols=bucket_symbol_failures,
+                        )
+                        continue
+                    watermarks_dirty = True
+                    watermark_updated = True
+                    mdc.write_line(
+                        f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                        "status=updated reason=success"
                     )
-                except Exception as exc:
-                    failed += 1
-                    failed_buckets += 1
-                    mdc.write_error(f"Gold market alpha26 checkpoint failed bucket={bucket}: {exc}")
+                elif silver_commit is not None:
                     mdc.write_line(
                         f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                        "status=blocked reason=checkpoint_failure"
+                        "status=blocked reason=symbol_compute_failures"
                     )
-                    bucket_results.append(
-                        BucketExecutionResult(
-                            bucket=bucket,
-                            status="failed_checkpoint",
-                            symbols_written=0,
-                            watermark_updated=False,
-                        )
+                else:
+                    symbol_to_bucket = updated_symbol_to_bucket
+                    mdc.write_line(
+                        f"watermark_update_status layer=gold domain=market bucket={bucket} "
+                        "status=blocked reason=missing_source_commit"
                     )
-                    _log_bucket_progress(
+
+                processed += 1
+                symbols_written = len(bucket_symbol_to_bucket)
+                bucket_status = "ok" if bucket_symbol_failures == 0 else "ok_with_failures"
+                mdc.write_line(
+                    f"layer_handoff_status transition=silver_to_gold status={bucket_status} bucket={bucket} "
+                    f"symbols_in={symbols_written + bucket_symbol_failures} symbols_out={symbols_written} "
+                    f"failures={bucket_symbol_failures}"
+                )
+                bucket_results.append(
+                    BucketExecutionResult(
                         bucket=bucket,
-                        stage="checkpoint_failed",
-                        output_symbols=len(bucket_symbol_to_bucket),
-                        output_rows=bucket_output_rows,
-                        failed_symbols=bucket_symbol_failures,
+                        status=bucket_status,
+                        symbols_written=symbols_written,
+                        watermark_updated=watermark_updated,
                     )
-                    continue
-                watermarks_dirty = True
-                watermark_updated = True
-                mdc.write_line(
-                    f"watermark_update_status layer=gold domain=market bucket={bucket} status=updated reason=success"
                 )
-            elif silver_commit is not None:
+                _log_bucket_progress(
+                    bucket=bucket,
+                    stage="write_completed",
+                    rows=write_rows,
+                    symbols=symbols_written,
+                    columns=write_columns,
+                    memory_mb=write_memory_mb,
+                    output_rows=bucket_output_rows,
+                    failed_symbols=bucket_symbol_failures,
+                )
+            except Exception as exc:
+                failed += 1
+                failed_buckets += 1
+                mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
                 mdc.write_line(
-                    f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                    "status=blocked reason=symbol_compute_failures"
+                    f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
+                    f"reason=write_failure symbols_in={len(bucket_symbol_to_bucket) + bucket_symbol_failures} "
+                    f"symbols_out=0 failures={bucket_symbol_failures + 1}"
                 )
-            else:
-                symbol_to_bucket = updated_symbol_to_bucket
                 mdc.write_line(
                     f"watermark_update_status layer=gold domain=market bucket={bucket} "
-                    "status=blocked reason=missing_source_commit"
+                    "status=blocked reason=write_failure"
                 )
-
-            processed += 1
-            symbols_written = len(bucket_symbol_to_bucket)
-            bucket_status = "ok" if bucket_symbol_failures == 0 else "ok_with_failures"
-            mdc.write_line(
-                f"layer_handoff_status transition=silver_to_gold status={bucket_status} bucket={bucket} "
-                f"symbols_in={symbols_written + bucket_symbol_failures} symbols_out={symbols_written} "
-                f"failures={bucket_symbol_failures}"
-            )
-            bucket_results.append(
-                BucketExecutionResult(
-                    bucket=bucket,
-                    status=bucket_status,
-                    symbols_written=symbols_written,
-                    watermark_updated=watermark_updated,
+                bucket_results.append(
+                    BucketExecutionResult(
+                        bucket=bucket,
+                        status="failed_write",
+                        symbols_written=0,
+                        watermark_updated=False,
+                    )
                 )
-            )
-            _log_bucket_progress(
-                bucket=bucket,
-                stage="write_completed",
-                rows=write_rows,
-                symbols=symbols_written,
-                columns=write_columns,
-                memory_mb=write_memory_mb,
-                output_rows=bucket_output_rows,
-                failed_symbols=bucket_symbol_failures,
-            )
-        except Exception as exc:
-            failed += 1
-            failed_buckets += 1
-            mdc.write_error(f"Gold market alpha26 write failed bucket={bucket}: {exc}")
-            mdc.write_line(
-                f"layer_handoff_status transition=silver_to_gold status=failed bucket={bucket} "
-                f"reason=write_failure symbols_in={len(bucket_symbol_to_bucket) + bucket_symbol_failures} "
-                f"symbols_out=0 failures={bucket_symbol_failures + 1}"
-            )
-            mdc.write_line(
-                f"watermark_update_status layer=gold domain=market bucket={bucket} status=blocked reason=write_failure"
-            )
-            bucket_results.append(
-                BucketExecutionResult(
+                _log_bucket_progress(
                     bucket=bucket,
-                    status="failed_write",
-                    symbols_written=0,
-                    watermark_updated=False,
+                    stage="write_failed",
+                    output_symbols=len(bucket_symbol_to_bucket),
+                    output_rows=bucket_output_rows,
+                    failed_symbols=bucket_symbol_failures,
                 )
-            )
-            _log_bucket_progress(
-                bucket=bucket,
-                stage="write_failed",
-                output_symbols=len(bucket_symbol_to_bucket),
-                output_rows=bucket_output_rows,
-                failed_symbols=bucket_symbol_failures,
-            )
-        finally:
-            if silver_commit is not None:
-                try:
-                    _cleanup_staged_market_bucket(
-                        gold_container=gold_container,
-                        staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
-                    )
-                except Exception as exc:
-                    mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {exc}")
+            finally:
+                if silver_commit is not None:
+                    try:
+                        _cleanup_staged_market_bucket(
+                            gold_container=gold_container,
+                            staging_root=_gold_market_staging_root(run_id=run_id, bucket=bucket),
+                        )
+                    except Exception as exc:
+                        mdc.write_warning(f"Gold market staging cleanup failed bucket={bucket}: {exc}")
+    finally:
+        if stage_executor is not None:
+            stage_executor.shutdown(wait=True, cancel_futures=True)
 
     status_counts: dict[str, int] = {}
     for result in bucket_results:
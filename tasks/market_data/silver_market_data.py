@@ -1,5 +1,8 @@
 
+import hashlib
+import os
 import pandas as pd
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from datetime import UTC, datetime
 from io import BytesIO
 from typing import Optional
@@ -69,6 +72,11 @@ _ALPHA26_MARKET_NUMERIC_COLUMNS = [
     "short_interest",
     "short_volume",
 ]
+_DEFAULT_BUCKET_WORKERS = 1
+_MAX_BUCKET_WORKERS = 26
+_DEFAULT_BUCKET_WORKER_MEMORY_MB = 1024
+# Bump when _process_symbol_frame output changes so incremental runs rebuild every symbol once.
+_SILVER_MARKET_TRANSFORM_VERSION = 1
 _BRONZE_TO_SILVER_REQUIRED_COLUMNS = {
     "symbol",
     "date",
@@ -414,6 +422,54 @@ def _process_symbol_frame(
     return "ok"
 
 
+def _silver_market_transform_key() -> str:
+    backfill_start, backfill_end = get_backfill_range()
+    start_text = backfill_start.isoformat() if backfill_start is not None else ""
+    end_text = backfill_end.isoformat() if backfill_end is not None else ""
+    return f"v{_SILVER_MARKET_TRANSFORM_VERSION}|{start_text}|{end_text}"
+
+
+def _symbol_content_hashes(df_bucket: pd.DataFrame, *, symbol_col: str) -> dict[str, str]:
+    tickers = df_bucket[symbol_col].fillna("").astype(str).str.strip().str.upper()
+    content = df_bucket.drop(columns=[symbol_col, "ingested_at"], errors="ignore")
+    row_hashes = pd.util.hash_pandas_object(content, index=False).to_numpy()
+    hashes: dict[str, str] = {}
+    for ticker, positions in tickers.groupby(tickers, sort=True).indices.items():
+        if ticker:
+            hashes[ticker] = hashlib.sha256(row_hashes[positions].tobytes()).hexdigest()[:32]
+    return hashes
+
+
+def _resolve_changed_symbols(
+    prior_signature: Optional[dict],
+    *,
+    symbol_hashes: dict[str, str],
+    transform_key: str,
+) -> Optional[tuple[set[str], set[str]]]:
+    """
+    Return (changed_or_new, removed) symbols relative to the prior bucket signature.
+
+    None means the prior signature cannot vouch for the existing Silver rows (no per-symbol hashes
+    yet, or a different transform), so the whole bucket must be rebuilt.
+    """
+    if not isinstance(prior_signature, dict):
+        return None
+    prior_hashes = prior_signature.get("symbol_hashes")
+    if not isinstance(prior_hashes, dict) or prior_signature.get("transform_key") != transform_key:
+        return None
+    changed = {symbol for symbol, digest in symbol_hashes.items() if prior_hashes.get(symbol) != digest}
+    removed = set(prior_hashes).difference(symbol_hashes)
+    return changed, removed
+
+
+def _load_retained_silver_bucket_rows(bucket: str, *, replaced_symbols: set[str]) -> Optional[pd.DataFrame]:
+    existing = delta_core.load_delta(cfg.AZURE_CONTAINER_SILVER, DataPaths.get_silver_market_bucket_path(bucket))
+    if existing is None or "symbol" not in existing.columns:
+        return None
+    existing_symbols = existing["symbol"].fillna("").astype(str).str.strip().str.upper()
+    return existing.loc[~existing_symbols.isin(replaced_symbols)].reset_index(drop=True)
+
+
 def process_alpha26_bucket_blob(
     blob: dict,
     *,
@@ -426,7 +482,8 @@ def process_alpha26_bucket_blob(
     if not blob_name.endswith(".parquet"):
         return "skipped_non_parquet"
 
-    unchanged, signature = check_blob_unchanged(blob, watermarks.get(watermark_key))
+    prior_signature = watermarks.get(watermark_key)
+    unchanged, signature = check_blob_unchanged(blob, prior_signature)
     if unchanged and not force_reprocess:
         return "skipped_unchanged"
 
@@ -473,6 +530,39 @@ def process_alpha26_bucket_blob(
         return "failed"
 
     debug_symbols = set(getattr(cfg, "DEBUG_SYMBOLS", []) or [])
+    bucket = _parse_alpha26_bucket_from_blob_name(blob_name)
+    symbol_hashes = _symbol_content_hashes(df_bucket, symbol_col=symbol_col)
+    transform_key = _silver_market_transform_key()
+    symbols_to_process: Optional[set[str]] = None
+    if bucket and not force_reprocess and not debug_symbols:
+        symbol_changes = _resolve_changed_symbols(
+            prior_signature,
+            symbol_hashes=symbol_hashes,
+            transform_key=transform_key,
+        )
+        if symbol_changes is not None:
+            changed_symbols, removed_symbols = symbol_changes
+            if not changed_symbols and not removed_symbols:
+                if signature:
+                    signature["updated_at"] = datetime.now(UTC).isoformat()
+                    signature["symbol_hashes"] = symbol_hashes
+                    signature["transform_key"] = transform_key
+                    watermarks[watermark_key] = signature
+                mdc.write_line(
+                    f"layer_handoff_status transition=bronze_to_silver status=ok source={blob_name} bucket={bucket} "
+                    f"symbols_in=0 symbols_out=0 failures=0 mode=incremental symbols_unchanged={len(symbol_hashes)}"
+                )
+                return "ok"
+            retained = _load_retained_silver_bucket_rows(bucket, replaced_symbols=changed_symbols | removed_symbols)
+            if retained is not None:
+                symbols_to_process = changed_symbols
+                alpha26_bucket_frames.setdefault(bucket, []).append(retained)
+                mdc.write_line(
+                    "silver_market_incremental "
+                    f"bucket={bucket} changed_symbols={len(changed_symbols)} removed_symbols={len(removed_symbols)} "
+                    f"retained_rows={len(retained)}"
+                )
+
     has_failed = False
     input_symbols = 0
     output_symbols = 0
@@ -483,6 +573,8 @@ def process_alpha26_bucket_blob(
             continue
         if debug_symbols and ticker not in debug_symbols:
             continue
+        if symbols_to_process is not None and ticker not in symbols_to_process:
+            continue
         input_symbols += 1
         status = _process_symbol_frame(
             ticker=ticker,
@@ -498,16 +590,73 @@ def process_alpha26_bucket_blob(
 
     if not has_failed and signature:
         signature["updated_at"] = datetime.now(UTC).isoformat()
+        if not debug_symbols:
+            signature["symbol_hashes"] = symbol_hashes
+            signature["transform_key"] = transform_key
         watermarks[watermark_key] = signature
-    bucket = _parse_alpha26_bucket_from_blob_name(blob_name) or "unknown"
     status_text = "failed" if has_failed else "ok"
+    mode = "full" if symbols_to_process is None else "incremental"
     mdc.write_line(
-        f"layer_handoff_status transition=bronze_to_silver status={status_text} source={blob_name} bucket={bucket} "
-        f"symbols_in={input_symbols} symbols_out={output_symbols} failures={failed_symbols}"
+        f"layer_handoff_status transition=bronze_to_silver status={status_text} source={blob_name} "
+        f"bucket={bucket or 'unknown'} symbols_in={input_symbols} symbols_out={output_symbols} "
+        f"failures={failed_symbols} mode={mode}"
     )
     return status_text
 
 
+def _stage_alpha26_bucket_blob(
+    blob: dict,
+    *,
+    prior_signature: Optional[dict],
+    force_reprocess: bool,
+) -> tuple[str, Optional[dict], dict[str, list[pd.DataFrame]]]:
+    """Run `process_alpha26_bucket_blob` against a private watermark copy so it can execute in a worker process."""
+    watermark_key = normalize_watermark_blob_name(str(blob.get("name", "")))
+    watermarks = {watermark_key: dict(prior_signature)} if isinstance(prior_signature, dict) else {}
+    alpha26_bucket_frames: dict[str, list[pd.DataFrame]] = {}
+    status = process_alpha26_bucket_blob(
+        blob,
+        watermarks=watermarks,
+        alpha26_bucket_frames=alpha26_bucket_frames,
+        force_reprocess=force_reprocess,
+    )
+    return status, watermarks.get(watermark_key), alpha26_bucket_frames
+
+
+def _resolve_bucket_workers(blob_count: int) -> int:
+    """Resolve how many bronze bucket blobs to stage concurrently.
+
+    `SILVER_MARKET_BUCKET_WORKERS` sets the requested worker count (default 1, i.e. sequential).
+    The result is capped by CPU count and by available memory divided by
+    `SILVER_MARKET_BUCKET_WORKER_MEMORY_MB`, the expected peak footprint of one bucket worker.
+    """
+
+    if blob_count <= 0:
+        return 1
+    raw = str(os.environ.get("SILVER_MARKET_BUCKET_WORKERS") or "").strip()
+    try:
+        requested = int(raw) if raw else _DEFAULT_BUCKET_WORKERS
+    except ValueError:
+        requested = _DEFAULT_BUCKET_WORKERS
+    workers = max(1, min(requested, _MAX_BUCKET_WORKERS, blob_count, os.cpu_count() or 1))
+    if workers <= 1:
+        return 1
+
+    raw_memory = str(os.environ.get("SILVER_MARKET_BUCKET_WORKER_MEMORY_MB") or "").strip()
+    try:
+        per_worker_mb = float(raw_memory) if raw_memory else float(_DEFAULT_BUCKET_WORKER_MEMORY_MB)
+    except ValueError:
+        per_worker_mb = float(_DEFAULT_BUCKET_WORKER_MEMORY_MB)
+    available_mb = layer_bucketing.available_memory_mb()
+    if available_mb is not None and per_worker_mb > 0:
+        workers = max(1, min(workers, int(available_mb // per_worker_mb)))
+    return workers
+
+
+def _bucket_stage_executor(workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=workers)
+
+
 def _write_alpha26_market_buckets(
     bucket_frames: dict[str, list[pd.DataFrame]],
     *,
@@ -733,8 +882,8 @@ def main():
         mdc.write_line(f"Applying historical cutoff to silver market data: {backfill_start.date().isoformat()}")
     bronze_bucketing.bronze_layout_mode()
     layer_bucketing.silver_layout_mode()
-    force_rebuild = layer_bucketing.silver_alpha26_force_rebuild()
-    
+    force_rebuild = layer_bucketing.silver_market_force_rebuild()
+
     mdc.write_line("Listing Bronze files...")
     watermarks = load_watermarks("bronze_market_data")
     last_success = load_last_success("silver_market_data")
@@ -782,55 +931,86 @@ def main():
     alpha26_written_symbols = 0
     alpha26_index_path: Optional[str] = None
     alpha26_column_count: Optional[int] = len(_ALPHA26_MARKET_MIN_COLUMNS)
-    for blob in candidate_blobs:
-        blob_name = str(blob.get("name", ""))
-        watermark_key = normalize_watermark_blob_name(blob_name)
-        prior_signature = dict(watermarks[watermark_key]) if isinstance(watermarks.get(watermark_key), dict) else None
-        alpha26_bucket_frames: dict[str, list[pd.DataFrame]] = {}
-        status = process_alpha26_bucket_blob(
-            blob,
-            watermarks=watermarks,
-            alpha26_bucket_frames=alpha26_bucket_frames,
-            force_reprocess=force_checkpoint_rebuild,
+    # Staging only reads bronze and the bucket's own silver table, so blobs can be staged ahead in
+    # worker processes; silver writes and watermark updates stay sequential in candidate order.
+    bucket_workers = _resolve_bucket_workers(len(candidate_blobs))
+    stage_executor: Optional[Executor] = None
+    staged_futures: dict[int, Future] = {}
+    if bucket_workers > 1:
+        mdc.write_line(
+            f"silver_market_bucket_parallelism workers={bucket_workers} buckets={len(candidate_blobs)}"
         )
-        if status == "ok":
-            processed += 1
-            touched = _parse_alpha26_bucket_from_blob_name(str(blob.get("name", "")))
-            staged_rows = _count_staged_bucket_rows(alpha26_bucket_frames)
-            alpha26_staged_rows += staged_rows
-            if staged_rows == 0:
-                watermarks_dirty = True
-                continue
-            if not touched:
-                _restore_blob_watermark(watermarks, blob_name=blob_name, prior_signature=prior_signature)
-                failed += 1
-                mdc.write_error(
-                    f"Silver market alpha26 write failed: unable to resolve bucket from blob {blob.get('name')!r}."
-                )
-                break
-            try:
-                alpha26_written_symbols, alpha26_index_path, alpha26_column_count = _write_alpha26_market_buckets(
-                    alpha26_bucket_frames,
-                    touched_buckets={touched},
-                )
-                alpha26_flush_count += 1
-                watermarks_dirty = True
-                mdc.write_line(
-                    "Silver market alpha26 buckets written: "
-                    f"touched_buckets=1 symbols={alpha26_written_symbols} "
-                    f"index_path={alpha26_index_path or 'unavailable'}"
+        stage_executor = _bucket_stage_executor(bucket_workers)
+    try:
+        for position, blob in enumerate(candidate_blobs):
+            blob_name = str(blob.get("name", ""))
+            watermark_key = normalize_watermark_blob_name(blob_name)
+            prior_signature = (
+                dict(watermarks[watermark_key]) if isinstance(watermarks.get(watermark_key), dict) else None
+            )
+            alpha26_bucket_frames: dict[str, list[pd.DataFrame]] = {}
+            if stage_executor is not None:
+                for ahead in range(position, min(position + bucket_workers, len(candidate_blobs))):
+                    if ahead in staged_futures:
+                        continue
+                    ahead_blob = candidate_blobs[ahead]
+                    staged_futures[ahead] = stage_executor.submit(
+                        _stage_alpha26_bucket_blob,
+                        ahead_blob,
+                        prior_signature=watermarks.get(normalize_watermark_blob_name(ahead_blob.get("name"))),
+                        force_reprocess=force_checkpoint_rebuild,
+                    )
+                status, staged_signature, alpha26_bucket_frames = staged_futures.pop(position).result()
+                if staged_signature is not None:
+                    watermarks[watermark_key] = staged_signature
+            else:
+                status = process_alpha26_bucket_blob(
+                    blob,
+                    watermarks=watermarks,
+                    alpha26_bucket_frames=alpha26_bucket_frames,
+                    force_reprocess=force_checkpoint_rebuild,
                 )
-            except Exception as exc:
-                _restore_blob_watermark(watermarks, blob_name=blob_name, prior_signature=prior_signature)
+            if status == "ok":
+                processed += 1
+                touched = _parse_alpha26_bucket_from_blob_name(str(blob.get("name", "")))
+                staged_rows = _count_staged_bucket_rows(alpha26_bucket_frames)
+                alpha26_staged_rows += staged_rows
+                if staged_rows == 0:
+                    watermarks_dirty = True
+                    continue
+                if not touched:
+                    _restore_blob_watermark(watermarks, blob_name=blob_name, prior_signature=prior_signature)
+                    failed += 1
+                    mdc.write_error(
+                        f"Silver market alpha26 write failed: unable to resolve bucket from blob {blob.get('name')!r}."
+                    )
+                    break
+                try:
+                    alpha26_written_symbols, alpha26_index_path, alpha26_column_count = _write_alpha26_market_buckets(
+                        alpha26_bucket_frames,
+                        touched_buckets={touched},
+                    )
+                    alpha26_flush_count += 1
+                    watermarks_dirty = True
+                    mdc.write_line(
+                        "Silver market alpha26 buckets written: "
+                        f"touched_buckets=1 symbols={alpha26_written_symbols} "
+                        f"index_path={alpha26_index_path or 'unavailable'}"
+                    )
+                except Exception as exc:
+                    _restore_blob_watermark(watermarks, blob_name=blob_name, prior_signature=prior_signature)
+                    failed += 1
+                    mdc.write_error(f"Silver market alpha26 bucket write failed: {exc}")
+                    break
+            elif status == "skipped_unchanged":
+                skipped_unchanged += 1
+            elif status.startswith("skipped"):
+                skipped_other += 1
+            else:
                 failed += 1
-                mdc.write_error(f"Silver market alpha26 bucket write failed: {exc}")
-                break
-        elif status == "skipped_unchanged":
-            skipped_unchanged += 1
-        elif status.startswith("skipped"):
-            skipped_other += 1
-        else:
-            failed += 1
+    finally:
+        if stage_executor is not None:
+            stage_executor.shutdown(wait=True, cancel_futures=True)
 
     if failed == 0:
         if alpha26_staged_rows == 0:
@@ -25,6 +25,13 @@ def _parse_date(value: str | None) -> date | None:
     return date.fromisoformat(raw)
 
 
+def _incremental_mode_enabled(value: str | None) -> bool:
+    mode = str(value or "").strip().lower() or "incremental"
+    if mode not in {"incremental", "full"}:
+        raise ValueError("RANKING_MATERIALIZATION_MODE must be 'incremental' or 'full'.")
+    return mode == "incremental"
+
+
 def _resolve_strategies(dsn: str, explicit_name: str | None) -> list[str]:
     if explicit_name:
         return [explicit_name]
@@ -51,6 +58,7 @@ def main() -> int:
     strategy_name = str(os.environ.get("RANKING_STRATEGY_NAME") or "").strip() or None
     start_date = _parse_date(os.environ.get("RANKING_START_DATE"))
     end_date = _parse_date(os.environ.get("RANKING_END_DATE"))
+    incremental = _incremental_mode_enabled(os.environ.get("RANKING_MATERIALIZATION_MODE"))
 
     strategy_names = _resolve_strategies(dsn, strategy_name)
     if not strategy_names:
@@ -64,6 +72,7 @@ def main() -> int:
             start_date=start_date,
             end_date=end_date,
             triggered_by="job",
+            incremental=incremental,
         )
         logger.info(
             "Ranking materialization complete.",
@@ -72,6 +81,8 @@ def main() -> int:
                     "strategyName": result["strategyName"],
                     "rankingSchemaName": result["rankingSchemaName"],
                     "outputTableName": result["outputTableName"],
+                    "startDate": str(result["startDate"]),
+                    "incremental": incremental,
                     "rowCount": result["rowCount"],
                     "dateCount": result["dateCount"],
                     "runId": result["runId"],
@@ -11,7 +11,7 @@ import pandas as pd
 
 from core import core as mdc
 from core.postgres import connect, copy_rows
-from core.regime import build_regime_outputs, compute_curve_state, compute_trend_state
+from core.regime import build_regime_outputs, compute_curve_states, compute_threshold_streak, compute_trend_states
 from core.regime_repository import RegimeRepository
 from core import domain_artifacts
 from core.market_symbols import REGIME_REQUIRED_MARKET_SYMBOLS
@@ -486,18 +486,9 @@ def _build_inputs_daily(market_series: pd.DataFrame, *, computed_at: datetime) -
     inputs["vix_slope"] = inputs["vix3m_close"] - inputs["vix_spot_close"]
     inputs["rvol_10d_ann"] = inputs["return_1d"].rolling(window=10, min_periods=10).std(ddof=1) * sqrt(252.0) * 100.0
 
-    streak = 0
-    streak_values: list[int] = []
-    for raw_value in inputs["vix_spot_close"].tolist():
-        value = float(raw_value) if raw_value is not None and not pd.isna(raw_value) else None
-        if value is not None and value > 32.0:
-            streak += 1
-        else:
-            streak = 0
-        streak_values.append(streak)
-    inputs["vix_gt_32_streak"] = streak_values
-    inputs["trend_state"] = inputs["return_20d"].map(lambda value: compute_trend_state(value))
-    inputs["curve_state"] = inputs["vix_slope"].map(lambda value: compute_curve_state(value))
+    inputs["vix_gt_32_streak"] = compute_threshold_streak(inputs["vix_spot_close"], threshold=32.0)
+    inputs["trend_state"] = compute_trend_states(inputs["return_20d"])
+    inputs["curve_state"] = compute_curve_states(inputs["vix_slope"])
     inputs["inputs_complete_flag"] = inputs[
         [
             "spy_close",
@@ -12,7 +12,6 @@ using only pivots confirmed after `_PIVOT_SPAN` future bars have elapsed.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
@@ -24,22 +23,6 @@ _ZONE_PRICE_PCT = 0.0075
 _ZONE_ATR_MULT = 0.35
 
 
-@dataclass
-class _ZoneState:
-    price_sum: float
-    touch_count: int
-    low: float
-    high: float
-    last_touch_index: int
-    base_half_width: float
-
-    @property
-    def mid(self) -> float:
-        if self.touch_count <= 0:
-            return np.nan
-        return self.price_sum / float(self.touch_count)
-
-
 def _safe_div(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
     denom = denominator.where(denominator != 0)
     return numerator.where(denom.notna()).divide(denom)
@@ -50,81 +33,6 @@ def _zone_half_width(*, price: float, atr: float) -> float:
     return max(abs(float(price)) * _ZONE_PRICE_PCT, atr_component, 0.01)
 
 
-def _zone_strength(zone: _ZoneState, *, current_index: int) -> float:
-    age_bars = max(0, current_index - zone.last_touch_index)
-    return float(zone.touch_count) * math.exp(-float(age_bars) / _ZONE_RECENCY_BARS)
-
-
-def _register_zone(zones: list[_ZoneState], *, price: float, atr: float, current_index: int) -> None:
-    half_width = _zone_half_width(price=price, atr=atr)
-    matching_zone: _ZoneState | None = None
-    matching_distance = float("inf")
-
-    for zone in zones:
-        if price < (zone.low - half_width) or price > (zone.high + half_width):
-            continue
-        distance = abs(zone.mid - price)
-        if distance < matching_distance:
-            matching_distance = distance
-            matching_zone = zone
-
-    if matching_zone is None:
-        zones.append(
-            _ZoneState(
-                price_sum=float(price),
-                touch_count=1,
-                low=float(price) - half_width,
-                high=float(price) + half_width,
-                last_touch_index=current_index,
-                base_half_width=half_width,
-            )
-        )
-        return
-
-    matching_zone.price_sum += float(price)
-    matching_zone.touch_count += 1
-    matching_zone.low = min(matching_zone.low, float(price) - half_width)
-    matching_zone.high = max(matching_zone.high, float(price) + half_width)
-    matching_zone.last_touch_index = current_index
-    matching_zone.base_half_width = max(matching_zone.base_half_width, half_width)
-
-
-def _select_support_zone(zones: list[_ZoneState], *, close: float, current_index: int) -> _ZoneState | None:
-    if not np.isfinite(close):
-        return None
-
-    candidates: list[tuple[float, float, _ZoneState]] = []
-    for zone in zones:
-        in_zone = zone.low <= close <= zone.high
-        if not in_zone and zone.mid > close:
-            continue
-        distance = abs(close - zone.mid) if in_zone else close - zone.mid
-        candidates.append((float(distance), -_zone_strength(zone, current_index=current_index), zone))
-
-    if not candidates:
-        return None
-    candidates.sort(key=lambda item: (item[0], item[1]))
-    return candidates[0][2]
-
-
-def _select_resistance_zone(zones: list[_ZoneState], *, close: float, current_index: int) -> _ZoneState | None:
-    if not np.isfinite(close):
-        return None
-
-    candidates: list[tuple[float, float, _ZoneState]] = []
-    for zone in zones:
-        in_zone = zone.low <= close <= zone.high
-        if not in_zone and zone.mid < close:
-            continue
-        distance = abs(zone.mid - close) if in_zone else zone.mid - close
-        candidates.append((float(distance), -_zone_strength(zone, current_index=current_index), zone))
-
-    if not candidates:
-        return None
-    candidates.sort(key=lambda item: (item[0], item[1]))
-    return candidates[0][2]
-
-
 def _confirmed_pivot_mask(series: pd.Series, *, mode: str) -> pd.Series:
     window = (2 * _PIVOT_SPAN) + 1
     if mode == "high":
@@ -136,6 +44,172 @@ def _confirmed_pivot_mask(series: pd.Series, *, mode: str) -> pd.Series:
     return series.eq(extrema) & series.notna()
 
 
+_STRUCTURE_COLUMNS = (
+    "sr_support_1_mid",
+    "sr_support_1_low",
+    "sr_support_1_high",
+    "sr_support_1_touches",
+    "sr_support_1_strength",
+    "sr_support_1_dist_atr",
+    "sr_resistance_1_mid",
+    "sr_resistance_1_low",
+    "sr_resistance_1_high",
+    "sr_resistance_1_touches",
+    "sr_resistance_1_strength",
+    "sr_resistance_1_dist_atr",
+    "sr_in_support_1_zone",
+    "sr_in_resistance_1_zone",
+    "sr_breaks_above_resistance_1",
+    "sr_breaks_below_support_1",
+    "sr_zone_position",
+    "fib_swing_direction",
+    "fib_anchor_low",
+    "fib_anchor_high",
+    "fib_level_236",
+    "fib_level_382",
+    "fib_level_500",
+    "fib_level_618",
+    "fib_level_786",
+    "fib_nearest_level",
+    "fib_nearest_dist_atr",
+    "fib_in_value_zone",
+)
+_FIB_RATIOS = (0.236, 0.382, 0.500, 0.618, 0.786)
+
+
+class _ZoneArrays:
+    """Array-backed list of merged support or resistance zones."""
+
+    __slots__ = ("price_sum", "touch_count", "low", "high", "last_touch_index", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.price_sum = np.zeros(capacity, dtype="float64")
+        self.touch_count = np.zeros(capacity, dtype="int64")
+        self.low = np.zeros(capacity, dtype="float64")
+        self.high = np.zeros(capacity, dtype="float64")
+        self.last_touch_index = np.zeros(capacity, dtype="int64")
+        self.count = 0
+
+    def mid(self) -> np.ndarray:
+        return self.price_sum[: self.count] / self.touch_count[: self.count]
+
+    def register(self, *, price: float, atr: float, current_index: int) -> None:
+        half_width = _zone_half_width(price=price, atr=atr)
+        count = self.count
+        if count:
+            distance = np.abs(self.mid() - price)
+            # `distance < inf` mirrors the scalar loop, which never matches a NaN/inf distance.
+            outside = (price < self.low[:count] - half_width) | (price > self.high[:count] + half_width)
+            candidate = ~outside & (distance < np.inf)
+            if candidate.any():
+                candidate_index = np.flatnonzero(candidate)
+                match = int(candidate_index[np.argmin(distance[candidate_index])])
+                self.price_sum[match] += price
+                self.touch_count[match] += 1
+                self.low[match] = min(float(self.low[match]), price - half_width)
+                self.high[match] = max(float(self.high[match]), price + half_width)
+                self.last_touch_index[match] = current_index
+                return
+
+        self.price_sum[count] = price
+        self.touch_count[count] = 1
+        self.low[count] = price - half_width
+        self.high[count] = price + half_width
+        self.last_touch_index[count] = current_index
+        self.count = count + 1
+
+
+def _zone_strengths(touch_count: np.ndarray, last_touch_index: np.ndarray, current_index: np.ndarray) -> np.ndarray:
+    age_bars = np.maximum(current_index - last_touch_index, 0).astype("float64")
+    # math.exp (not np.exp) keeps strengths bit-identical to the scalar row-loop formula.
+    decay = np.fromiter(map(math.exp, (-age_bars / _ZONE_RECENCY_BARS).tolist()), dtype="float64", count=age_bars.size)
+    return touch_count.astype("float64") * decay
+
+
+def _select_zone_indices(
+    zones: _ZoneArrays,
+    *,
+    close: np.ndarray,
+    current_index: np.ndarray,
+    support: bool,
+) -> np.ndarray:
+    """Pick the nearest support/resistance zone per row, or -1 when none qualifies.
+
+    Resolves a block of rows that share the same zone state at once. Candidates are zones on
+    the right side of the close or containing it; the nearest mid wins, and distance ties
+    fall back to strength, then zone order.
+    """
+
+    selected = np.full(close.size, -1, dtype="int64")
+    if zones.count == 0 or close.size == 0:
+        return selected
+
+    count = zones.count
+    mid = zones.mid()
+    row_close = close[:, None]
+    in_zone = (zones.low[:count] <= row_close) & (row_close <= zones.high[:count])
+    if support:
+        eligible = in_zone | ~(mid > row_close)
+        distance = np.where(in_zone, np.abs(row_close - mid), row_close - mid)
+    else:
+        eligible = in_zone | ~(mid < row_close)
+        distance = np.where(in_zone, np.abs(mid - row_close), mid - row_close)
+    eligible &= np.isfinite(row_close)
+    distance = np.where(eligible, distance, np.inf)
+
+    nearest = eligible & (distance == distance.min(axis=1)[:, None])
+    has_zone = nearest.any(axis=1)
+    selected[has_zone] = nearest[has_zone].argmax(axis=1)
+    for row in np.flatnonzero(nearest.sum(axis=1) > 1):
+        tied = np.flatnonzero(nearest[row])
+        strengths = _zone_strengths(
+            zones.touch_count[tied],
+            zones.last_touch_index[tied],
+            np.full(tied.size, current_index[row], dtype="int64"),
+        )
+        selected[row] = tied[int(np.argmax(strengths))]
+    return selected
+
+
+def _zone_output_columns(
+    *,
+    side: str,
+    found: np.ndarray,
+    mid: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    touch_count: np.ndarray,
+    last_touch_index: np.ndarray,
+    close: np.ndarray,
+    prev_close: np.ndarray,
+    atr: np.ndarray,
+) -> dict[str, np.ndarray]:
+    rows = np.arange(close.size, dtype="int64")
+    strength = np.zeros(close.size, dtype="float64")
+    strength[found] = _zone_strengths(touch_count[found], last_touch_index[found], rows[found])
+
+    finite_close = np.isfinite(close)
+    usable_atr = found & finite_close & np.isfinite(atr) & (atr != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if side == "support":
+            dist_atr = np.where(usable_atr, (close - mid) / atr, np.nan)
+            crossed = (close < low) & (prev_close >= low)
+        else:
+            dist_atr = np.where(usable_atr, (mid - close) / atr, np.nan)
+            crossed = (close > high) & (prev_close <= high)
+
+    return {
+        "mid": np.where(found, mid, np.nan),
+        "low": np.where(found, low, np.nan),
+        "high": np.where(found, high, np.nan),
+        "touches": np.where(found, touch_count, 0).astype("int64"),
+        "strength": strength,
+        "dist_atr": dist_atr,
+        "in_zone": (found & finite_close & (low <= close) & (close <= high)).astype("int64"),
+        "break": (found & finite_close & np.isfinite(prev_close) & crossed).astype("int64"),
+    }
+
+
 def _build_structure_frame(
     *,
     high: pd.Series,
@@ -143,209 +217,168 @@ def _build_structure_frame(
     close: pd.Series,
     atr: pd.Series,
 ) -> pd.DataFrame:
+    """Support/resistance and Fibonacci columns computed over numpy arrays.
+
+    Zone state only changes on rows where a pivot is confirmed, so rows between two
+    confirmations are resolved against the zones in one vectorized step. Output matches
+    the per-row reference loop in tests/technical_analysis exactly.
+    """
+
+    row_count = len(close)
+    if row_count == 0:
+        return pd.DataFrame({column: [] for column in _STRUCTURE_COLUMNS})
+
     pivot_high_mask = _confirmed_pivot_mask(high, mode="high")
     pivot_low_mask = _confirmed_pivot_mask(low, mode="low")
-    confirmed_pivot_high = high.where(pivot_high_mask).shift(_PIVOT_SPAN)
-    confirmed_pivot_low = low.where(pivot_low_mask).shift(_PIVOT_SPAN)
-    confirmed_pivot_high_atr = atr.where(pivot_high_mask).shift(_PIVOT_SPAN)
-    confirmed_pivot_low_atr = atr.where(pivot_low_mask).shift(_PIVOT_SPAN)
-    prev_close = close.shift(1)
-
-    support_zones: list[_ZoneState] = []
-    resistance_zones: list[_ZoneState] = []
-    last_confirmed_low: tuple[int, float] | None = None
-    last_confirmed_high: tuple[int, float] | None = None
-
-    out: dict[str, list[float | int]] = {
-        "sr_support_1_mid": [],
-        "sr_support_1_low": [],
-        "sr_support_1_high": [],
-        "sr_support_1_touches": [],
-        "sr_support_1_strength": [],
-        "sr_support_1_dist_atr": [],
-        "sr_resistance_1_mid": [],
-        "sr_resistance_1_low": [],
-        "sr_resistance_1_high": [],
-        "sr_resistance_1_touches": [],
-        "sr_resistance_1_strength": [],
-        "sr_resistance_1_dist_atr": [],
-        "sr_in_support_1_zone": [],
-        "sr_in_resistance_1_zone": [],
-        "sr_breaks_above_resistance_1": [],
-        "sr_breaks_below_support_1": [],
-        "sr_zone_position": [],
-        "fib_swing_direction": [],
-        "fib_anchor_low": [],
-        "fib_anchor_high": [],
-        "fib_level_236": [],
-        "fib_level_382": [],
-        "fib_level_500": [],
-        "fib_level_618": [],
-        "fib_level_786": [],
-        "fib_nearest_level": [],
-        "fib_nearest_dist_atr": [],
-        "fib_in_value_zone": [],
-    }
-
-    for index in range(len(close)):
-        confirmed_low = confirmed_pivot_low.iat[index]
-        if pd.notna(confirmed_low):
-            confirmed_low_atr = confirmed_pivot_low_atr.iat[index]
-            _register_zone(
-                support_zones,
-                price=float(confirmed_low),
-                atr=float(confirmed_low_atr) if pd.notna(confirmed_low_atr) else np.nan,
-                current_index=index,
+    confirmed_high = high.where(pivot_high_mask).shift(_PIVOT_SPAN).to_numpy(dtype="float64", na_value=np.nan)
+    confirmed_low = low.where(pivot_low_mask).shift(_PIVOT_SPAN).to_numpy(dtype="float64", na_value=np.nan)
+    confirmed_high_atr = atr.where(pivot_high_mask).shift(_PIVOT_SPAN).to_numpy(dtype="float64", na_value=np.nan)
+    confirmed_low_atr = atr.where(pivot_low_mask).shift(_PIVOT_SPAN).to_numpy(dtype="float64", na_value=np.nan)
+    close_values = close.to_numpy(dtype="float64", na_value=np.nan)
+    atr_values = atr.to_numpy(dtype="float64", na_value=np.nan)
+    prev_close = np.concatenate([[np.nan], close_values[:-1]])
+    rows = np.arange(row_count, dtype="int64")
+
+    has_low = ~np.isnan(confirmed_low)
+    has_high = ~np.isnan(confirmed_high)
+    event_rows = np.flatnonzero(has_low | has_high)
+
+    support_zones = _ZoneArrays(int(has_low.sum()))
+    resistance_zones = _ZoneArrays(int(has_high.sum()))
+    selected: dict[str, dict[str, np.ndarray]] = {}
+    for side in ("support", "resistance"):
+        selected[side] = {
+            "found": np.zeros(row_count, dtype=bool),
+            "mid": np.full(row_count, np.nan, dtype="float64"),
+            "low": np.full(row_count, np.nan, dtype="float64"),
+            "high": np.full(row_count, np.nan, dtype="float64"),
+            "touch_count": np.zeros(row_count, dtype="int64"),
+            "last_touch_index": np.zeros(row_count, dtype="int64"),
+        }
+
+    for position, start in enumerate(event_rows.tolist()):
+        if has_low[start]:
+            support_zones.register(
+                price=float(confirmed_low[start]), atr=float(confirmed_low_atr[start]), current_index=start
             )
-            last_confirmed_low = (index - _PIVOT_SPAN, float(confirmed_low))
-
-        confirmed_high = confirmed_pivot_high.iat[index]
-        if pd.notna(confirmed_high):
-            confirmed_high_atr = confirmed_pivot_high_atr.iat[index]
-            _register_zone(
-                resistance_zones,
-                price=float(confirmed_high),
-                atr=float(confirmed_high_atr) if pd.notna(confirmed_high_atr) else np.nan,
-                current_index=index,
+        if has_high[start]:
+            resistance_zones.register(
+                price=float(confirmed_high[start]), atr=float(confirmed_high_atr[start]), current_index=start
             )
-            last_confirmed_high = (index - _PIVOT_SPAN, float(confirmed_high))
-
-        close_value = float(close.iat[index]) if pd.notna(close.iat[index]) else np.nan
-        prev_close_value = float(prev_close.iat[index]) if pd.notna(prev_close.iat[index]) else np.nan
-        atr_value = float(atr.iat[index]) if pd.notna(atr.iat[index]) else np.nan
-
-        support_zone = _select_support_zone(support_zones, close=close_value, current_index=index)
-        resistance_zone = _select_resistance_zone(resistance_zones, close=close_value, current_index=index)
-
-        if support_zone is None:
-            out["sr_support_1_mid"].append(np.nan)
-            out["sr_support_1_low"].append(np.nan)
-            out["sr_support_1_high"].append(np.nan)
-            out["sr_support_1_touches"].append(0)
-            out["sr_support_1_strength"].append(0.0)
-            out["sr_support_1_dist_atr"].append(np.nan)
-            out["sr_in_support_1_zone"].append(0)
-            out["sr_breaks_below_support_1"].append(0)
-        else:
-            support_strength = _zone_strength(support_zone, current_index=index)
-            support_in_zone = int(support_zone.low <= close_value <= support_zone.high) if np.isfinite(close_value) else 0
-            support_break = int(
-                np.isfinite(close_value)
-                and np.isfinite(prev_close_value)
-                and close_value < support_zone.low
-                and prev_close_value >= support_zone.low
-            )
-            out["sr_support_1_mid"].append(support_zone.mid)
-            out["sr_support_1_low"].append(support_zone.low)
-            out["sr_support_1_high"].append(support_zone.high)
-            out["sr_support_1_touches"].append(int(support_zone.touch_count))
-            out["sr_support_1_strength"].append(support_strength)
-            out["sr_support_1_dist_atr"].append(
-                ((close_value - support_zone.mid) / atr_value) if np.isfinite(close_value) and np.isfinite(atr_value) and atr_value != 0 else np.nan
-            )
-            out["sr_in_support_1_zone"].append(support_in_zone)
-            out["sr_breaks_below_support_1"].append(support_break)
-
-        if resistance_zone is None:
-            out["sr_resistance_1_mid"].append(np.nan)
-            out["sr_resistance_1_low"].append(np.nan)
-            out["sr_resistance_1_high"].append(np.nan)
-            out["sr_resistance_1_touches"].append(0)
-            out["sr_resistance_1_strength"].append(0.0)
-            out["sr_resistance_1_dist_atr"].append(np.nan)
-            out["sr_in_resistance_1_zone"].append(0)
-            out["sr_breaks_above_resistance_1"].append(0)
-        else:
-            resistance_strength = _zone_strength(resistance_zone, current_index=index)
-            resistance_in_zone = int(resistance_zone.low <= close_value <= resistance_zone.high) if np.isfinite(close_value) else 0
-            resistance_break = int(
-                np.isfinite(close_value)
-                and np.isfinite(prev_close_value)
-                and close_value > resistance_zone.high
-                and prev_close_value <= resistance_zone.high
-            )
-            out["sr_resistance_1_mid"].append(resistance_zone.mid)
-            out["sr_resistance_1_low"].append(resistance_zone.low)
-            out["sr_resistance_1_high"].append(resistance_zone.high)
-            out["sr_resistance_1_touches"].append(int(resistance_zone.touch_count))
-            out["sr_resistance_1_strength"].append(resistance_strength)
-            out["sr_resistance_1_dist_atr"].append(
-                ((resistance_zone.mid - close_value) / atr_value) if np.isfinite(close_value) and np.isfinite(atr_value) and atr_value != 0 else np.nan
+        stop = int(event_rows[position + 1]) if position + 1 < event_rows.size else row_count
+
+        for side, zones in (("support", support_zones), ("resistance", resistance_zones)):
+            zone_index = _select_zone_indices(
+                zones,
+                close=close_values[start:stop],
+                current_index=rows[start:stop],
+                support=side == "support",
             )
-            out["sr_in_resistance_1_zone"].append(resistance_in_zone)
-            out["sr_breaks_above_resistance_1"].append(resistance_break)
-
-        if support_zone is not None and resistance_zone is not None and resistance_zone.mid > support_zone.mid:
-            out["sr_zone_position"].append((close_value - support_zone.mid) / (resistance_zone.mid - support_zone.mid))
-        else:
-            out["sr_zone_position"].append(np.nan)
-
-        fib_direction = 0
-        fib_anchor_low = np.nan
-        fib_anchor_high = np.nan
-        fib_levels = [np.nan, np.nan, np.nan, np.nan, np.nan]
-
-        if last_confirmed_low is not None and last_confirmed_high is not None:
-            low_index, low_price = last_confirmed_low
-            high_index, high_price = last_confirmed_high
-            if low_index < high_index and high_price > low_price:
-                fib_direction = 1
-                fib_anchor_low = low_price
-                fib_anchor_high = high_price
-                swing_range = high_price - low_price
-                fib_levels = [
-                    high_price - (0.236 * swing_range),
-                    high_price - (0.382 * swing_range),
-                    high_price - (0.500 * swing_range),
-                    high_price - (0.618 * swing_range),
-                    high_price - (0.786 * swing_range),
-                ]
-            elif high_index < low_index and high_price > low_price:
-                fib_direction = -1
-                fib_anchor_low = low_price
-                fib_anchor_high = high_price
-                swing_range = high_price - low_price
-                fib_levels = [
-                    low_price + (0.236 * swing_range),
-                    low_price + (0.382 * swing_range),
-                    low_price + (0.500 * swing_range),
-                    low_price + (0.618 * swing_range),
-                    low_price + (0.786 * swing_range),
-                ]
-
-        fib_nearest_level = np.nan
-        fib_nearest_dist_atr = np.nan
-        fib_in_value_zone = 0
-        if fib_direction != 0:
-            finite_levels = [level for level in fib_levels if np.isfinite(level)]
-            if finite_levels and np.isfinite(close_value):
-                fib_nearest_level = min(finite_levels, key=lambda item: abs(item - close_value))
-            if np.isfinite(fib_nearest_level) and np.isfinite(atr_value) and atr_value != 0:
-                fib_nearest_dist_atr = (close_value - fib_nearest_level) / atr_value
-            fib_value_low, fib_value_high = sorted((fib_levels[1], fib_levels[3]))
-            if np.isfinite(close_value) and np.isfinite(fib_value_low) and np.isfinite(fib_value_high):
-                fib_in_value_zone = int(fib_value_low <= close_value <= fib_value_high)
-
-        out["fib_swing_direction"].append(int(fib_direction))
-        out["fib_anchor_low"].append(fib_anchor_low)
-        out["fib_anchor_high"].append(fib_anchor_high)
-        out["fib_level_236"].append(fib_levels[0])
-        out["fib_level_382"].append(fib_levels[1])
-        out["fib_level_500"].append(fib_levels[2])
-        out["fib_level_618"].append(fib_levels[3])
-        out["fib_level_786"].append(fib_levels[4])
-        out["fib_nearest_level"].append(fib_nearest_level)
-        out["fib_nearest_dist_atr"].append(fib_nearest_dist_atr)
-        out["fib_in_value_zone"].append(int(fib_in_value_zone))
-
-    return pd.DataFrame(out)
+            found = zone_index >= 0
+            if not found.any():
+                continue
+            target = rows[start:stop][found]
+            picked = zone_index[found]
+            state = selected[side]
+            state["found"][target] = True
+            state["mid"][target] = zones.mid()[picked]
+            state["low"][target] = zones.low[picked]
+            state["high"][target] = zones.high[picked]
+            state["touch_count"][target] = zones.touch_count[picked]
+            state["last_touch_index"][target] = zones.last_touch_index[picked]
+
+    support = _zone_output_columns(
+        side="support", close=close_values, prev_close=prev_close, atr=atr_values, **selected["support"]
+    )
+    resistance = _zone_output_columns(
+        side="resistance", close=close_values, prev_close=prev_close, atr=atr_values, **selected["resistance"]
+    )
+
+    support_mid = selected["support"]["mid"]
+    resistance_mid = selected["resistance"]["mid"]
+    has_band = selected["support"]["found"] & selected["resistance"]["found"] & (resistance_mid > support_mid)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zone_position = np.where(has_band, (close_values - support_mid) / (resistance_mid - support_mid), np.nan)
+
+    # Latest confirmed swing low/high as of each row (pivot bar index and price).
+    last_low_row = np.maximum.accumulate(np.where(has_low, rows, -1))
+    last_high_row = np.maximum.accumulate(np.where(has_high, rows, -1))
+    has_swing = (last_low_row >= 0) & (last_high_row >= 0)
+    low_price = np.where(last_low_row >= 0, confirmed_low[np.maximum(last_low_row, 0)], np.nan)
+    high_price = np.where(last_high_row >= 0, confirmed_high[np.maximum(last_high_row, 0)], np.nan)
+    rising = has_swing & (last_low_row < last_high_row) & (high_price > low_price)
+    falling = has_swing & (last_high_row < last_low_row) & (high_price > low_price)
+    fib_direction = np.where(rising, 1, np.where(falling, -1, 0)).astype("int64")
+    has_fib = fib_direction != 0
+
+    with np.errstate(invalid="ignore"):
+        swing_range = high_price - low_price
+        fib_levels = np.column_stack(
+            [
+                np.where(
+                    rising,
+                    high_price - (ratio * swing_range),
+                    np.where(falling, low_price + (ratio * swing_range), np.nan),
+                )
+                for ratio in _FIB_RATIOS
+            ]
+        )
+        finite_levels = np.isfinite(fib_levels)
+        level_distance = np.where(finite_levels, np.abs(fib_levels - close_values[:, None]), np.inf)
+    nearest_column = np.argmin(level_distance, axis=1)
+    has_nearest = has_fib & finite_levels.any(axis=1) & np.isfinite(close_values)
+    fib_nearest_level = np.where(has_nearest, fib_levels[rows, nearest_column], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fib_nearest_dist_atr = np.where(
+            np.isfinite(fib_nearest_level) & np.isfinite(atr_values) & (atr_values != 0),
+            (close_values - fib_nearest_level) / atr_values,
+            np.nan,
+        )
+    value_low = np.minimum(fib_levels[:, 1], fib_levels[:, 3])
+    value_high = np.maximum(fib_levels[:, 1], fib_levels[:, 3])
+    fib_in_value_zone = (
+        has_fib
+        & np.isfinite(close_values)
+        & np.isfinite(fib_levels[:, 1])
+        & np.isfinite(fib_levels[:, 3])
+        & (value_low <= close_values)
+        & (close_values <= value_high)
+    ).astype("int64")
+
+    columns: dict[str, np.ndarray] = {}
+    for side, values in (("support", support), ("resistance", resistance)):
+        for key in ("mid", "low", "high", "touches", "strength", "dist_atr"):
+            columns[f"sr_{side}_1_{key}"] = values[key]
+    columns["sr_in_support_1_zone"] = support["in_zone"]
+    columns["sr_in_resistance_1_zone"] = resistance["in_zone"]
+    columns["sr_breaks_above_resistance_1"] = resistance["break"]
+    columns["sr_breaks_below_support_1"] = support["break"]
+    columns["sr_zone_position"] = zone_position
+    columns["fib_swing_direction"] = fib_direction
+    columns["fib_anchor_low"] = np.where(has_fib, low_price, np.nan)
+    columns["fib_anchor_high"] = np.where(has_fib, high_price, np.nan)
+    for ratio_column, level_column in enumerate(("236", "382", "500", "618", "786")):
+        columns[f"fib_level_{level_column}"] = fib_levels[:, ratio_column]
+    columns["fib_nearest_level"] = fib_nearest_level
+    columns["fib_nearest_dist_atr"] = fib_nearest_dist_atr
+    columns["fib_in_value_zone"] = fib_in_value_zone
+    return pd.DataFrame({column: columns[column] for column in _STRUCTURE_COLUMNS})
+
+
+def _symbol_group_codes(symbol: pd.Series) -> np.ndarray:
+    """Integer group id per row for a frame already sorted by symbol (missing symbols form one group)."""
+
+    codes, _ = pd.factorize(symbol, use_na_sentinel=False)
+    return codes
 
 
 def add_market_structure_features(df: pd.DataFrame) -> pd.DataFrame:
     """Add Donchian, support/resistance, and Fibonacci features.
 
-    The function expects single-symbol daily data with an existing `atr_14d`
-    column so distance metrics remain normalized and comparable.
+    The function expects daily data with an existing `atr_14d` column so distance
+    metrics remain normalized and comparable. Multi-symbol input is handled per
+    symbol: Donchian windows are grouped, and zone tracking runs on each symbol's
+    contiguous slice.
     """
 
     out = df.copy()
@@ -358,16 +391,13 @@ def add_market_structure_features(df: pd.DataFrame) -> pd.DataFrame:
     for column in ["high", "low", "close", "atr_14d"]:
         out[column] = pd.to_numeric(out[column], errors="coerce")
 
-    symbols = out["symbol"].astype("string").str.strip().str.upper().replace("", pd.NA).dropna().unique().tolist()
-    if len(symbols) > 1:
-        raise ValueError(f"add_market_structure_features expects single-symbol input; received symbols={sorted(symbols)}")
-
     out = out.dropna(subset=["date"]).sort_values(["symbol", "date"]).reset_index(drop=True)
+    codes = _symbol_group_codes(out["symbol"])
     high = out["high"]
     low = out["low"]
     close = out["close"]
     atr = out["atr_14d"]
-    prev_close = close.shift(1)
+    prev_close = close.groupby(codes, sort=False).shift(1)
 
     for window in _DONCHIAN_WINDOWS:
         high_col = f"donchian_high_{window}d"
@@ -377,8 +407,10 @@ def add_market_structure_features(df: pd.DataFrame) -> pd.DataFrame:
         crosses_above_col = f"crosses_above_donchian_high_{window}d"
         crosses_below_col = f"crosses_below_donchian_low_{window}d"
 
-        out[high_col] = high.rolling(window=window, min_periods=window).max().shift(1)
-        out[low_col] = low.rolling(window=window, min_periods=window).min().shift(1)
+        rolling_high = high.groupby(codes, sort=False).rolling(window=window, min_periods=window).max().droplevel(0)
+        rolling_low = low.groupby(codes, sort=False).rolling(window=window, min_periods=window).min().droplevel(0)
+        out[high_col] = rolling_high.groupby(codes, sort=False).shift(1)
+        out[low_col] = rolling_low.groupby(codes, sort=False).shift(1)
         out[f"dist_donchian_high_{window}d_atr"] = _safe_div(out[high_col] - close, atr)
         out[f"dist_donchian_low_{window}d_atr"] = _safe_div(close - out[low_col], atr)
 
@@ -389,7 +421,22 @@ def add_market_structure_features(df: pd.DataFrame) -> pd.DataFrame:
         out[crosses_above_col] = (above & (prev_close <= out[high_col])).fillna(False).astype(int)
         out[crosses_below_col] = (below & (prev_close >= out[low_col])).fillna(False).astype(int)
 
-    structure = _build_structure_frame(high=high, low=low, close=close, atr=atr)
+    # Zone state carries across rows, so it is built per symbol over positional slices.
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    starts = [0, *bounds.tolist()]
+    stops = [*bounds.tolist(), len(out)]
+    structure = pd.concat(
+        [
+            _build_structure_frame(
+                high=high.iloc[start:stop],
+                low=low.iloc[start:stop],
+                close=close.iloc[start:stop],
+                atr=atr.iloc[start:stop],
+            )
+            for start, stop in zip(starts, stops)
+        ],
+        ignore_index=True,
+    )
     for column in structure.columns:
         out[column] = structure[column]
 
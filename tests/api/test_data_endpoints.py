@@ -1,3 +1,5 @@
+from datetime import date
+
 import pytest
 
 from api.endpoints import data as data_endpoints
@@ -16,6 +18,9 @@ async def test_data_endpoint_calls_service(monkeypatch):
         *,
         limit: int | None = None,
         sort_by_date: str | None = None,
+        columns: list[str] | None = None,
+        start_date=None,
+        end_date=None,
     ):
         calls.append((layer, domain, ticker, limit, sort_by_date))
         return [{"ok": True}]
@@ -51,6 +56,9 @@ async def test_bronze_endpoint_allows_missing_ticker_for_generic_domains(monkeyp
         *,
         limit: int | None = None,
         sort_by_date: str | None = None,
+        columns: list[str] | None = None,
+        start_date=None,
+        end_date=None,
     ):
         calls.append((layer, domain, ticker, limit, sort_by_date))
         return [{"ok": True}]
@@ -125,6 +133,9 @@ async def test_data_endpoint_normalizes_ticker_to_uppercase(monkeypatch):
         *,
         limit: int | None = None,
         sort_by_date: str | None = None,
+        columns: list[str] | None = None,
+        start_date=None,
+        end_date=None,
     ):
         calls.append((layer, domain, ticker, limit, sort_by_date))
         return [{"ok": True}]
@@ -150,6 +161,9 @@ async def test_data_endpoint_forwards_date_sort_and_limit(monkeypatch):
         *,
         limit: int | None = None,
         sort_by_date: str | None = None,
+        columns: list[str] | None = None,
+        start_date=None,
+        end_date=None,
     ):
         calls.append((layer, domain, ticker, limit, sort_by_date))
         return [{"ok": True}]
@@ -164,6 +178,28 @@ async def test_data_endpoint_forwards_date_sort_and_limit(monkeypatch):
     assert calls == [("silver", "market", "AAPL", 25, "desc")]
 
 
+@pytest.mark.asyncio
+async def test_data_endpoint_forwards_columns_and_date_range(monkeypatch):
+    calls = []
+
+    def fake_get_data(layer: str, domain: str, ticker: str | None = None, **kwargs):
+        calls.append((layer, domain, ticker, kwargs["columns"], kwargs["start_date"], kwargs["end_date"]))
+        return [{"ok": True}]
+
+    monkeypatch.setattr(data_endpoints.DataService, "get_data", fake_get_data)
+
+    app = create_app()
+    async with get_test_client(app) as client:
+        resp = await client.get(
+            "/api/data/gold/market?ticker=AAPL&columns=date,%20close&start_date=2026-01-02&end_date=2026-01-31"
+        )
+        bad_range = await client.get("/api/data/gold/market?ticker=AAPL&start_date=2026-02-01&end_date=2026-01-31")
+
+    assert resp.status_code == 200
+    assert calls == [("gold", "market", "AAPL", ["date", "close"], date(2026, 1, 2), date(2026, 1, 31))]
+    assert bad_range.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_data_endpoint_rejects_invalid_date_sort():
     app = create_app()
@@ -6,10 +6,11 @@ from core.pipeline import DataPaths
 
 
 def test_delta_nan_values_are_json_safe(monkeypatch):
+    monkeypatch.setattr(data_service_module.delta_core, "get_delta_schema_columns", lambda _container, _path: ["symbol", "eps"])
     monkeypatch.setattr(
         data_service_module.delta_core,
         "load_delta",
-        lambda _container, _path: pd.DataFrame([{"symbol": "AAPL", "eps": 1.23}, {"symbol": "AAPL", "eps": float("nan")}]),
+        lambda _container, _path, **_kwargs: pd.DataFrame([{"symbol": "AAPL", "eps": 1.23}, {"symbol": "AAPL", "eps": float("nan")}]),
     )
 
     rows = DataService.get_data("silver", "earnings", ticker="AAPL", limit=2)
@@ -19,10 +20,11 @@ def test_delta_nan_values_are_json_safe(monkeypatch):
 
 
 def test_delta_inf_values_are_json_safe(monkeypatch):
+    monkeypatch.setattr(data_service_module.delta_core, "get_delta_schema_columns", lambda _container, _path: ["symbol", "eps"])
     monkeypatch.setattr(
         data_service_module.delta_core,
         "load_delta",
-        lambda _container, _path: pd.DataFrame(
+        lambda _container, _path, **_kwargs: pd.DataFrame(
             [{"symbol": "AAPL", "eps": float("inf")}, {"symbol": "AAPL", "eps": float("-inf")}]
         ),
     )
@@ -67,21 +69,22 @@ def test_market_silver_alpha26_reads_bucket_and_filters_symbol(monkeypatch):
     monkeypatch.setattr(data_service_module.layer_bucketing, "is_silver_alpha26_mode", lambda: True)
     monkeypatch.setattr(data_service_module.layer_bucketing, "is_gold_alpha26_mode", lambda: False)
 
-    calls: list[str] = []
-
-    def fake_read_delta(_container: str, path: str, limit=None):
-        calls.append(path)
-        return [
-            {"symbol": "AAPL", "date": "2026-02-01", "close": 100.0},
-            {"symbol": "AMZN", "date": "2026-02-01", "close": 200.0},
-        ]
-
-    monkeypatch.setattr(DataService, "_read_delta", staticmethod(fake_read_delta))
+    path = DataPaths.get_silver_market_bucket_path("A")
+    data_service_module.delta_core.store_delta(
+        pd.DataFrame(
+            [
+                {"symbol": "AAPL", "date": pd.Timestamp("2026-02-01"), "close": 100.0},
+                {"symbol": "AMZN", "date": pd.Timestamp("2026-02-01"), "close": 200.0},
+            ]
+        ),
+        data_service_module.cfg.AZURE_CONTAINER_SILVER,
+        path,
+        mode="overwrite",
+    )
 
     rows = DataService.get_data("silver", "market", ticker="AAPL", limit=5)
 
-    assert rows == [{"symbol": "AAPL", "date": "2026-02-01", "close": 100.0}]
-    assert calls == [DataPaths.get_silver_market_bucket_path("A")]
+    assert rows == [{"symbol": "AAPL", "date": pd.Timestamp("2026-02-01"), "close": 100.0}]
 
 
 def test_finance_subdomain_reads_silver_alpha26_bucket(monkeypatch):
@@ -216,15 +219,19 @@ def test_gold_finance_regular_reads_unified_alpha26_bucket(monkeypatch):
 
 
 def test_market_sorts_by_date_desc_before_limit(monkeypatch):
-    def fake_read_delta(_container: str, _path: str, limit=None):
-        return [
-            {"symbol": "AAPL", "date": "2026-02-01", "close": 101.0},
-            {"symbol": "AAPL", "date": "2026-02-03", "close": 103.0},
-            {"symbol": "AAPL", "date": "invalid-date", "close": 999.0},
-            {"symbol": "AAPL", "date": "2026-02-02", "close": 102.0},
-        ]
-
-    monkeypatch.setattr(DataService, "_read_delta", staticmethod(fake_read_delta))
+    monkeypatch.setattr(data_service_module.delta_core, "get_delta_schema_columns", lambda _container, _path: ["symbol", "date", "close"])
+    monkeypatch.setattr(
+        data_service_module.delta_core,
+        "load_delta",
+        lambda _container, _path, **_kwargs: pd.DataFrame(
+            [
+                {"symbol": "AAPL", "date": "2026-02-01", "close": 101.0},
+                {"symbol": "AAPL", "date": "2026-02-03", "close": 103.0},
+                {"symbol": "AAPL", "date": "invalid-date", "close": 999.0},
+                {"symbol": "AAPL", "date": "2026-02-02", "close": 102.0},
+            ]
+        ),
+    )
 
     rows = DataService.get_data(
         "silver",
@@ -0,0 +1,108 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import api.data_service as data_service_module
+from api.data_service import DataService
+from core.pipeline import DataPaths
+
+
+def _write_gold_market_bucket() -> str:
+    path = DataPaths.get_gold_market_bucket_path("A")
+    container = data_service_module.cfg.AZURE_CONTAINER_GOLD
+    dates = pd.date_range("2026-01-01", periods=10, freq="D")
+    for index, symbol in enumerate(["AAPL", "ABNB", "AMZN"]):
+        frame = pd.DataFrame(
+            {
+                "date": dates,
+                "symbol": symbol,
+                "close": [float(100 * (index + 1) + day) for day in range(len(dates))],
+                "volume": [1_000.0] * len(dates),
+            }
+        )
+        data_service_module.delta_core.store_delta(frame, container, path, mode="overwrite" if index == 0 else "append")
+    return path
+
+
+@pytest.fixture
+def load_delta_calls(monkeypatch):
+    calls = []
+    original = data_service_module.delta_core.load_delta
+
+    def _spy(container, path, **kwargs):
+        calls.append(kwargs)
+        return original(container, path, **kwargs)
+
+    monkeypatch.setattr(data_service_module.delta_core, "load_delta", _spy)
+    return calls
+
+
+def test_single_ticker_read_pushes_symbol_date_and_columns_into_scan(load_delta_calls):
+    _write_gold_market_bucket()
+
+    rows = DataService.get_data(
+        "gold",
+        "market",
+        ticker="ABNB",
+        columns=["close"],
+        start_date=date(2026, 1, 3),
+        end_date=date(2026, 1, 5),
+        sort_by_date="desc",
+    )
+
+    assert [(row["date"], row["close"]) for row in rows] == [
+        (pd.Timestamp("2026-01-05"), 204.0),
+        (pd.Timestamp("2026-01-04"), 203.0),
+        (pd.Timestamp("2026-01-03"), 202.0),
+    ]
+    assert load_delta_calls == [
+        {
+            "columns": ["close", "date"],
+            "filters": [("symbol", "=", "ABNB"), ("date", ">=", date(2026, 1, 3)), ("date", "<=", date(2026, 1, 5))],
+        }
+    ]
+
+
+def test_single_ticker_read_applies_limit_without_sort(load_delta_calls):
+    _write_gold_market_bucket()
+
+    rows = DataService.get_data("gold", "market", ticker="AMZN", limit=2)
+
+    assert [row["close"] for row in rows] == [300.0, 301.0]
+    assert {row["symbol"] for row in rows} == {"AMZN"}
+    assert load_delta_calls[0]["columns"] is None
+
+
+def test_single_ticker_read_rejects_unknown_columns():
+    _write_gold_market_bucket()
+
+    with pytest.raises(ValueError, match="Unknown column"):
+        DataService.get_data("gold", "market", ticker="AAPL", columns=["close", "nope"])
+
+
+def test_single_ticker_read_filters_after_scan_when_predicate_fails(monkeypatch):
+    frame = pd.DataFrame(
+        [
+            {"symbol": "AAPL", "date": "2026-01-02", "close": 1.0},
+            {"symbol": "AAPL", "date": "2026-01-09", "close": 2.0},
+            {"symbol": "AMZN", "date": "2026-01-09", "close": 3.0},
+        ]
+    )
+    monkeypatch.setattr(data_service_module.delta_core, "get_delta_schema_columns", lambda _c, _p: list(frame.columns))
+    monkeypatch.setattr(
+        data_service_module.delta_core,
+        "load_delta",
+        lambda _c, _p, **kwargs: None if kwargs.get("filters") else frame,
+    )
+
+    rows = DataService.get_data("gold", "market", ticker="AAPL", start_date=date(2026, 1, 5))
+
+    assert rows == [{"symbol": "AAPL", "date": "2026-01-09", "close": 2.0}]
+
+
+def test_single_ticker_read_raises_not_found_for_missing_table(monkeypatch):
+    monkeypatch.setattr(data_service_module.delta_core, "get_delta_schema_columns", lambda _c, _p: None)
+
+    with pytest.raises(FileNotFoundError):
+        DataService.get_data("gold", "earnings", ticker="AAPL")
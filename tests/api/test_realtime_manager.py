@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from api.service.realtime import RealtimeManager
+
+
+class _FakeWebSocket:
+    def __init__(self, *, stall: bool = False, fail: bool = False) -> None:
+        self.sent: list[str] = []
+        self.closed_with: list[int] = []
+        self.stall = stall
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, text: str) -> None:
+        if self.fail:
+            raise RuntimeError("socket closed")
+        if self.stall:
+            await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with.append(code)
+
+
+async def _drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_stalled_client() -> None:
+    manager = RealtimeManager(send_queue_size=8)
+    fast = _FakeWebSocket()
+    slow = _FakeWebSocket(stall=True)
+    for ws in (fast, slow):
+        await manager.connect(ws)
+        await manager.subscribe(ws, ["runs"])
+
+    await asyncio.wait_for(manager.broadcast("runs", {"n": 1}), timeout=1)
+    await asyncio.wait_for(manager.broadcast("runs", {"n": 2}), timeout=1)
+    await _drain()
+
+    assert [json.loads(text)["data"]["n"] for text in fast.sent] == [1, 2]
+    assert slow.sent == []
+
+    slow.release.set()
+    await _drain()
+    assert slow.sent == fast.sent
+    assert json.loads(fast.sent[0]) == {"topic": "runs", "data": {"n": 1}}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_oldest_when_client_falls_behind() -> None:
+    manager = RealtimeManager(send_queue_size=2, slow_client_policy="drop_oldest")
+    slow = _FakeWebSocket(stall=True)
+    await manager.connect(slow)
+    await manager.subscribe(slow, ["runs"])
+
+    await manager.broadcast("runs", {"n": 0})
+    await _drain()  # writer picks up n=0 and stalls in send
+    for n in range(1, 5):
+        await manager.broadcast("runs", {"n": n})
+
+    slow.release.set()
+    await _drain()
+
+    assert [json.loads(text)["data"]["n"] for text in slow.sent] == [0, 3, 4]
+    assert slow in manager.active_connections
+
+
+@pytest.mark.asyncio
+async def test_broadcast_disconnects_slow_client_under_disconnect_policy() -> None:
+    manager = RealtimeManager(send_queue_size=2, slow_client_policy="disconnect")
+    slow = _FakeWebSocket(stall=True)
+    healthy = _FakeWebSocket()
+    for ws in (slow, healthy):
+        await manager.connect(ws)
+        await manager.subscribe(ws, ["runs"])
+
+    for n in range(4):
+        await manager.broadcast("runs", {"n": n})
+        await _drain()
+
+    assert slow not in manager.active_connections
+    assert manager.subscriptions["runs"] == {healthy}
+    assert slow.closed_with == [1013]
+    assert [json.loads(text)["data"]["n"] for text in healthy.sent] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_send_disconnects_client() -> None:
+    manager = RealtimeManager()
+    broken = _FakeWebSocket(fail=True)
+    await manager.connect(broken)
+    await manager.subscribe(broken, ["runs"])
+
+    await manager.broadcast("runs", {"n": 1})
+    await _drain()
+
+    assert broken not in manager.active_connections
+    assert not manager.has_subscribers("runs")
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_disconnects_stalled_client() -> None:
+    manager = RealtimeManager(send_timeout_seconds=0.01)
+    stalled = _FakeWebSocket(stall=True)
+    await manager.connect(stalled)
+    await manager.subscribe(stalled, ["runs"])
+
+    await manager.broadcast("runs", {"n": 1})
+    await asyncio.sleep(0.05)
+
+    assert stalled not in manager.active_connections
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_payload_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from api.service import realtime
+
+    calls: list[dict] = []
+    original = realtime._serialize
+
+    def _counting_serialize(payload):
+        calls.append(payload)
+        return original(payload)
+
+    monkeypatch.setattr(realtime, "_serialize", _counting_serialize)
+    manager = RealtimeManager()
+    clients = [_FakeWebSocket() for _ in range(5)]
+    for ws in clients:
+        await manager.connect(ws)
+        await manager.subscribe(ws, ["runs"])
+
+    await manager.broadcast("runs", {"n": 1})
+    await _drain()
+
+    assert len(calls) == 1
+    assert all(len(ws.sent) == 1 for ws in clients)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from api.service.run_updates import RUN_UPDATES_TOPIC, RunUpdateListener, decode_run_update
+
+
+class _RecordingRealtime:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, dict]] = []
+
+    async def broadcast(self, topic: str, message: dict) -> None:
+        self.messages.append((topic, message))
+
+
+class _FakeListenConnection:
+    def __init__(self, batches: list[list[str]], *, fail_after: bool = False) -> None:
+        self.batches = list(batches)
+        self.fail_after = fail_after
+        self.executed: list[str] = []
+        self.autocommit = False
+
+    def __enter__(self) -> "_FakeListenConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def execute(self, statement: str) -> None:
+        self.executed.append(statement)
+
+    def notifies(self, *, timeout: float):
+        if self.batches:
+            for payload in self.batches.pop(0):
+                yield SimpleNamespace(channel="run_updates", payload=payload)
+            return
+        if self.fail_after:
+            raise ConnectionError("server closed the connection")
+        time.sleep(timeout)
+
+
+def _payload(run_id: str, status: str, event: str = "UPDATE") -> str:
+    return json.dumps({"run_id": run_id, "status": status, "event": event})
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+def test_decode_run_update_rejects_malformed_payloads() -> None:
+    assert decode_run_update(_payload("abc", "running")) == {"run_id": "abc", "status": "running", "event": "UPDATE"}
+    assert decode_run_update("not json") is None
+    assert decode_run_update("[1, 2]") is None
+    assert decode_run_update(json.dumps({"status": "running"})) is None
+
+
+@pytest.mark.asyncio
+async def test_listener_coalesces_bursts_per_run() -> None:
+    realtime = _RecordingRealtime()
+    connection = _FakeListenConnection(
+        [
+            [
+                _payload("run-1", "queued", "INSERT"),
+                _payload("run-1", "running"),
+                "garbage",
+                _payload("run-2", "queued", "INSERT"),
+                _payload("run-1", "completed"),
+            ]
+        ]
+    )
+    listener = RunUpdateListener(
+        realtime,
+        "postgresql://test",
+        debounce_seconds=0.05,
+        poll_seconds=0.01,
+        connect_fn=lambda _dsn: connection,
+    )
+
+    task = asyncio.create_task(listener.run())
+    await _wait_for(lambda: len(realtime.messages) == 2)
+    listener.stop()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert connection.autocommit is True
+    assert connection.executed == ["LISTEN run_updates"]
+    assert realtime.messages == [
+        (RUN_UPDATES_TOPIC, {"type": "RUN_UPDATE", "payload": {"run_id": "run-1", "status": "completed", "event": "UPDATE"}}),
+        (RUN_UPDATES_TOPIC, {"type": "RUN_UPDATE", "payload": {"run_id": "run-2", "status": "queued", "event": "INSERT"}}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_after_connection_loss() -> None:
+    realtime = _RecordingRealtime()
+    connections = [
+        _FakeListenConnection([[_payload("run-1", "running")]], fail_after=True),
+        _FakeListenConnection([[_payload("run-1", "completed")]]),
+    ]
+    def _connect(_dsn: str) -> _FakeListenConnection:
+        if not connections:
+            raise ConnectionError("no more connections")
+        return connections.pop(0)
+
+    listener = RunUpdateListener(
+        realtime,
+        "postgresql://test",
+        debounce_seconds=0.0,
+        poll_seconds=0.01,
+        reconnect_min_seconds=0.01,
+        connect_fn=_connect,
+    )
+
+    task = asyncio.create_task(listener.run())
+    await _wait_for(lambda: len(realtime.messages) == 2)
+    listener.stop()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert listener.connections_opened == 2
+    assert [message["payload"]["status"] for _topic, message in realtime.messages] == ["running", "completed"]
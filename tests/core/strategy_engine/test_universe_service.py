@@ -2,18 +2,43 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pytest
+
 from core.strategy_engine.contracts import UniverseDefinition
 from core.strategy_engine import universe as universe_service
 
 
+class _FakeCursor:
+    def __init__(self, rows: list[tuple[str]]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[str, list[object]]] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        return None
+
+    def execute(self, query: str, params: list[object]) -> None:
+        self.executed.append((query, list(params)))
+
+    def fetchall(self) -> list[tuple[str]]:
+        return list(self.rows)
+
+
 @dataclass
 class _FakeConn:
+    cursor_obj: _FakeCursor
+
     def __enter__(self) -> "_FakeConn":
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
         return None
 
+    def cursor(self) -> _FakeCursor:
+        return self.cursor_obj
+
 
 def test_build_table_specs_keeps_only_gold_tables_with_symbol_and_as_of() -> None:
     specs = universe_service._build_table_specs(
@@ -135,22 +160,9 @@ def test_preview_gold_universe_combines_nested_and_or_groups(monkeypatch) -> Non
         ),
     }
 
+    cursor = _FakeCursor([("AAPL",), ("MSFT",)])
     monkeypatch.setattr(universe_service, "_load_gold_table_specs", lambda _dsn: specs)
-    monkeypatch.setattr(universe_service, "connect", lambda _dsn: _FakeConn())
-
-    condition_results = {
-        ("market_data", "close"): {"AAPL", "MSFT"},
-        ("finance_data", "f_score"): {"AAPL"},
-        ("earnings_data", "surprise_pct"): {"MSFT", "NVDA"},
-    }
-
-    monkeypatch.setattr(
-        universe_service,
-        "_fetch_condition_symbols",
-        lambda _conn, table_spec, condition: set(
-            condition_results[(table_spec.name, condition.column)]
-        ),
-    )
+    monkeypatch.setattr(universe_service, "connect", lambda _dsn: _FakeConn(cursor))
 
     preview = universe_service.preview_gold_universe("postgresql://test", universe, sample_limit=2)
 
@@ -159,6 +171,164 @@ def test_preview_gold_universe_combines_nested_and_or_groups(monkeypatch) -> Non
     assert preview["tablesUsed"] == ["earnings_data", "finance_data", "market_data"]
     assert preview["warnings"] == []
 
+    assert len(cursor.executed) == 1
+    query, params = cursor.executed[0]
+    assert params == [10.0, 7.0, 0.0]
+    assert query.count("SELECT DISTINCT ON") == 3
+    assert 'FROM "gold"."market_data"' in query
+    assert 'ORDER BY "symbol", "obs_date" DESC NULLS LAST' in query
+    assert "FROM latest_0 WHERE BTRIM(symbol) <> '' AND value_0 > %s) INTERSECT ((" in query
+    assert "FROM latest_1 WHERE BTRIM(symbol) <> '' AND value_0 >= %s) UNION (" in query
+
+
+def _letter_tree(node: object) -> dict[str, object]:
+    """Build a universe tree whose conditions are `market_data.<letter> gt 0`."""
+    if isinstance(node, str):
+        return {"kind": "condition", "table": "market_data", "column": node, "operator": "gt", "value": 0}
+    operator, clauses = node
+    return {"kind": "group", "operator": operator, "clauses": [_letter_tree(clause) for clause in clauses]}
+
+
+def _evaluate_set_expression(expression: str, sets: dict[str, set[str]]) -> set[str]:
+    """Evaluate a compiled set expression with Postgres precedence (INTERSECT binds tighter than UNION)."""
+    tokens = expression.replace("(", " ( ").replace(")", " ) ").split()
+    position = 0
+
+    def primary() -> set[str]:
+        nonlocal position
+        token = tokens[position]
+        position += 1
+        if token == "(":
+            value = union()
+            assert tokens[position] == ")"
+            position += 1
+            return value
+        return set(sets[token])
+
+    def intersect() -> set[str]:
+        nonlocal position
+        value = primary()
+        while position < len(tokens) and tokens[position] == "INTERSECT":
+            position += 1
+            value &= primary()
+        return value
+
+    def union() -> set[str]:
+        nonlocal position
+        value = intersect()
+        while position < len(tokens) and tokens[position] == "UNION":
+            position += 1
+            value |= intersect()
+        return value
+
+    result = union()
+    assert position == len(tokens)
+    return result
+
+
+def _evaluate_tree(node: object, sets: dict[str, set[str]]) -> set[str]:
+    if isinstance(node, str):
+        return set(sets[node])
+    operator, clauses = node
+    members = [_evaluate_tree(clause, sets) for clause in clauses]
+    return set.intersection(*members) if operator == "and" else set.union(*members)
+
+
+def _compile_letter_expression(tree: object) -> str:
+    root = UniverseDefinition.model_validate({"source": "postgres_gold", "root": _letter_tree(tree)}).root
+    compiler = universe_service._UniverseQueryCompiler({})
+    compiler._compile_condition = lambda condition: condition.column  # type: ignore[method-assign]
+    return compiler._compile_node(root)
+
+
+def test_compile_universe_query_parenthesises_mixed_nested_groups() -> None:
+    assert _compile_letter_expression(("and", [("or", ["a", "b"]), "c"])) == "((a) UNION (b)) INTERSECT (c)"
+    assert _compile_letter_expression(("or", [("and", ["a", "b"]), "c"])) == "((a) INTERSECT (b)) UNION (c)"
+    assert (
+        _compile_letter_expression(("and", [("or", ["a", ("and", ["b", "c"])]), "d"]))
+        == "((a) UNION ((b) INTERSECT (c))) INTERSECT (d)"
+    )
+
+
+@pytest.mark.parametrize(
+    "tree",
+    [
+        ("and", [("or", ["a", "b"]), "c"]),
+        ("or", ["a", ("and", ["b", "c"])]),
+        ("or", [("and", ["a", "b"]), ("and", ["c", "d"])]),
+        ("and", [("or", ["a", ("and", ["b", "c"])]), ("or", ["d", "e"])]),
+        ("or", [("and", [("or", ["a", "b"]), "c"]), ("and", ["d", ("or", ["e", "a"])])]),
+    ],
+)
+def test_compiled_universe_membership_matches_and_or_semantics(tree: object) -> None:
+    sets = {
+        "a": {"AAPL", "MSFT", "NVDA"},
+        "b": {"MSFT", "AMZN"},
+        "c": {"AAPL", "AMZN", "TSLA"},
+        "d": {"NVDA", "TSLA"},
+        "e": {"AMZN", "NVDA", "META"},
+    }
+
+    combined = _evaluate_set_expression(_compile_letter_expression(tree), sets)
+
+    assert combined == _evaluate_tree(tree, sets)
+
+
+def test_compile_universe_query_scans_each_table_once() -> None:
+    root = UniverseDefinition.model_validate(
+        {
+            "source": "postgres_gold",
+            "root": {
+                "kind": "group",
+                "operator": "or",
+                "clauses": [
+                    {"kind": "condition", "table": "market_data", "column": "close", "operator": "gt", "value": 10},
+                    {"kind": "condition", "table": "market_data", "column": "volume", "operator": "gte", "value": 5},
+                    {"kind": "condition", "table": "market_data", "column": "close", "operator": "lt", "value": 2},
+                ],
+            },
+        }
+    ).root
+    number_column = lambda name: universe_service.UniverseColumnSpec(  # noqa: E731
+        name=name,
+        data_type="double precision",
+        value_kind="number",
+        operators=universe_service._NUMBER_OPERATORS,
+    )
+    specs = {
+        "market_data": universe_service.UniverseTableSpec(
+            name="market_data",
+            as_of_column="date",
+            columns={"close": number_column("close"), "volume": number_column("volume")},
+        )
+    }
+
+    query, params, tables_used = universe_service._compile_universe_query(root, specs)
+
+    assert tables_used == {"market_data"}
+    assert params == [10.0, 5.0, 2.0]
+    assert query.count("SELECT DISTINCT ON") == 1
+    assert '"close" AS value_0, "volume" AS value_1' in query
+    assert query.count(" UNION ") == 2
+    assert "value_0 < %s" in query
+
+
+def test_compile_universe_query_rejects_unknown_column() -> None:
+    root = UniverseDefinition.model_validate(
+        {
+            "source": "postgres_gold",
+            "root": {
+                "kind": "group",
+                "operator": "and",
+                "clauses": [{"kind": "condition", "table": "market_data", "column": "nope", "operator": "gt", "value": 1}],
+            },
+        }
+    ).root
+    specs = {"market_data": universe_service.UniverseTableSpec(name="market_data", as_of_column="date", columns={})}
+
+    with pytest.raises(ValueError, match="Unknown column 'nope'"):
+        universe_service._compile_universe_query(root, specs)
+
 
 def test_preview_gold_universe_warns_when_no_symbols_match(monkeypatch) -> None:
     universe = UniverseDefinition.model_validate(
@@ -196,8 +366,7 @@ def test_preview_gold_universe_warns_when_no_symbols_match(monkeypatch) -> None:
     }
 
     monkeypatch.setattr(universe_service, "_load_gold_table_specs", lambda _dsn: specs)
-    monkeypatch.setattr(universe_service, "connect", lambda _dsn: _FakeConn())
-    monkeypatch.setattr(universe_service, "_fetch_condition_symbols", lambda *_args, **_kwargs: set())
+    monkeypatch.setattr(universe_service, "connect", lambda _dsn: _FakeConn(_FakeCursor([])))
 
     preview = universe_service.preview_gold_universe("postgresql://test", universe)
 
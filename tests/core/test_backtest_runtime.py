@@ -265,3 +265,173 @@ def test_regime_context_blocks_and_scales_exposure() -> None:
     assert transition["blocked"] is True
     assert transition["blocked_reason"] == "transition"
     assert transition["blocked_action"] == "skip_entries"
+
+
+class _PreloadCursor:
+    def __init__(self, conn: "_PreloadConnection") -> None:
+        self._conn = conn
+        self._rows: list[tuple] = []
+        self.description: list = []
+
+    def __enter__(self) -> "_PreloadCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        self._conn.executed.append((sql, list(params or [])))
+        if "COUNT(*)" in sql:
+            self._rows = [(self._conn.count,)]
+            return
+        self._rows = list(self._conn.rows)
+        self.description = [type("_Desc", (), {"name": name})() for name in ("as_of", "symbol", "return_20d")]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _PreloadConnection:
+    def __init__(self, rows: list[tuple], *, count: int) -> None:
+        self.rows = rows
+        self.count = count
+        self.executed: list[tuple[str, list]] = []
+
+    def __enter__(self) -> "_PreloadConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def cursor(self) -> _PreloadCursor:
+        return _PreloadCursor(self)
+
+
+def _slow_specs() -> dict[str, universe_service.UniverseTableSpec]:
+    return {
+        "finance_data": universe_service.UniverseTableSpec(
+            name="finance_data",
+            as_of_column="date",
+            as_of_kind="slower",
+            columns={
+                "return_20d": universe_service.UniverseColumnSpec(
+                    "return_20d", "double precision", "number", universe_service._NUMBER_OPERATORS
+                ),
+            },
+        )
+    }
+
+
+def test_run_frame_source_replays_slow_rows_as_of_each_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    from datetime import date
+
+    from core import backtest_runtime
+
+    rows = [
+        (date(2026, 2, 27), "AAPL", 0.1),
+        (date(2026, 2, 20), "MSFT", 0.2),
+        (date(2026, 3, 3), "AAPL", 0.3),
+        (date(2026, 3, 4), "NVDA", 0.4),
+        (date(2026, 3, 4), "MSFT", 0.5),
+    ]
+    conn = _PreloadConnection(rows, count=3)
+    monkeypatch.setattr(backtest_runtime, "connect", lambda _dsn: conn)
+    monkeypatch.setattr(
+        backtest_runtime,
+        "_load_slow_frames",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("per-session load should not run")),
+    )
+    session_dates = [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 4)]
+
+    source = backtest_runtime._RunFrameSource(
+        "postgresql://test",
+        table_specs=_slow_specs(),
+        required_columns={"finance_data": {"return_20d"}},
+        session_dates=session_dates,
+        bar_size=None,
+    )
+
+    observed: dict[date, list[tuple[str, float]]] = {}
+    for session_date in session_dates:
+        ts = datetime.combine(session_date, datetime.min.time(), tzinfo=timezone.utc)
+        _intraday, slow = source.frames_for_session(session_date, session_start=ts, session_end=ts, as_of_ts=ts)
+        frame = slow["finance_data"]
+        observed[session_date] = list(zip(frame["symbol"], frame["finance_data__return_20d"]))
+
+    assert observed == {
+        date(2026, 3, 2): [("AAPL", 0.1), ("MSFT", 0.2)],
+        date(2026, 3, 3): [("AAPL", 0.3), ("MSFT", 0.2)],
+        date(2026, 3, 4): [("AAPL", 0.3), ("MSFT", 0.5), ("NVDA", 0.4)],
+    }
+    data_queries = [sql for sql, _params in conn.executed if "COUNT(*)" not in sql]
+    assert len(data_queries) == 1
+    assert "UNION ALL" in data_queries[0]
+
+
+def test_run_frame_source_falls_back_to_per_session_loads_over_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    from datetime import date
+
+    from core import backtest_runtime
+
+    conn = _PreloadConnection([], count=10_000_000)
+    calls: list[datetime] = []
+    monkeypatch.setattr(backtest_runtime, "connect", lambda _dsn: conn)
+    monkeypatch.setattr(backtest_runtime, "_load_intraday_session_frames", lambda *args, **kwargs: {})
+    monkeypatch.setattr(
+        backtest_runtime,
+        "_load_slow_frames",
+        lambda *args, **kwargs: calls.append(kwargs["as_of_ts"]) or {"finance_data": pd.DataFrame()},
+    )
+    monkeypatch.setenv("BACKTEST_PRELOAD_MAX_MB", "1")
+
+    source = backtest_runtime._RunFrameSource(
+        "postgresql://test",
+        table_specs=_slow_specs(),
+        required_columns={"finance_data": {"return_20d"}},
+        session_dates=[date(2026, 3, 2)],
+        bar_size=None,
+    )
+    ts = datetime(2026, 3, 2, 21, 0, tzinfo=timezone.utc)
+    _intraday, slow = source.frames_for_session(date(2026, 3, 2), session_start=ts, session_end=ts, as_of_ts=ts)
+
+    assert calls == [ts]
+    assert list(slow) == ["finance_data"]
+    assert all("COUNT(*)" in sql for sql, _params in conn.executed)
+
+
+def test_session_snapshots_match_per_bar_filtering() -> None:
+    from core.backtest_runtime import _SessionSnapshots, _SnapshotRows
+
+    bars = [datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc), datetime(2026, 3, 2, 14, 35, tzinfo=timezone.utc)]
+    intraday = {
+        "market_data": pd.DataFrame(
+            {
+                "as_of": [pd.Timestamp(bars[0]), pd.Timestamp(bars[0]), pd.Timestamp(bars[1])],
+                "symbol": ["MSFT", "AAPL", "AAPL"],
+                "market_data__close": [400.0, 180.0, 181.0],
+            }
+        )
+    }
+    slow = {
+        "finance_data": pd.DataFrame({"as_of": [pd.Timestamp(bars[0])] * 2, "symbol": ["AAPL", "NVDA"], "finance_data__pe": [30.0, 60.0]}),
+        "earnings_data": pd.DataFrame({"symbol": ["MSFT"], "earnings_data__surprise": [0.1]}),
+    }
+
+    snapshots = _SessionSnapshots(intraday_frames=intraday, slow_frames=slow)
+    first = snapshots.snapshot(bars[0])
+    second = snapshots.snapshot(bars[1])
+
+    assert first["symbol"].tolist() == ["AAPL", "MSFT", "NVDA"]
+    assert list(first.columns) == ["symbol", "market_data__close", "finance_data__pe", "earnings_data__surprise", "date"]
+    assert first["market_data__close"].tolist()[:2] == [180.0, 400.0]
+    assert pd.isna(second.loc[second["symbol"] == "MSFT", "market_data__close"]).all()
+    assert second.loc[second["symbol"] == "AAPL", "market_data__close"].tolist() == [181.0]
+    assert (second["date"] == pd.Timestamp(bars[1])).all()
+
+    rows = _SnapshotRows(first)
+    assert rows.get("NVDA")["finance_data__pe"] == 60.0
+    assert rows.get("TSLA") is None
+    assert rows.get("NVDA") is rows.get("NVDA")
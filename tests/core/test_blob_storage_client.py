@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+
+import pandas as pd
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+
+from core.blob_storage import BlobStorageClient
+
+
+class _FakeBlobClient:
+    def __init__(self, container: "_FakeContainerClient", name: str) -> None:
+        self._container = container
+        self._name = name
+
+    def exists(self) -> bool:
+        self._container.calls.append(("exists", self._name))
+        return self._name in self._container.blobs
+
+    def download_blob(self, etag=None, match_condition=None):
+        self._container.calls.append(("get", self._name, etag))
+        if self._name not in self._container.blobs:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        data, current_etag = self._container.blobs[self._name]
+        if etag is not None and etag == current_etag:
+            raise ResourceNotModifiedError("Not modified")
+        return SimpleNamespace(readall=lambda: data, properties=SimpleNamespace(etag=current_etag))
+
+    def get_blob_properties(self):
+        self._container.calls.append(("head", self._name))
+        if self._name not in self._container.blobs:
+            raise ResourceNotFoundError("The specified blob does not exist.")
+        return SimpleNamespace(last_modified=pd.Timestamp("2026-01-05T00:00:00Z").to_pydatetime())
+
+    def upload_blob(self, data, overwrite=True):
+        payload = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        self._container.put(self._name, payload)
+
+
+class _FakeContainerClient:
+    def __init__(self) -> None:
+        self.blobs: dict[str, tuple[bytes, str]] = {}
+        self.calls: list[tuple] = []
+        self._version = 0
+
+    def put(self, name: str, data: bytes) -> None:
+        self._version += 1
+        self.blobs[name] = (data, f'"0x{self._version}"')
+
+    def get_blob_client(self, name: str) -> _FakeBlobClient:
+        return _FakeBlobClient(self, name)
+
+
+def _client(monkeypatch, *, read_cache_dir=None) -> tuple[BlobStorageClient, _FakeContainerClient]:
+    monkeypatch.delenv("BLOB_READ_CACHE_DIR", raising=False)
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test;AccountKey=a2V5;EndpointSuffix=core.windows.net",
+        container_name="common",
+        ensure_container_exists=False,
+        read_cache_dir=read_cache_dir,
+    )
+    fake = _FakeContainerClient()
+    client.container_client = fake
+    return client, fake
+
+
+def test_reads_issue_single_request_and_treat_404_as_missing(monkeypatch):
+    client, fake = _client(monkeypatch)
+    fake.put("lists/whitelist.csv", b"symbol\nAAPL\n")
+
+    df = client.read_csv("lists/whitelist.csv")
+    assert df["symbol"].tolist() == ["AAPL"]
+    assert client.read_csv("lists/missing.csv") is None
+    assert client.download_data("lists/missing.bin") is None
+    assert client.read_parquet("lists/missing.parquet") is None
+    assert client.get_last_modified("lists/missing.csv") is None
+    assert client.get_last_modified("lists/whitelist.csv") is not None
+
+    assert not any(call[0] == "exists" for call in fake.calls)
+    assert [call[0] for call in fake.calls] == ["get", "get", "get", "get", "head", "head"]
+
+
+def test_read_cache_revalidates_with_etag_and_serves_unchanged_blob_locally(monkeypatch, tmp_path):
+    client, fake = _client(monkeypatch, read_cache_dir=str(tmp_path))
+    buffer = io.BytesIO()
+    pd.DataFrame({"symbol": ["AAPL", "MSFT"]}).to_parquet(buffer, index=False)
+    fake.put("manifests/latest.parquet", buffer.getvalue())
+
+    first = client.read_parquet("manifests/latest.parquet")
+    second = client.read_parquet("manifests/latest.parquet")
+    assert first.equals(second)
+    assert fake.calls == [
+        ("get", "manifests/latest.parquet", None),
+        ("get", "manifests/latest.parquet", '"0x1"'),
+    ]
+
+    # A changed blob is downloaded again and replaces the cached copy.
+    fake.put("manifests/latest.parquet", b"new-bytes")
+    assert client.download_data("manifests/latest.parquet") == b"new-bytes"
+    assert client.download_data("manifests/latest.parquet") == b"new-bytes"
+    assert fake.calls[-1] == ("get", "manifests/latest.parquet", '"0x2"')
+
+
+def test_read_cache_drops_entries_for_deleted_and_rewritten_blobs(monkeypatch, tmp_path):
+    client, fake = _client(monkeypatch, read_cache_dir=str(tmp_path))
+    fake.put("watermarks/silver.json", b"{}")
+    assert client.download_data("watermarks/silver.json") == b"{}"
+    assert list((tmp_path / "common").iterdir())
+
+    client.upload_data("watermarks/silver.json", b'{"a": 1}')
+    assert not list((tmp_path / "common").iterdir())
+    assert client.download_data("watermarks/silver.json") == b'{"a": 1}'
+
+    del fake.blobs["watermarks/silver.json"]
+    assert client.download_data("watermarks/silver.json") is None
+    assert not list((tmp_path / "common").iterdir())
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from core.finance_asof import daily_asof_view
+from tasks.common.silver_contracts import coerce_to_naive_datetime
+
+
+def _reference_resample_daily_ffill(df: pd.DataFrame, *, extend_to: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Per-group reindex/ffill that silver used to store; the oracle for `daily_asof_view`."""
+    df = df.copy()
+    df["Date"] = coerce_to_naive_datetime(df["Date"])
+    df = df.dropna(subset=["Date"])
+
+    group_columns = [column for column in ("Symbol", "timeframe") if column in df.columns]
+    grouped_frames: list[pd.DataFrame] = []
+    for group_key, group_frame in df.groupby(group_columns, dropna=False, sort=True):
+        group = group_frame.sort_values(["Date"]).drop_duplicates(subset=["Date"], keep="last")
+        group = group.set_index("Date").sort_index()
+        end = max(group.index.max(), extend_to) if extend_to is not None else group.index.max()
+        full_range = pd.date_range(start=group.index.min(), end=end, freq="D", name="Date")
+        group_daily = group.reindex(full_range).ffill().reset_index()
+        for column, value in zip(group_columns, group_key):
+            group_daily[column] = value
+        grouped_frames.append(group_daily)
+    return pd.concat(grouped_frames, ignore_index=True)
+
+
+def _sparse_statements(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for symbol in ("AAPL", "MSFT", "ZZZ"):
+        for timeframe in ("quarterly", "annual"):
+            offsets = np.sort(rng.choice(900, size=int(rng.integers(1, 8)), replace=False))
+            for offset in offsets:
+                rows.append(
+                    {
+                        "date": pd.Timestamp("2023-01-01") + pd.Timedelta(days=int(offset)),
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "total_assets": float(rng.normal()) if rng.random() > 0.2 else np.nan,
+                        "current_assets": float(rng.normal()),
+                    }
+                )
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def test_daily_asof_view_matches_per_group_reindex_ffill() -> None:
+    sparse = _sparse_statements(4)
+    extend_to = pd.Timestamp("2025-09-30")
+
+    expected = _reference_resample_daily_ffill(
+        sparse.rename(columns={"date": "Date", "symbol": "Symbol"}),
+        extend_to=extend_to,
+    ).rename(columns={"Date": "date", "Symbol": "symbol"})
+    actual = daily_asof_view(sparse, extend_to=extend_to)
+
+    pd.testing.assert_frame_equal(actual, expected[list(actual.columns)])
+
+
+def test_daily_asof_view_keeps_dense_daily_rows_unchanged() -> None:
+    daily = daily_asof_view(_sparse_statements(9))
+
+    pd.testing.assert_frame_equal(daily_asof_view(daily), daily)
+
+
+def test_daily_asof_view_fills_each_column_from_its_latest_known_value() -> None:
+    sparse = pd.DataFrame(
+        {
+            "date": ["2024-03-31", "2024-04-02"],
+            "symbol": ["AAPL", "AAPL"],
+            "market_cap": [100.0, np.nan],
+            "pe_ratio": [10.0, 12.0],
+        }
+    )
+
+    out = daily_asof_view(sparse, extend_to=pd.Timestamp("2024-04-03"))
+
+    assert out["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-03-31", "2024-04-01", "2024-04-02", "2024-04-03"]
+    assert out["market_cap"].tolist() == [100.0, 100.0, 100.0, 100.0]
+    assert out["pe_ratio"].tolist() == [10.0, 10.0, 12.0, 12.0]
+
+
+def test_daily_asof_view_preserves_distinct_statement_timeframes() -> None:
+    source = pd.DataFrame(
+        [
+            {"date": "2024-03-31", "symbol": "AAPL", "timeframe": "annual", "total_assets": 1200.0},
+            {"date": "2024-03-31", "symbol": "AAPL", "timeframe": "quarterly", "total_assets": 1000.0},
+        ]
+    )
+
+    out = daily_asof_view(source, extend_to=pd.Timestamp("2024-04-02"))
+
+    last_day = out[out["date"] == pd.Timestamp("2024-04-02")]
+    assert set(out["timeframe"]) == {"annual", "quarterly"}
+    assert len(last_day) == 2
+    assert sorted(last_day["total_assets"].tolist()) == [1000.0, 1200.0]
+
+
+def test_daily_asof_view_handles_empty_and_undated_frames() -> None:
+    assert daily_asof_view(pd.DataFrame({"date": [None], "symbol": ["AAPL"]})).empty
+    undated = pd.DataFrame({"symbol": ["AAPL"]})
+    assert daily_asof_view(undated) is undated
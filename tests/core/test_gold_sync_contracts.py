@@ -243,6 +243,123 @@ def test_sync_gold_bucket_chunks_streams_multiple_prepared_frames(
     assert delete_params == (["AAPL", "MSFT", "OLD"],)
 
 
+def _sync_market_frame(
+    frame: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    prior_state: tuple[str, object] | None = None,
+) -> tuple[_FakeCursor, dict[str, list[tuple[object, ...]]], list[str]]:
+    fetchone_rows = [("off",), ("off",), (False,)]
+    if prior_state is not None:
+        fetchone_rows.append(prior_state)
+    cursor = _FakeCursor(fetchone_rows=fetchone_rows)
+    copied: dict[str, list[tuple[object, ...]]] = {}
+    messages: list[str] = []
+    monkeypatch.setattr(sync, "connect", lambda _dsn: _FakeConnection(cursor))
+    monkeypatch.setattr(sync.mdc, "write_line", lambda msg: messages.append(str(msg)))
+    monkeypatch.setattr(
+        sync,
+        "copy_rows",
+        lambda cur, *, table, columns, rows: copied.setdefault(table, []).extend(list(rows)),
+    )
+
+    result = sync.sync_gold_bucket(
+        domain="market",
+        bucket="A",
+        frame=frame,
+        scope_symbols=["AAPL", "AMZN", "OLD"],
+        source_commit=123.0,
+        dsn="postgresql://test",
+    )
+    assert result.status == "ok"
+    return cursor, copied, messages
+
+
+def _recorded_symbol_watermarks(cursor: _FakeCursor) -> str:
+    _sql, params = next(
+        (sql, params) for sql, params in cursor.executed if "INSERT INTO core.gold_sync_state" in sql
+    )
+    return params[-1]
+
+
+def test_sync_gold_bucket_stages_only_new_dates_for_symbols_with_unchanged_history(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    history = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2026-01-02", "2026-01-05", "2026-01-02", "2026-01-05"]),
+            "symbol": ["AAPL", "AAPL", "AMZN", "AMZN"],
+            "close": [100.0, 101.0, 200.0, 201.0],
+        }
+    )
+    first_cursor, first_copied, first_messages = _sync_market_frame(history, monkeypatch)
+    watermarks = _recorded_symbol_watermarks(first_cursor)
+
+    assert len(first_copied["pg_temp.gold_sync_stage"]) == 4
+    assert any("sync_mode=full" in message for message in first_messages)
+
+    updated = pd.concat(
+        [
+            history.assign(close=[100.0, 101.0, 200.0, 205.0]),
+            pd.DataFrame(
+                {
+                    "date": pd.to_datetime(["2026-01-06", "2026-01-06"]),
+                    "symbol": ["AAPL", "AMZN"],
+                    "close": [102.0, 206.0],
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    cursor, copied, messages = _sync_market_frame(updated, monkeypatch, prior_state=("success", watermarks))
+
+    staged = sorted((row[1], row[0]) for row in copied["pg_temp.gold_sync_stage"])
+    assert staged == [
+        ("AAPL", date(2026, 1, 6)),
+        ("AMZN", date(2026, 1, 2)),
+        ("AMZN", date(2026, 1, 5)),
+        ("AMZN", date(2026, 1, 6)),
+    ]
+    assert sorted(copied["pg_temp.gold_sync_window"]) == [
+        ("AAPL", date(2026, 1, 5)),
+        ("AMZN", None),
+        ("OLD", None),
+    ]
+    delete_sql = next(sql for sql, _params in cursor.executed if "DELETE FROM gold.market_data AS target" in sql)
+    assert "pg_temp.gold_sync_window AS sync_window" in delete_sql
+    assert any(
+        "staged_rows=4" in message and "sync_mode=incremental incremental_symbols=1 row_count=6" in message
+        for message in messages
+    )
+    assert sync._parse_symbol_watermarks(_recorded_symbol_watermarks(cursor))["AAPL"].row_count == 3
+
+
+@pytest.mark.parametrize(
+    "prior_state",
+    [
+        ("failed", None),
+        ("success", None),
+        ("success", "not json"),
+        ("success", '{"version": 999, "symbols": {}}'),
+    ],
+)
+def test_sync_gold_bucket_falls_back_to_full_resync_without_valid_watermarks(
+    monkeypatch: pytest.MonkeyPatch,
+    prior_state: tuple[str, object],
+) -> None:
+    frame = pd.DataFrame({"date": pd.to_datetime(["2026-01-02"]), "symbol": ["AAPL"], "close": [100.0]})
+
+    cursor, copied, messages = _sync_market_frame(frame, monkeypatch, prior_state=prior_state)
+
+    assert len(copied["pg_temp.gold_sync_stage"]) == 1
+    assert "pg_temp.gold_sync_window" not in copied
+    _delete_sql, delete_params = next(
+        (sql, params) for sql, params in cursor.executed if "DELETE FROM gold.market_data AS target" in sql
+    )
+    assert delete_params == (["AAPL", "AMZN", "OLD"],)
+    assert any("sync_mode=full" in message for message in messages)
+
+
 def test_sync_gold_bucket_records_failure_state(monkeypatch: pytest.MonkeyPatch) -> None:
     recorded: dict[str, object] = {}
     monkeypatch.setattr(sync, "connect", lambda _dsn: _FakeConnection(_FakeCursor(fail_on_execute=True)))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from core.postgres import copy_frame, copy_query_frame
+
+
+class _RecordingCopy:
+    def __init__(self, blocks: list[bytes] | None = None) -> None:
+        self.written: list[bytes] = []
+        self.blocks = blocks or []
+
+    def __enter__(self) -> "_RecordingCopy":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def write(self, data: bytes) -> None:
+        self.written.append(bytes(data))
+
+
+class _CopyCursor:
+    def __init__(self, copy: _RecordingCopy) -> None:
+        self._copy = copy
+        self.statements: list[tuple[str, object]] = []
+
+    def copy(self, statement: str, params=None) -> _RecordingCopy:
+        self.statements.append((statement, params))
+        return self._copy
+
+
+def test_copy_frame_streams_csv_chunks_with_nulls() -> None:
+    copy = _RecordingCopy()
+    cursor = _CopyCursor(copy)
+    frame = pd.DataFrame(
+        {
+            "date": [date(2026, 3, 6), date(2026, 3, 7), date(2026, 3, 9)],
+            "symbol": ["AAPL", "BRK,B", "MSFT"],
+            "score": [0.1, np.nan, 1 / 3],
+        }
+    )
+
+    copy_frame(cursor, table='"platinum"."ranks"', frame=frame, columns=("date", "symbol", "score"), chunk_rows=2)
+
+    assert cursor.statements == [('COPY "platinum"."ranks" (date, symbol, score) FROM STDIN (FORMAT CSV)', None)]
+    assert len(copy.written) == 2
+    assert b"".join(copy.written).decode().splitlines() == [
+        "2026-03-06,AAPL,0.1",
+        '2026-03-07,"BRK,B",',
+        f"2026-03-09,MSFT,{1 / 3!r}",
+    ]
+
+
+def test_copy_query_frame_parses_streamed_csv() -> None:
+    payload = b"date,symbol,close\n2026-03-06,NA,1.5\n2026-03-07,AAPL,\n"
+    cursor = _CopyCursor(_RecordingCopy([payload[:7], payload[7:]]))
+
+    frame = copy_query_frame(cursor, "SELECT 1", (date(2026, 3, 6),), text_columns=("symbol",))
+
+    assert cursor.statements == [("COPY (SELECT 1) TO STDOUT (FORMAT CSV, HEADER)", (date(2026, 3, 6),))]
+    assert frame["symbol"].tolist() == ["NA", "AAPL"]
+    assert frame["close"].iloc[0] == 1.5
+    assert pd.isna(frame["close"].iloc[1])
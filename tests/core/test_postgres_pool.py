@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core import postgres
+
+
+_IDLE = "idle"
+_INTRANS = "intrans"
+
+
+class _FakeConnection:
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.closed = False
+        self.broken = False
+        self.info = SimpleNamespace(transaction_status=_IDLE)
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed: list[str] = []
+        self.fail_execute = False
+        self.autocommit = False
+        self.advisory_locks: set[int] = set()
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.info.transaction_status = _IDLE
+
+    def execute(self, sql: str) -> None:
+        if self.fail_execute:
+            raise RuntimeError("server closed the connection")
+        self.executed.append(sql)
+        if sql == postgres._SESSION_RESET_SQL:
+            assert self.autocommit is True
+            self.advisory_locks.clear()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakePsycopg:
+    def __init__(self) -> None:
+        self.opened: list[_FakeConnection] = []
+        self.pq = SimpleNamespace(TransactionStatus=SimpleNamespace(IDLE=_IDLE))
+
+    def connect(self, _dsn: str) -> _FakeConnection:
+        conn = _FakeConnection(len(self.opened) + 1)
+        self.opened.append(conn)
+        return conn
+
+
+@pytest.fixture
+def fake_psycopg(monkeypatch: pytest.MonkeyPatch) -> _FakePsycopg:
+    fake = _FakePsycopg()
+    monkeypatch.setattr(postgres, "_import_psycopg", lambda: fake)
+    for name in (
+        "POSTGRES_POOL_MIN_SIZE",
+        "POSTGRES_POOL_MAX_SIZE",
+        "POSTGRES_POOL_TIMEOUT_SECONDS",
+        "POSTGRES_POOL_MAX_IDLE_SECONDS",
+        "POSTGRES_POOL_HEALTH_CHECK_AFTER_SECONDS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    postgres.close_pools()
+    yield fake
+    postgres.close_pools()
+
+
+def test_connect_reuses_pooled_connection_and_commits_on_exit(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://db") as first:
+        pass
+    with postgres.connect("postgresql://db") as second:
+        pass
+
+    assert first is second
+    assert len(fake_psycopg.opened) == 1
+    assert first.commits == 2
+    assert first.closed is False
+    assert postgres.get_pool("postgresql://db").stats() == {"size": 1, "idle": 1, "max_size": 10}
+
+
+def test_connect_rolls_back_on_error_and_keeps_connection(fake_psycopg: _FakePsycopg) -> None:
+    with pytest.raises(ValueError):
+        with postgres.connect("postgresql://db") as conn:
+            conn.info.transaction_status = _INTRANS
+            raise ValueError("boom")
+
+    assert conn.rollbacks == 1
+    assert conn.commits == 0
+    with postgres.connect("postgresql://db") as again:
+        assert again is conn
+
+
+def test_pool_discards_broken_and_in_transaction_connections(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://db") as conn:
+        conn.broken = True
+    with postgres.connect("postgresql://db") as replacement:
+        pass
+
+    assert replacement is not conn
+    assert conn.closed is True
+    assert postgres.get_pool("postgresql://db").stats()["size"] == 1
+
+
+def test_pool_pings_stale_idle_connections_before_reuse(
+    fake_psycopg: _FakePsycopg,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("POSTGRES_POOL_HEALTH_CHECK_AFTER_SECONDS", "0")
+    with postgres.connect("postgresql://db") as conn:
+        pass
+    with postgres.connect("postgresql://db") as reused:
+        pass
+    assert reused is conn
+    assert conn.executed == [postgres._SESSION_RESET_SQL, "SELECT 1", postgres._SESSION_RESET_SQL]
+
+    conn.fail_execute = True
+    with postgres.connect("postgresql://db") as replacement:
+        pass
+    assert replacement is not conn
+    assert conn.closed is True
+
+
+def test_pool_releases_advisory_locks_left_by_a_failed_unlock(fake_psycopg: _FakePsycopg) -> None:
+    with pytest.raises(RuntimeError, match="current transaction is aborted"):
+        with postgres.connect("postgresql://db") as conn:
+            conn.advisory_locks.add(42)
+            conn.info.transaction_status = _INTRANS
+            raise RuntimeError("current transaction is aborted; pg_advisory_unlock failed")
+
+    assert conn.rollbacks == 1
+    assert conn.advisory_locks == set()
+    assert conn.executed[-1] == postgres._SESSION_RESET_SQL
+    assert conn.autocommit is False
+    with postgres.connect("postgresql://db") as again:
+        assert again is conn
+
+
+def test_pool_closes_connection_when_session_reset_fails(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://db") as conn:
+        conn.advisory_locks.add(42)
+        conn.fail_execute = True
+
+    assert conn.closed is True
+    assert postgres.get_pool("postgresql://db").stats() == {"size": 0, "idle": 0, "max_size": 10}
+    with postgres.connect("postgresql://db") as replacement:
+        assert replacement is not conn
+
+
+def test_pool_is_keyed_by_dsn(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://a") as conn_a:
+        pass
+    with postgres.connect("postgresql://b") as conn_b:
+        pass
+
+    assert conn_a is not conn_b
+    assert postgres.get_pool("postgresql://a") is not postgres.get_pool("postgresql://b")
+
+
+def test_pool_blocks_at_max_size_and_times_out(
+    fake_psycopg: _FakePsycopg,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "1")
+    monkeypatch.setenv("POSTGRES_POOL_TIMEOUT_SECONDS", "0.05")
+
+    with postgres.connect("postgresql://db"):
+        with pytest.raises(postgres.PostgresError, match="Timed out"):
+            with postgres.connect("postgresql://db"):
+                pass
+
+    assert len(fake_psycopg.opened) == 1
+
+
+def test_pool_hands_released_connection_to_waiting_thread(
+    fake_psycopg: _FakePsycopg,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "1")
+    monkeypatch.setenv("POSTGRES_POOL_TIMEOUT_SECONDS", "5")
+    acquired = threading.Event()
+    received: list[_FakeConnection] = []
+
+    def _waiter() -> None:
+        acquired.wait()
+        with postgres.connect("postgresql://db") as conn:
+            received.append(conn)
+
+    worker = threading.Thread(target=_waiter)
+    worker.start()
+    with postgres.connect("postgresql://db") as held:
+        acquired.set()
+    worker.join(timeout=5)
+
+    assert received == [held]
+    assert len(fake_psycopg.opened) == 1
+
+
+def test_connect_bypasses_pool_when_disabled(
+    fake_psycopg: _FakePsycopg,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    direct = postgres.connect("postgresql://db", pooled=False)
+    assert isinstance(direct, _FakeConnection)
+
+    monkeypatch.setenv("POSTGRES_POOL_MAX_SIZE", "0")
+    assert isinstance(postgres.connect("postgresql://db"), _FakeConnection)
+
+
+def test_pools_reset_in_forked_child(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://db") as conn:
+        pass
+    parent_pool = postgres.get_pool("postgresql://db")
+
+    postgres._reset_pools_after_fork()
+
+    assert conn in postgres._FORK_ORPHANS
+    assert conn.closed is False
+    assert postgres.get_pool("postgresql://db") is not parent_pool
+    postgres._FORK_ORPHANS.remove(conn)
+
+
+def test_close_pools_closes_idle_connections(fake_psycopg: _FakePsycopg) -> None:
+    with postgres.connect("postgresql://db") as conn:
+        pass
+
+    postgres.close_pools()
+
+    assert conn.closed is True
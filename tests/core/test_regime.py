@@ -4,7 +4,15 @@ from datetime import datetime, timezone
 
 import pandas as pd
 
-from core.regime import build_regime_outputs, classify_regime_row, compute_curve_state, compute_trend_state
+from core.regime import (
+    build_regime_outputs,
+    classify_regime_row,
+    compute_curve_state,
+    compute_curve_states,
+    compute_threshold_streak,
+    compute_trend_state,
+    compute_trend_states,
+)
 
 
 def test_compute_states_use_deadbands() -> None:
@@ -103,3 +111,56 @@ def test_build_regime_outputs_uses_next_input_date_as_effective_date() -> None:
     assert history["effective_from_date"].tolist()[0].isoformat() == "2026-03-03"
     assert latest.iloc[0]["as_of_date"].isoformat() == "2026-03-03"
     assert transitions["new_regime_code"].tolist() == ["trending_bull", "trending_bear"]
+
+
+def test_vectorized_states_match_scalar_states() -> None:
+    returns = pd.Series([0.03, -0.03, 0.01, None, 0.02, -0.02])
+    slopes = pd.Series([0.6, -0.6, 0.1, None, 0.5, -0.5])
+
+    assert compute_trend_states(returns).tolist() == [compute_trend_state(value) for value in returns]
+    assert compute_curve_states(slopes).tolist() == [compute_curve_state(value) for value in slopes]
+
+
+def test_compute_threshold_streak_resets_on_missing_and_low_values() -> None:
+    values = pd.Series([33.0, 34.0, None, 35.0, 32.0, 40.0, 41.0, 42.0])
+
+    assert compute_threshold_streak(values, threshold=32.0).tolist() == [1, 2, 0, 1, 0, 1, 2, 3]
+
+
+def test_build_regime_outputs_matches_row_wise_classification() -> None:
+    rows = [
+        {"return_20d": 0.0, "vix_slope": 0.0, "rvol_10d_ann": 26.5, "vix_spot_close": 24.0},
+        {"return_20d": -0.04, "vix_slope": -0.2, "rvol_10d_ann": 20.0, "vix_spot_close": 26.0},
+        {"return_20d": -0.04, "vix_slope": -0.2, "rvol_10d_ann": 26.0, "vix_spot_close": 27.0},
+        {"return_20d": -0.05, "vix_slope": -1.2, "rvol_10d_ann": 31.0, "vix_spot_close": 34.0},
+        {"return_20d": -0.05, "vix_slope": -1.2, "rvol_10d_ann": 33.0, "vix_spot_close": 36.0},
+        {"return_20d": None, "vix_slope": 0.7, "rvol_10d_ann": 12.0, "vix_spot_close": 18.0},
+        {"return_20d": 0.04, "vix_slope": 0.7, "rvol_10d_ann": 12.0, "vix_spot_close": 18.0},
+        {"return_20d": 0.0, "vix_slope": 0.7, "rvol_10d_ann": 12.0, "vix_spot_close": 17.0},
+        {"return_20d": 0.0, "vix_slope": 0.7, "rvol_10d_ann": 25.0, "vix_spot_close": 22.0},
+    ]
+    inputs = pd.DataFrame(rows)
+    inputs["as_of_date"] = pd.bdate_range("2026-03-02", periods=len(rows)).strftime("%Y-%m-%d")
+    inputs["vix3m_close"] = inputs["vix_spot_close"] + inputs["vix_slope"]
+    inputs["vix_gt_32_streak"] = compute_threshold_streak(inputs["vix_spot_close"], threshold=32.0)
+    inputs["inputs_complete_flag"] = inputs[["return_20d", "rvol_10d_ann", "vix_spot_close"]].notna().all(axis=1)
+
+    history, _latest, transitions = build_regime_outputs(
+        inputs,
+        model_name="default-regime",
+        model_version=1,
+        computed_at=datetime(2026, 3, 20, tzinfo=timezone.utc),
+    )
+
+    expected = []
+    prev_confirmed = None
+    for row in inputs.to_dict("records"):
+        classification = classify_regime_row(row, prev_confirmed_regime=prev_confirmed)
+        if classification["regime_status"] == "confirmed":
+            prev_confirmed = classification["regime_code"]
+        expected.append(classification)
+
+    for column in ("regime_code", "regime_status", "matched_rule_id", "halt_flag", "halt_reason", "trend_state", "curve_state"):
+        assert history[column].tolist() == [item[column] for item in expected], column
+    assert transitions["prior_regime_code"].tolist() == [None, "trending_bear", "high_vol", "trending_bull"]
+    assert transitions["new_regime_code"].tolist() == ["trending_bear", "high_vol", "trending_bull", "choppy_mean_reversion"]
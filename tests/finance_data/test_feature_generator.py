@@ -134,3 +134,36 @@ def test_preflight_reports_missing_piotroski_inputs() -> None:
     preflight = _preflight_feature_schema(df)
 
     assert any("shares_outstanding" in item for item in preflight["missing_requirements"])
+
+
+def test_coerce_numeric_matches_scalar_parser_on_fuzzed_values() -> None:
+    from decimal import Decimal
+
+    from tasks.finance_data.gold_finance_data import _coerce_numeric, _parse_human_number
+
+    rng = np.random.default_rng(7)
+    numbers = ["0", "1", "12.5", ".5", "1.", "1,234.56", "-3", "+4.25", "1e5", "1_000", "inf", "-inf", "nan", "abc", ""]
+    suffixes = ["", "k", "K", "m", "B", "t", "x", " M"]
+    values = []
+    for _ in range(2_000):
+        text = f"{rng.choice(numbers)}{rng.choice(suffixes)}"
+        if rng.random() < 0.3:
+            text = f"{text}%" if rng.random() < 0.5 else f"{text} %"
+        if rng.random() < 0.3:
+            text = f"( {text} )"
+        if rng.random() < 0.3:
+            text = f"  {text}\t"
+        values.append(text)
+    values += ["N/A", "none", "--", "-", "NA", "()", "(%)", "%", None, np.nan, pd.NA, pd.NaT, True, 7, np.int64(3)]
+    values += [np.float32(1.5), Decimal("2.5"), Decimal("NaN"), ["1"], "٣k"]
+    series = pd.Series(values, index=np.arange(len(values)) * 2, name="Total Revenue", dtype=object)
+
+    expected = series.apply(_parse_human_number).astype("float64")
+
+    pd.testing.assert_series_equal(_coerce_numeric(series), expected, check_exact=True)
+    numeric = pd.Series([1, 2, None], dtype="Int64", name="Shares Outstanding")
+    pd.testing.assert_series_equal(
+        _coerce_numeric(numeric),
+        numeric.astype(object).apply(_parse_human_number).astype("float64"),
+        check_exact=True,
+    )
@@ -192,6 +192,7 @@ def test_run_alpha26_finance_gold_projects_optional_valuation_metrics(monkeypatc
         lambda _container, path: 1 if "finance-data/" in path else None,
     )
     monkeypatch.setattr(delta_core, "get_delta_schema_columns", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(gold_finance_data, "utc_today", lambda: pd.Timestamp("2024-01-03"))
 
     date_value = pd.Timestamp("2024-01-01")
     ticker = "AAPL"
@@ -306,6 +307,9 @@ def test_run_alpha26_finance_gold_projects_optional_valuation_metrics(monkeypatc
     assert "pe_ratio" in list(captured["merged"].columns)
     assert "price_to_book" in list(captured["merged"].columns)
     assert "current_ratio" in list(captured["merged"].columns)
+    assert captured["merged"]["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert captured["merged"]["market_cap"].tolist() == [1_000_000.0] * 3
+    assert captured["merged"]["total_assets"].tolist() == [1_000.0] * 3
     assert captured["path"] == target_path
     assert captured["mode"] == "overwrite"
     assert list(captured["df"].columns) == EXPECTED_GOLD_FINANCE_COLUMNS
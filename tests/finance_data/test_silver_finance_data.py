@@ -210,21 +210,6 @@ def test_read_finance_json_rejects_unsupported_payload() -> None:
         )
 
 
-def test_resample_daily_ffill_preserves_distinct_statement_timeframes() -> None:
-    source = pd.DataFrame(
-        [
-            {"Date": "2024-03-31", "Symbol": "AAPL", "timeframe": "annual", "total_assets": 1200.0},
-            {"Date": "2024-03-31", "Symbol": "AAPL", "timeframe": "quarterly", "total_assets": 1000.0},
-        ]
-    )
-
-    out = silver.resample_daily_ffill(source, extend_to=pd.Timestamp("2024-04-02"))
-
-    assert set(out["timeframe"]) == {"annual", "quarterly"}
-    assert len(out[out["Date"] == pd.Timestamp("2024-04-02")]) == 2
-    assert sorted(out[out["Date"] == pd.Timestamp("2024-04-02")]["total_assets"].tolist()) == [1000.0, 1200.0]
-
-
 def test_process_alpha26_bucket_blob_processes_valuation_rows_into_valuation_bucket(monkeypatch) -> None:
     blob_name = "finance-data/buckets/A.parquet"
     blob = {
@@ -263,7 +248,6 @@ def test_process_alpha26_bucket_blob_processes_valuation_rows_into_valuation_buc
 
     results = silver.process_alpha26_bucket_blob(
         blob,
-        desired_end=pd.Timestamp("2026-03-04"),
         backfill_start=None,
         watermarks=watermarks,
         persist=False,
@@ -276,6 +260,51 @@ def test_process_alpha26_bucket_blob_processes_valuation_rows_into_valuation_buc
     assert blob_name in watermarks
 
 
+def test_process_alpha26_bucket_blob_stages_statement_rows_at_report_dates(monkeypatch) -> None:
+    blob = {
+        "name": "finance-data/buckets/A.parquet",
+        "etag": "etag-a",
+        "last_modified": datetime(2026, 3, 4, 1, 0, tzinfo=timezone.utc),
+    }
+    bucket_df = pd.DataFrame(
+        [
+            {
+                "symbol": "AAPL",
+                "report_type": "balance_sheet",
+                "payload_json": json.dumps(
+                    {
+                        "status": "OK",
+                        "results": [
+                            {"period_end": "2025-06-30", "timeframe": "quarterly", "total_assets": 1000.0},
+                            {"period_end": "2025-09-30", "timeframe": "quarterly", "total_assets": 1100.0},
+                        ],
+                    }
+                ),
+            }
+        ]
+    )
+    staged: dict[tuple[str, str], list[pd.DataFrame]] = {}
+
+    monkeypatch.setattr(
+        silver.mdc,
+        "read_raw_bytes",
+        lambda _name, client=None: bucket_df.to_parquet(index=False),
+    )
+
+    results = silver.process_alpha26_bucket_blob(
+        blob,
+        backfill_start=None,
+        watermarks={},
+        persist=False,
+        alpha26_bucket_frames=staged,
+    )
+
+    assert [result.status for result in results] == ["ok"]
+    staged_frame = pd.concat(staged[("balance_sheet", "A")], ignore_index=True)
+    assert staged_frame["date"].dt.strftime("%Y-%m-%d").tolist() == ["2025-06-30", "2025-09-30"]
+    assert staged_frame["total_assets"].tolist() == [1000.0, 1100.0]
+
+
 def test_process_alpha26_bucket_blob_skips_empty_valuation_rows(monkeypatch) -> None:
     blob_name = "finance-data/buckets/A.parquet"
     blob = {
@@ -302,7 +331,6 @@ def test_process_alpha26_bucket_blob_skips_empty_valuation_rows(monkeypatch) ->
 
     results = silver.process_alpha26_bucket_blob(
         blob,
-        desired_end=pd.Timestamp("2026-03-04"),
         backfill_start=None,
         watermarks=watermarks,
         persist=False,
@@ -340,7 +368,6 @@ def test_process_alpha26_bucket_blob_marks_empty_non_valuation_rows_as_no_data(m
 
     results = silver.process_alpha26_bucket_blob(
         blob,
-        desired_end=pd.Timestamp("2026-03-04"),
         backfill_start=None,
         watermarks=watermarks,
         persist=False,
@@ -368,7 +395,6 @@ def test_process_alpha26_bucket_blob_accepts_string_last_modified(monkeypatch) -
 
     results = silver.process_alpha26_bucket_blob(
         blob,
-        desired_end=pd.Timestamp("2026-03-04"),
         backfill_start=None,
         watermarks=watermarks,
         persist=False,
@@ -402,7 +428,6 @@ def test_silver_finance_main_parallel_aggregates_failures_and_updates_watermarks
 
     monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
     monkeypatch.setattr(silver, "_list_alpha26_finance_bucket_candidates", lambda: (list(blobs), 0))
-    monkeypatch.setattr(silver, "_utc_today", lambda: pd.Timestamp("2026-01-31"))
     monkeypatch.setattr(
         silver,
         "_write_alpha26_finance_silver_buckets",
@@ -424,14 +449,13 @@ def test_silver_finance_main_parallel_aggregates_failures_and_updates_watermarks
     def fake_process_alpha26(
         *,
         candidate_blobs,
-        desired_end,
         backfill_start=None,
         watermarks=None,
         persist=True,
         alpha26_bucket_frames=None,
         flush_state=None,
     ):
-        del desired_end, backfill_start, persist, alpha26_bucket_frames, flush_state
+        del backfill_start, persist, alpha26_bucket_frames, flush_state
         results = []
         for blob in candidate_blobs:
             name = str(blob.get("name", ""))
@@ -498,7 +522,6 @@ def test_silver_finance_main_succeeds_with_no_data_skips_and_records_skipped_no_
     monkeypatch.setattr(silver.mdc, "write_line", lambda message: log_lines.append(str(message)))
     monkeypatch.setattr(silver, "_list_alpha26_finance_bucket_candidates", lambda: (list(blobs), 0))
     monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: False)
-    monkeypatch.setattr(silver, "_utc_today", lambda: pd.Timestamp("2026-03-22"))
     monkeypatch.setattr(silver, "load_watermarks", lambda _key: {})
     monkeypatch.setattr(silver, "load_last_success", lambda _key: None)
     monkeypatch.setattr(silver, "save_watermarks", lambda *args, **kwargs: None)
@@ -510,8 +533,8 @@ def test_silver_finance_main_succeeds_with_no_data_skips_and_records_skipped_no_
         ),
     )
 
-    def _fake_process(*, candidate_blobs, desired_end, backfill_start=None, watermarks=None, **_kwargs):
-        del desired_end, backfill_start, _kwargs
+    def _fake_process(*, candidate_blobs, backfill_start=None, watermarks=None, **_kwargs):
+        del backfill_start, _kwargs
         out = []
         for blob in candidate_blobs:
             watermarks[blob["name"]] = {
@@ -559,20 +582,18 @@ def test_silver_finance_main_processes_a_single_listing_pass(monkeypatch):
         "_list_alpha26_finance_bucket_candidates",
         lambda: list_calls.__setitem__("count", list_calls["count"] + 1) or ([dict(bucket_blob)], 0),
     )
-    monkeypatch.setattr(silver, "_utc_today", lambda: pd.Timestamp("2026-01-31"))
     monkeypatch.setattr(silver, "load_watermarks", lambda _key: {})
     monkeypatch.setattr(silver, "load_last_success", lambda _key: None)
 
     def _fake_process_alpha26_candidate_blobs(
         *,
         candidate_blobs,
-        desired_end,
         backfill_start=None,
         watermarks=None,
         flush_state=None,
         **_kwargs,
     ):
-        del desired_end, backfill_start, watermarks, _kwargs
+        del backfill_start, watermarks, _kwargs
         assert flush_state is not None
         flush_state.staged_rows = 1
         flush_state.flush_count = 1
@@ -984,7 +1005,6 @@ def test_process_alpha26_bucket_blob_does_not_skip_when_signature_matches_waterm
 
     results = silver.process_alpha26_bucket_blob(
         blob,
-        desired_end=pd.Timestamp("2026-03-04"),
         backfill_start=None,
         watermarks=watermarks,
         persist=False,
@@ -107,3 +107,68 @@ def test_compute_features_does_not_emit_internal_helper_columns():
 def test_compute_features_requires_expected_columns():
     with pytest.raises(ValueError, match="Missing required columns"):
         compute_features(pd.DataFrame({"Date": ["2020-01-01"], "Close": [1.0]}))
+
+
+@pytest.mark.parametrize("window", [1, 5, 252])
+def test_rolling_percentile_rank_matches_scalar_reference(window):
+    from tasks.market_data import gold_market_data as gold
+
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=900)
+    values[rng.random(900) < 0.15] = np.nan
+    values[:40] = np.nan
+    values[300:310] = 1.0
+    values[500] = np.inf
+    values[501] = -np.inf
+    series = pd.Series(values, index=pd.RangeIndex(10, 910))
+
+    expected = series.rolling(window=window, min_periods=1).apply(gold._percentile_rank_last, raw=True)
+    actual = gold._rolling_percentile_rank(series, window)
+
+    pd.testing.assert_series_equal(actual, expected, check_exact=True)
+
+
+def test_rolling_percentile_rank_handles_empty_and_all_nan_series():
+    from tasks.market_data import gold_market_data as gold
+
+    assert gold._rolling_percentile_rank(pd.Series([], dtype="float64"), 252).empty
+    out = gold._rolling_percentile_rank(pd.Series([np.nan, np.nan]), 252)
+    assert out.isna().all()
+
+
+def test_rolling_percentile_rank_stops_windows_at_group_boundaries():
+    from tasks.market_data import gold_market_data as gold
+
+    rng = np.random.default_rng(11)
+    values = rng.normal(size=600)
+    values[rng.random(600) < 0.1] = np.nan
+    codes = np.repeat([0, 1, 2], [250, 1, 349])
+    series = pd.Series(values)
+
+    expected = series.groupby(codes).transform(
+        lambda group: group.rolling(window=252, min_periods=1).apply(gold._percentile_rank_last, raw=True)
+    )
+    actual = gold._rolling_percentile_rank(series, 252, codes)
+
+    pd.testing.assert_series_equal(actual, expected, check_exact=True, check_names=False)
+
+
+def test_compute_features_on_bucket_matches_per_symbol_calls():
+    rng = np.random.default_rng(3)
+    frames = []
+    for symbol, rows in (("MSFT", 320), ("AAPL", 260), ("ZZZ", 1), ("BRK.B", 45)):
+        df = _make_market_df(rows)
+        df["Symbol"] = symbol
+        df["Close"] = df["Close"] * np.exp(rng.normal(0.0, 0.02, rows).cumsum())
+        df.loc[rng.random(rows) < 0.05, "Close"] = np.nan
+        df.loc[rng.random(rows) < 0.05, "Volume"] = np.nan
+        frames.append(df)
+    bucket = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=5)
+
+    expected = pd.concat(
+        [compute_features(group) for _, group in bucket.groupby("Symbol")],
+        ignore_index=True,
+    )
+    actual = compute_features(bucket)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
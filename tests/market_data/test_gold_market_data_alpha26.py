@@ -39,6 +39,15 @@ def _gold_feature_df(symbol: str) -> pd.DataFrame:
     )
 
 
+def _per_symbol(compute):
+    """Lift a single-symbol fake `compute_features` to the multi-symbol batches the job passes in."""
+
+    def _compute(df: pd.DataFrame) -> pd.DataFrame:
+        return pd.concat([compute(group) for _, group in df.groupby("symbol", sort=False)], ignore_index=True)
+
+    return _compute
+
+
 class _FakeCursor:
     def __init__(self, *, fetchall_rows=None) -> None:
         self.fetchall_rows = list(fetchall_rows or [])
@@ -174,10 +183,12 @@ def test_run_alpha26_market_gold_hard_fails_on_critical_symbol_compute_failure(m
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: (
-            (_ for _ in ()).throw(ValueError("boom"))
-            if str(df["symbol"].iloc[0]).strip().upper() == "SPY"
-            else _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())
+        _per_symbol(
+            lambda df: (
+                (_ for _ in ()).throw(ValueError("boom"))
+                if str(df["symbol"].iloc[0]).strip().upper() == "SPY"
+                else _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())
+            )
         ),
     )
 
@@ -232,7 +243,7 @@ def test_run_alpha26_market_gold_logs_bucket_progress_and_loads_required_columns
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(delta_core_module, "store_delta", lambda *_args, **_kwargs: None)
 
@@ -286,7 +297,7 @@ def test_run_alpha26_market_gold_chunked_publish_preserves_rows_symbols_and_cont
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(
         delta_core_module,
@@ -317,6 +328,56 @@ def test_run_alpha26_market_gold_chunked_publish_preserves_rows_symbols_and_cont
     assert list(written["market/buckets/A"].columns) == expected_columns
 
 
+def test_run_alpha26_market_gold_replaces_bucket_slice_of_latest_snapshot(monkeypatch):
+    store_calls: list[dict[str, object]] = []
+
+    monkeypatch.setattr(gold.layer_bucketing, "ALPHABET_BUCKETS", ["A"])
+    monkeypatch.setattr(gold.layer_bucketing, "load_layer_symbol_index", lambda **_kwargs: pd.DataFrame())
+    monkeypatch.setattr(gold.layer_bucketing, "write_layer_symbol_index", lambda **_kwargs: "index")
+
+    def _fake_last_commit(_container: str, path: str):
+        if path == DataPaths.get_silver_market_bucket_path("A"):
+            return 100.0
+        return None
+
+    def _fake_compute_features(df: pd.DataFrame) -> pd.DataFrame:
+        symbol = str(df["symbol"].iloc[0]).strip().upper()
+        return pd.DataFrame(
+            {
+                "date": [pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-02")],
+                "symbol": [symbol, symbol],
+                "close": [101.0, 100.5],
+            }
+        )
+
+    def _fake_store(df: pd.DataFrame, _container: str, path: str, **kwargs):
+        store_calls.append({"path": str(path), "df": df.copy(), "kwargs": dict(kwargs)})
+
+    monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
+    monkeypatch.setattr(delta_core_module, "load_delta", lambda *_args, **_kwargs: _bucket_df("AAPL", "AMZN"))
+    monkeypatch.setattr(gold, "compute_features", _per_symbol(_fake_compute_features))
+    monkeypatch.setattr(delta_core_module, "store_delta", _fake_store)
+
+    processed, _skipped_unchanged, _skipped_missing, failed, _dirty, _symbols, _index = gold._run_alpha26_market_gold(
+        silver_container="silver",
+        gold_container="gold",
+        backfill_start_iso=None,
+        watermarks={},
+    )
+
+    snapshot_calls = [call for call in store_calls if call["path"] == DataPaths.get_gold_market_latest_path()]
+    assert processed == 1
+    assert failed == 0
+    assert len(snapshot_calls) == 1
+    snapshot = snapshot_calls[0]["df"]
+    assert snapshot["symbol"].tolist() == ["AAPL", "AMZN"]
+    assert snapshot["date"].tolist() == [pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-05")]
+    assert snapshot["close"].tolist() == [101.0, 101.0]
+    assert snapshot["bucket"].tolist() == ["A", "A"]
+    assert snapshot_calls[0]["kwargs"]["mode"] == "overwrite"
+    assert snapshot_calls[0]["kwargs"]["predicate"] == "bucket = 'A'"
+
+
 def test_run_alpha26_market_gold_checkpoint_defers_root_domain_artifact_until_finalization(monkeypatch):
     watermarks: dict = {}
     messages = _capture_log_messages(monkeypatch)
@@ -352,7 +413,7 @@ def test_run_alpha26_market_gold_checkpoint_defers_root_domain_artifact_until_fi
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(delta_core_module, "store_delta", lambda *_args, **_kwargs: None)
 
@@ -433,7 +494,7 @@ def test_run_alpha26_market_gold_writes_healthy_symbols_and_blocks_publication_o
     monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
     monkeypatch.setattr(delta_core_module, "get_delta_schema_columns", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(delta_core_module, "load_delta", _fake_load_delta)
-    monkeypatch.setattr(gold, "compute_features", _fake_compute_features)
+    monkeypatch.setattr(gold, "compute_features", _per_symbol(_fake_compute_features))
     monkeypatch.setattr(
         delta_core_module,
         "store_delta",
@@ -459,8 +520,9 @@ def test_run_alpha26_market_gold_writes_healthy_symbols_and_blocks_publication_o
     assert failed == 1
     assert watermarks_dirty is False
     assert index_path is None
-    assert set(written) == {"market/buckets/A"}
+    assert set(written) == {"market/buckets/A", DataPaths.get_gold_market_latest_path()}
     assert written["market/buckets/A"]["symbol"].tolist() == ["AAPL"]
+    assert written[DataPaths.get_gold_market_latest_path()]["symbol"].tolist() == ["AAPL"]
     assert watermarks == {}
     assert captured_index == {}
     assert any(
@@ -532,7 +594,7 @@ def test_run_alpha26_market_gold_rerun_skips_checkpointed_bucket_and_recomputes_
     monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
     monkeypatch.setattr(delta_core_module, "load_delta", _fake_load_delta)
     monkeypatch.setattr(delta_core_module, "store_delta", _fake_store_delta)
-    monkeypatch.setattr(gold, "compute_features", _fake_compute_features)
+    monkeypatch.setattr(gold, "compute_features", _per_symbol(_fake_compute_features))
 
     first = gold._run_alpha26_market_gold(
         silver_container="silver",
@@ -557,6 +619,149 @@ def test_run_alpha26_market_gold_rerun_skips_checkpointed_bucket_and_recomputes_
     assert symbol_index_map == {"AAPL": "A", "BABA": "B"}
 
 
+def test_run_alpha26_market_gold_parallel_staging_publishes_in_bucket_order(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    watermarks: dict = {}
+    symbol_index_map: dict[str, str] = {}
+    messages = _capture_log_messages(monkeypatch)
+    published: list[str] = []
+    executors: list[int] = []
+
+    monkeypatch.setattr(gold.layer_bucketing, "ALPHABET_BUCKETS", ["A", "B", "C"])
+    monkeypatch.setattr(gold.layer_bucketing, "load_layer_symbol_index", lambda **_kwargs: pd.DataFrame())
+
+    def _fake_write_layer_symbol_index(**kwargs):
+        symbol_index_map.clear()
+        symbol_index_map.update(kwargs["symbol_to_bucket"])
+        return "system/gold-index/market/latest.parquet"
+
+    silver_symbols = {
+        DataPaths.get_silver_market_bucket_path("A"): ("AAPL", "AMZN"),
+        DataPaths.get_silver_market_bucket_path("B"): ("BABA",),
+        DataPaths.get_silver_market_bucket_path("C"): ("CSCO",),
+    }
+
+    def _fake_last_commit(_container: str, path: str):
+        return 100.0 if path in silver_symbols else None
+
+    def _fake_compute_features(df: pd.DataFrame) -> pd.DataFrame:
+        symbol = str(df["symbol"].iloc[0]).strip().upper()
+        if symbol == "BABA":
+            raise ValueError("bad bars")
+        return _gold_feature_df(symbol)
+
+    def _fake_store_delta(df: pd.DataFrame, _container: str, path: str, **_kwargs):
+        if str(path).startswith("market/buckets/"):
+            published.append(str(path))
+
+    def _thread_executor(workers: int):
+        executors.append(workers)
+        return ThreadPoolExecutor(max_workers=workers)
+
+    monkeypatch.setenv("GOLD_MARKET_BUCKET_WORKERS", "3")
+    monkeypatch.setattr(gold.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(gold, "_available_memory_mb", lambda: None)
+    monkeypatch.setattr(gold, "_bucket_stage_executor", _thread_executor)
+    monkeypatch.setattr(gold.layer_bucketing, "write_layer_symbol_index", _fake_write_layer_symbol_index)
+    monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
+    monkeypatch.setattr(
+        delta_core_module,
+        "load_delta",
+        lambda _container, path, **_kwargs: _bucket_df(*silver_symbols[path]),
+    )
+    monkeypatch.setattr(delta_core_module, "store_delta", _fake_store_delta)
+    monkeypatch.setattr(gold, "compute_features", _per_symbol(_fake_compute_features))
+
+    processed, skipped_unchanged, skipped_missing, failed, watermarks_dirty, _symbols, _index = (
+        gold._run_alpha26_market_gold(
+            silver_container="silver",
+            gold_container="gold",
+            backfill_start_iso=None,
+            watermarks=watermarks,
+        )
+    )
+
+    assert executors == [3]
+    # Bucket B's only symbol fails, leaving an empty bucket with no existing schema to write.
+    assert (processed, skipped_unchanged, skipped_missing, failed) == (2, 0, 0, 1)
+    assert watermarks_dirty is True
+    assert published == ["market/buckets/A", "market/buckets/C"]
+    assert sorted(watermarks) == ["bucket::A", "bucket::C"]
+    assert symbol_index_map == {"AAPL": "A", "AMZN": "A", "CSCO": "C"}
+    assert any("gold_market_bucket_parallelism workers=3 buckets=3" in message for message in messages)
+    assert any("bucket=B status=blocked reason=empty_bucket_no_existing_schema" in message for message in messages)
+
+
+def test_run_alpha26_market_gold_shuts_down_stage_executor_when_loop_raises(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    shutdown_calls: list[dict[str, object]] = []
+
+    class _RecordingExecutor(ThreadPoolExecutor):
+        def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+            shutdown_calls.append({"wait": wait, "cancel_futures": cancel_futures})
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(gold.layer_bucketing, "ALPHABET_BUCKETS", ["A", "B"])
+    monkeypatch.setattr(gold.layer_bucketing, "load_layer_symbol_index", lambda **_kwargs: pd.DataFrame())
+    monkeypatch.setattr(gold.layer_bucketing, "write_layer_symbol_index", lambda **_kwargs: "index")
+    monkeypatch.setenv("GOLD_MARKET_BUCKET_WORKERS", "2")
+    monkeypatch.setattr(gold.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(gold, "_available_memory_mb", lambda: None)
+    monkeypatch.setattr(gold, "_bucket_stage_executor", lambda workers: _RecordingExecutor(max_workers=workers))
+    monkeypatch.setattr(
+        delta_core_module,
+        "get_delta_last_commit",
+        lambda _container, path: 100.0 if str(path).startswith("market-data/") else None,
+    )
+    monkeypatch.setattr(delta_core_module, "load_delta", lambda *_args, **_kwargs: _bucket_df("AAPL"))
+    monkeypatch.setattr(delta_core_module, "store_delta", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(
+        gold,
+        "compute_features",
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
+    )
+
+    def _failing_progress(*, bucket: str, stage: str, **_kwargs) -> None:
+        if bucket == "B" and stage == "bucket_start":
+            raise RuntimeError("progress sink unavailable")
+
+    monkeypatch.setattr(gold, "_log_bucket_progress", _failing_progress)
+
+    with pytest.raises(RuntimeError, match="progress sink unavailable"):
+        gold._run_alpha26_market_gold(
+            silver_container="silver",
+            gold_container="gold",
+            backfill_start_iso=None,
+            watermarks={},
+        )
+
+    assert shutdown_calls == [{"wait": True, "cancel_futures": True}]
+
+
+def test_resolve_bucket_workers_caps_by_cpu_and_memory(monkeypatch):
+    monkeypatch.setattr(gold.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(gold, "_available_memory_mb", lambda: 5000.0)
+
+    monkeypatch.delenv("GOLD_MARKET_BUCKET_WORKERS", raising=False)
+    assert gold._resolve_bucket_workers(26) == 1
+
+    monkeypatch.setenv("GOLD_MARKET_BUCKET_WORKERS", "16")
+    monkeypatch.delenv("GOLD_MARKET_BUCKET_WORKER_MEMORY_MB", raising=False)
+    assert gold._resolve_bucket_workers(26) == 3
+    assert gold._resolve_bucket_workers(2) == 2
+
+    monkeypatch.setenv("GOLD_MARKET_BUCKET_WORKER_MEMORY_MB", "1000")
+    assert gold._resolve_bucket_workers(26) == 4
+
+    monkeypatch.setattr(gold, "_available_memory_mb", lambda: 200.0)
+    assert gold._resolve_bucket_workers(26) == 1
+
+    monkeypatch.setenv("GOLD_MARKET_BUCKET_WORKERS", "not-a-number")
+    assert gold._resolve_bucket_workers(26) == 1
+
+
 def test_run_alpha26_market_gold_contract_failure_logs_real_symbol_counts(monkeypatch):
     messages = _capture_log_messages(monkeypatch)
     captured_index: dict = {}
@@ -687,7 +892,7 @@ def test_run_alpha26_market_gold_processes_bucket_when_postgres_bootstrap_missin
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(
         delta_core_module,
@@ -730,7 +935,7 @@ def test_run_alpha26_market_gold_processes_bucket_when_postgres_bootstrap_missin
     assert skipped_unchanged == 0
     assert failed == 0
     assert watermarks_dirty is True
-    assert written_paths == ["market/buckets/A"]
+    assert written_paths == ["market/buckets/A", DataPaths.get_gold_market_latest_path()]
     assert len(sync_calls) == 1
     assert sync_calls[0]["bucket"] == "A"
     assert sync_calls[0]["scope_symbols"] == ["AAPL"]
@@ -757,7 +962,7 @@ def test_run_alpha26_market_gold_blocks_watermark_when_postgres_sync_fails(monke
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(
         delta_core_module,
@@ -790,7 +995,7 @@ def test_run_alpha26_market_gold_blocks_watermark_when_postgres_sync_fails(monke
     assert watermarks_dirty is False
     assert index_path is None
     assert watermarks["bucket::A"]["silver_last_commit"] == 90.0
-    assert written_paths == ["market/buckets/A"]
+    assert written_paths == ["market/buckets/A", DataPaths.get_gold_market_latest_path()]
 
 
 def test_run_alpha26_market_gold_blocks_watermark_on_checkpoint_failure(monkeypatch):
@@ -810,7 +1015,7 @@ def test_run_alpha26_market_gold_blocks_watermark_on_checkpoint_failure(monkeypa
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(
         delta_core_module,
@@ -838,7 +1043,7 @@ def test_run_alpha26_market_gold_blocks_watermark_on_checkpoint_failure(monkeypa
     assert watermarks_dirty is False
     assert index_path is None
     assert watermarks == {}
-    assert written_paths == ["market/buckets/A"]
+    assert written_paths == ["market/buckets/A", DataPaths.get_gold_market_latest_path()]
     assert any("stage=checkpoint_failed" in message for message in messages)
 
 
@@ -859,6 +1064,8 @@ def test_run_alpha26_market_gold_aligns_empty_bucket_to_existing_schema(monkeypa
 
     def _fake_store(df: pd.DataFrame, _container: str, path: str, mode: str = "overwrite", **_kwargs):
         captured["store_calls"] = int(captured["store_calls"]) + 1
+        if path != target_path:
+            return
         captured["df"] = df.copy()
         captured["path"] = path
         captured["mode"] = mode
@@ -887,7 +1094,8 @@ def test_run_alpha26_market_gold_aligns_empty_bucket_to_existing_schema(monkeypa
     assert watermarks_dirty is False
     assert alpha26_symbols == 0
     assert index_path == "index"
-    assert captured["store_calls"] == 1
+    # Bucket table plus its slice of the latest-row snapshot.
+    assert captured["store_calls"] == 2
     assert captured["path"] == target_path
     assert captured["mode"] == "overwrite"
     assert captured["df"].empty
@@ -943,6 +1151,100 @@ def test_run_alpha26_market_gold_does_not_advance_watermark_for_empty_bucket_wit
     assert captured["checked_paths"] == [target_path]
 
 
+def test_run_alpha26_market_gold_backfills_snapshot_for_skipped_uncovered_bucket(monkeypatch):
+    watermarks = {"bucket::A": {"silver_last_commit": 100.0}, "bucket::B": {"silver_last_commit": 100.0}}
+    store_calls: list[dict[str, object]] = []
+    loaded_paths: list[str] = []
+
+    monkeypatch.setattr(gold.layer_bucketing, "ALPHABET_BUCKETS", ["A", "B"])
+    monkeypatch.setattr(gold.layer_bucketing, "load_layer_symbol_index", lambda **_kwargs: pd.DataFrame())
+    monkeypatch.setattr(gold.layer_bucketing, "write_layer_symbol_index", lambda **_kwargs: "index")
+    monkeypatch.setattr(delta_core_module, "get_delta_last_commit", lambda *_args: 100.0)
+
+    def _fake_load_delta(_container: str, path: str, **_kwargs):
+        loaded_paths.append(str(path))
+        if path == DataPaths.get_gold_market_latest_path():
+            return pd.DataFrame({"bucket": ["A"]})
+        assert path == DataPaths.get_gold_market_bucket_path("B")
+        return pd.DataFrame(
+            {
+                "date": [pd.Timestamp("2026-01-02"), pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-05")],
+                "symbol": ["BA", "BA", "BAC"],
+                "close": [10.0, 11.0, 30.0],
+            }
+        )
+
+    def _fake_store(df: pd.DataFrame, _container: str, path: str, **kwargs):
+        store_calls.append({"path": str(path), "df": df.copy(), "kwargs": dict(kwargs)})
+
+    monkeypatch.setattr(delta_core_module, "load_delta", _fake_load_delta)
+    monkeypatch.setattr(delta_core_module, "store_delta", _fake_store)
+
+    processed, skipped_unchanged, _skipped_missing, failed, _dirty, _symbols, _index = gold._run_alpha26_market_gold(
+        silver_container="silver",
+        gold_container="gold",
+        backfill_start_iso=None,
+        watermarks=watermarks,
+    )
+
+    assert processed == 0
+    assert skipped_unchanged == 2
+    assert failed == 0
+    assert loaded_paths == [DataPaths.get_gold_market_latest_path(), DataPaths.get_gold_market_bucket_path("B")]
+    assert len(store_calls) == 1
+    assert store_calls[0]["path"] == DataPaths.get_gold_market_latest_path()
+    assert store_calls[0]["kwargs"]["predicate"] == "bucket = 'B'"
+    snapshot = store_calls[0]["df"]
+    assert snapshot["symbol"].tolist() == ["BA", "BAC"]
+    assert snapshot["close"].tolist() == [11.0, 30.0]
+    assert snapshot["bucket"].tolist() == ["B", "B"]
+
+
+def test_run_alpha26_market_gold_snapshot_failure_does_not_fail_promoted_bucket(monkeypatch):
+    written: list[str] = []
+    warnings: list[str] = []
+
+    monkeypatch.setattr(gold.layer_bucketing, "ALPHABET_BUCKETS", ["A"])
+    monkeypatch.setattr(gold.layer_bucketing, "load_layer_symbol_index", lambda **_kwargs: pd.DataFrame())
+    monkeypatch.setattr(gold.layer_bucketing, "write_layer_symbol_index", lambda **_kwargs: "index")
+    monkeypatch.setattr(core_module, "write_warning", lambda message: warnings.append(str(message)))
+
+    def _fake_last_commit(_container: str, path: str):
+        if path == DataPaths.get_silver_market_bucket_path("A"):
+            return 100.0
+        return None
+
+    def _fake_store(df: pd.DataFrame, _container: str, path: str, **_kwargs):
+        if path == DataPaths.get_gold_market_latest_path():
+            raise RuntimeError("snapshot unavailable")
+        written.append(str(path))
+
+    monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
+    monkeypatch.setattr(delta_core_module, "load_delta", lambda *_args, **_kwargs: _bucket_df("AAPL"))
+    monkeypatch.setattr(
+        gold,
+        "compute_features",
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
+    )
+    monkeypatch.setattr(delta_core_module, "store_delta", _fake_store)
+
+    watermarks: dict = {}
+    processed, _skipped_unchanged, _skipped_missing, failed, watermarks_dirty, _symbols, _index = (
+        gold._run_alpha26_market_gold(
+            silver_container="silver",
+            gold_container="gold",
+            backfill_start_iso=None,
+            watermarks=watermarks,
+        )
+    )
+
+    assert processed == 1
+    assert failed == 0
+    assert watermarks_dirty is True
+    assert written == ["market/buckets/A"]
+    assert any("latest snapshot write failed bucket=A" in message for message in warnings)
+
+
 def test_run_alpha26_market_gold_rebuilds_domain_artifact_when_all_buckets_are_skipped(monkeypatch):
     watermarks = {"bucket::A": {"silver_last_commit": 100.0}}
     domain_artifact_calls: list[dict[str, object]] = []
@@ -966,12 +1268,14 @@ def test_run_alpha26_market_gold_rebuilds_domain_artifact_when_all_buckets_are_s
             return 99.0
         return None
 
+    def _fake_load_delta(_container: str, path: str, **kwargs):
+        # Only the snapshot coverage probe is expected; bucket A is already covered.
+        assert path == DataPaths.get_gold_market_latest_path()
+        assert kwargs["columns"] == ["bucket"]
+        return pd.DataFrame({"bucket": ["A"]})
+
     monkeypatch.setattr(delta_core_module, "get_delta_last_commit", _fake_last_commit)
-    monkeypatch.setattr(
-        delta_core_module,
-        "load_delta",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("load_delta should not be called")),
-    )
+    monkeypatch.setattr(delta_core_module, "load_delta", _fake_load_delta)
     monkeypatch.setattr(
         delta_core_module,
         "store_delta",
@@ -1060,7 +1364,7 @@ def test_run_alpha26_market_gold_blocks_publication_when_critical_symbol_verific
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(
         delta_core_module,
@@ -1091,7 +1395,7 @@ def test_run_alpha26_market_gold_blocks_publication_when_critical_symbol_verific
     assert watermarks["bucket::S"]["silver_last_commit"] == 100.0
     assert watermarks["bucket::V"]["silver_last_commit"] == 100.0
     assert captured_index["symbol_to_bucket"] == {"SPY": "S", "^VIX": "V", "^VIX3M": "V"}
-    assert set(written_paths) == {"market/buckets/S", "market/buckets/V"}
+    assert set(written_paths) == {"market/buckets/S", "market/buckets/V", DataPaths.get_gold_market_latest_path()}
     assert any("postgres_gold_critical_symbol_status domain=market status=failed" in message for message in messages)
     assert any(
         "artifact_publication_status layer=gold domain=market status=blocked "
@@ -1153,7 +1457,7 @@ def test_run_alpha26_market_gold_completes_when_critical_symbol_verification_pas
     monkeypatch.setattr(
         gold,
         "compute_features",
-        lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper()),
+        _per_symbol(lambda df: _gold_feature_df(str(df["symbol"].iloc[0]).strip().upper())),
     )
     monkeypatch.setattr(delta_core_module, "store_delta", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(gold, "sync_gold_bucket", _fake_sync_gold_bucket)
@@ -1213,6 +1517,30 @@ def test_main_fails_closed_when_gold_reconciliation_fails(monkeypatch):
     assert gold.main() == 1
 
 
+def test_iter_market_symbol_features_batches_symbols_and_isolates_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    messages = _capture_log_messages(monkeypatch)
+    calls: list[list[str]] = []
+
+    def _fake_compute_features(df: pd.DataFrame) -> pd.DataFrame:
+        symbols = sorted(df["symbol"].unique().tolist())
+        calls.append(symbols)
+        if "AMZN" in symbols:
+            raise ValueError("bad bars")
+        return pd.concat([_gold_feature_df(symbol) for symbol in symbols], ignore_index=True)
+
+    monkeypatch.setattr(gold, "compute_features", _fake_compute_features)
+    monkeypatch.setattr(gold, "_MARKET_CHUNK_ROW_LIMIT", 2)
+
+    results = list(gold._iter_market_symbol_features(_bucket_df("AAPL", "ABNB", "AMZN", "ADBE"), bucket="A"))
+
+    assert calls == [["AAPL", "ABNB"], ["ADBE", "AMZN"], ["ADBE"], ["AMZN"]]
+    assert [symbol for symbol, _features, _error in results] == ["AAPL", "ABNB", "ADBE", "AMZN"]
+    assert [features["symbol"].tolist() for _symbol, features, _error in results[:3]] == [["AAPL"], ["ABNB"], ["ADBE"]]
+    assert results[3][1] is None
+    assert isinstance(results[3][2], ValueError)
+    assert any("batch compute failed for bucket=A symbols=2" in message for message in messages)
+
+
 def test_build_job_config_reads_required_containers(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AZURE_CONTAINER_SILVER", "silver")
     monkeypatch.setenv("AZURE_CONTAINER_GOLD", "gold")
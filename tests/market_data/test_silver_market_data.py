@@ -372,7 +372,7 @@ def test_main_skips_alpha26_write_when_no_market_data(monkeypatch):
     monkeypatch.setattr(silver, "save_last_success", _save_last_success)
     monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
     monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
-    monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: False)
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: False)
     monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (False, set()))
     monkeypatch.setattr(silver, "_run_market_reconciliation", lambda *, bronze_blob_list: (0, 0))
     monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
@@ -429,7 +429,7 @@ def test_main_skips_alpha26_write_when_candidates_produce_no_staged_rows(monkeyp
     monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (False, set()))
     monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
     monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
-    monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: False)
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: False)
     monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
     monkeypatch.setattr(silver, "_run_market_reconciliation", lambda *, bronze_blob_list: (0, 0))
     monkeypatch.setattr(silver.mdc, "write_line", lambda msg: messages.append(str(msg)))
@@ -499,7 +499,7 @@ def test_main_bootstraps_alpha26_write_when_silver_buckets_missing(monkeypatch):
     monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (True, {"A"}))
     monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
     monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
-    monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: False)
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: False)
     monkeypatch.setattr(silver, "_run_market_reconciliation", lambda *, bronze_blob_list: (0, 0))
     monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
     monkeypatch.setattr(silver.mdc, "write_line", lambda msg: messages.append(str(msg)))
@@ -563,7 +563,7 @@ def test_main_force_rebuild_reprocesses_market_candidates(monkeypatch):
     monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (False, set()))
     monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
     monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
-    monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: True)
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: True)
     monkeypatch.setattr(silver, "_run_market_reconciliation", lambda *, bronze_blob_list: (0, 0))
     monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
     monkeypatch.setattr(silver.mdc, "write_line", lambda *_args, **_kwargs: None)
@@ -735,7 +735,7 @@ def test_main_fails_closed_when_market_reconciliation_fails(monkeypatch):
     monkeypatch.setattr(silver, "save_last_success", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
     monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
-    monkeypatch.setattr(silver.layer_bucketing, "silver_alpha26_force_rebuild", lambda: False)
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: False)
     monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (False, set()))
     monkeypatch.setattr(
         silver,
@@ -747,3 +747,190 @@ def test_main_fails_closed_when_market_reconciliation_fails(monkeypatch):
     monkeypatch.setattr(silver.mdc, "write_error", lambda *_args, **_kwargs: None)
 
     assert silver.main() == 1
+
+
+def _bronze_market_rows(symbol: str, closes: list[float]) -> list[dict[str, object]]:
+    return [
+        {
+            "symbol": symbol,
+            "date": f"2026-01-{day + 1:02d}",
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 1000.0,
+            "ingested_at": f"2026-02-0{day + 1}T00:00:00Z",
+        }
+        for day, close in enumerate(closes)
+    ]
+
+
+def _use_silver_bucket(monkeypatch, frame: pd.DataFrame) -> None:
+    monkeypatch.setattr(silver.delta_core, "load_delta", lambda _container, _path, **_kwargs: frame.copy())
+
+
+def _process_incremental_bucket(monkeypatch, rows, *, watermarks, etag):
+    blob_name = "market-data/buckets/A.parquet"
+    frames: dict[str, list[pd.DataFrame]] = {}
+    monkeypatch.setattr(silver.mdc, "read_raw_bytes", lambda *_args, **_kwargs: _market_bucket_bytes(rows))
+    monkeypatch.setattr(silver, "get_backfill_range", lambda: (None, None))
+    status = silver.process_alpha26_bucket_blob(
+        {"name": blob_name, "etag": etag},
+        watermarks=watermarks,
+        alpha26_bucket_frames=frames,
+    )
+    parts = frames.get("A", [])
+    staged = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    return status, staged
+
+
+def _sorted_market_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    out = silver._coerce_alpha26_market_bucket_frame(frame)
+    return out.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+
+def test_process_alpha26_bucket_blob_merges_only_changed_symbols(monkeypatch):
+    watermarks: dict = {}
+    base_rows = _bronze_market_rows("AAPL", [10.0, 11.0]) + _bronze_market_rows("AMZN", [20.0, 21.0])
+
+    status, staged = _process_incremental_bucket(monkeypatch, base_rows, watermarks=watermarks, etag="v1")
+    assert status == "ok"
+    assert set(watermarks["market-data/buckets/A.parquet"]["symbol_hashes"]) == {"AAPL", "AMZN"}
+    _use_silver_bucket(monkeypatch, staged)
+
+    processed: list[str] = []
+    original = silver._process_symbol_frame
+    monkeypatch.setattr(
+        silver,
+        "_process_symbol_frame",
+        lambda **kwargs: processed.append(kwargs["ticker"]) or original(**kwargs),
+    )
+    # AMZN gains a bar, ABNB is new, AAPL only has a fresh ingestion timestamp.
+    delta_rows = (
+        [dict(row, ingested_at="2026-03-01T00:00:00Z") for row in _bronze_market_rows("AAPL", [10.0, 11.0])]
+        + _bronze_market_rows("AMZN", [20.0, 21.0, 22.0])
+        + _bronze_market_rows("ABNB", [30.0])
+    )
+    status, incremental = _process_incremental_bucket(monkeypatch, delta_rows, watermarks=watermarks, etag="v2")
+    assert status == "ok"
+    assert sorted(processed) == ["ABNB", "AMZN"]
+
+    _, full = _process_incremental_bucket(monkeypatch, delta_rows, watermarks={}, etag="v2")
+    pd.testing.assert_frame_equal(_sorted_market_rows(incremental), _sorted_market_rows(full))
+
+
+def test_process_alpha26_bucket_blob_drops_removed_symbols_and_skips_unchanged(monkeypatch):
+    watermarks: dict = {}
+    base_rows = _bronze_market_rows("AAPL", [10.0]) + _bronze_market_rows("AMZN", [20.0])
+    _, staged = _process_incremental_bucket(monkeypatch, base_rows, watermarks=watermarks, etag="v1")
+    _use_silver_bucket(monkeypatch, staged)
+
+    status, unchanged = _process_incremental_bucket(monkeypatch, base_rows, watermarks=watermarks, etag="v2")
+    assert status == "ok"
+    assert unchanged.empty
+    assert watermarks["market-data/buckets/A.parquet"]["etag"] == "v2"
+
+    status, remaining = _process_incremental_bucket(
+        monkeypatch,
+        _bronze_market_rows("AMZN", [20.0]),
+        watermarks=watermarks,
+        etag="v3",
+    )
+    assert status == "ok"
+    assert remaining["symbol"].tolist() == ["AMZN"]
+
+
+def test_process_alpha26_bucket_blob_rebuilds_bucket_when_backfill_window_changes(monkeypatch):
+    watermarks: dict = {}
+    rows = _bronze_market_rows("AAPL", [10.0, 11.0])
+    _, staged = _process_incremental_bucket(monkeypatch, rows, watermarks=watermarks, etag="v1")
+    _use_silver_bucket(monkeypatch, staged)
+    watermarks["market-data/buckets/A.parquet"]["transform_key"] = "v0||"
+
+    status, rebuilt = _process_incremental_bucket(monkeypatch, rows, watermarks=watermarks, etag="v2")
+
+    assert status == "ok"
+    assert len(rebuilt) == 2
+    assert watermarks["market-data/buckets/A.parquet"]["transform_key"] == silver._silver_market_transform_key()
+
+
+def _run_main_with_bronze_buckets(monkeypatch, *, workers: str, failing_bucket: str | None = None):
+    blobs = [
+        {"name": f"market-data/buckets/{bucket}.parquet", "etag": f"etag-{bucket}"} for bucket in ("A", "B", "C", "D")
+    ]
+    bronze = {
+        blob["name"]: _market_bucket_bytes(_bronze_market_rows(f"{blob['name'][-9]}SYM", [10.0, 11.0]))
+        for blob in blobs
+    }
+    saved: dict = {}
+    writes: list[tuple[str, pd.DataFrame]] = []
+    executors: list[int] = []
+
+    def _thread_executor(count: int):
+        from concurrent.futures import ThreadPoolExecutor
+
+        executors.append(count)
+        return ThreadPoolExecutor(max_workers=count)
+
+    def _fake_write(frames, *, touched_buckets=None):
+        (bucket,) = touched_buckets
+        if bucket == failing_bucket:
+            raise RuntimeError("simulated write failure")
+        writes.append((bucket, pd.concat(frames[bucket], ignore_index=True)))
+        return len(writes), "system/silver-index/market/latest.parquet", 9
+
+    monkeypatch.setenv("SILVER_MARKET_BUCKET_WORKERS", workers)
+    monkeypatch.setattr(silver.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(silver.layer_bucketing, "available_memory_mb", lambda: None)
+    monkeypatch.setattr(silver, "_bucket_stage_executor", _thread_executor)
+    monkeypatch.setattr(silver, "bronze_client", object())
+    monkeypatch.setattr(silver.bronze_bucketing, "list_active_bucket_blob_infos", lambda _domain, _client: blobs)
+    monkeypatch.setattr(silver.mdc, "read_raw_bytes", lambda blob_name, **_kwargs: bronze[blob_name])
+    monkeypatch.setattr(silver, "get_backfill_range", lambda: (None, None))
+    monkeypatch.setattr(silver, "load_watermarks", lambda _name: {})
+    monkeypatch.setattr(silver, "load_last_success", lambda _name: None)
+    monkeypatch.setattr(silver, "save_watermarks", lambda _name, payload: saved.update(watermarks=dict(payload)))
+    monkeypatch.setattr(silver, "save_last_success", lambda _name, metadata=None: saved.update(last_success=metadata))
+    monkeypatch.setattr(silver, "_write_alpha26_market_buckets", _fake_write)
+    monkeypatch.setattr(silver, "_detect_missing_alpha26_market_buckets", lambda: (False, set()))
+    monkeypatch.setattr(silver.bronze_bucketing, "bronze_layout_mode", lambda: "alpha26")
+    monkeypatch.setattr(silver.layer_bucketing, "silver_layout_mode", lambda: "alpha26")
+    monkeypatch.setattr(silver.layer_bucketing, "silver_market_force_rebuild", lambda: False)
+    monkeypatch.setattr(silver, "_run_market_reconciliation", lambda *, bronze_blob_list: (0, 0))
+    monkeypatch.setattr(silver.mdc, "log_environment_diagnostics", lambda: None)
+    monkeypatch.setattr(silver.mdc, "write_line", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(silver.mdc, "write_error", lambda *_args, **_kwargs: None)
+
+    exit_code = silver.main()
+    return exit_code, writes, saved, executors
+
+
+def test_main_parallel_bucket_staging_matches_sequential_run(monkeypatch):
+    sequential_code, sequential_writes, sequential_saved, sequential_executors = _run_main_with_bronze_buckets(
+        monkeypatch, workers="1"
+    )
+    parallel_code, parallel_writes, parallel_saved, parallel_executors = _run_main_with_bronze_buckets(
+        monkeypatch, workers="3"
+    )
+
+    assert (sequential_code, parallel_code) == (0, 0)
+    assert sequential_executors == []
+    assert parallel_executors == [3]
+    assert [bucket for bucket, _ in parallel_writes] == ["A", "B", "C", "D"]
+    for (_, expected), (_, actual) in zip(sequential_writes, parallel_writes):
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def _stable(watermarks):
+        return {key: {k: v for k, v in value.items() if k != "updated_at"} for key, value in watermarks.items()}
+
+    assert _stable(parallel_saved["watermarks"]) == _stable(sequential_saved["watermarks"])
+    assert parallel_saved["last_success"]["processed"] == 4
+
+
+def test_main_parallel_bucket_staging_stops_at_first_write_failure(monkeypatch):
+    exit_code, writes, saved, _executors = _run_main_with_bronze_buckets(monkeypatch, workers="4", failing_bucket="B")
+
+    assert exit_code == 1
+    assert [bucket for bucket, _ in writes] == ["A"]
+    assert sorted(saved["watermarks"]) == ["market-data/buckets/A.parquet"]
+    assert "last_success" not in saved
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from tasks.technical_analysis import market_structure
 from tasks.technical_analysis.market_structure import add_market_structure_features
+from tests.technical_analysis._structure_reference import build_structure_frame_reference
 
 
 def _make_structure_df(close_values: list[float], *, atr_value: float = 2.0) -> pd.DataFrame:
@@ -110,3 +113,38 @@ def test_fibonacci_levels_use_latest_confirmed_opposite_pivots() -> None:
     assert row["fib_anchor_low"] == pytest.approx(9.5)
     assert row["fib_anchor_high"] == pytest.approx(20.5)
     assert row["fib_level_500"] == pytest.approx(15.0)
+
+
+def _random_ohlcv(row_count: int, *, seed: int, missing_fraction: float) -> dict[str, pd.Series]:
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, row_count))), seed % 3)
+    high = close + np.abs(rng.normal(0.0, 1.0, row_count))
+    low = close - np.abs(rng.normal(0.0, 1.0, row_count))
+    atr = np.abs(rng.normal(2.0, 0.5, row_count))
+    for values in (high, low, close, atr):
+        values[rng.random(row_count) < missing_fraction] = np.nan
+    atr[rng.random(row_count) < missing_fraction] = 0.0
+    return {"high": pd.Series(high), "low": pd.Series(low), "close": pd.Series(close), "atr": pd.Series(atr)}
+
+
+@pytest.mark.parametrize("row_count", [0, 1, 12, 400, 1500])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("missing_fraction", [0.0, 0.05])
+def test_structure_frame_matches_reference_on_random_ohlcv(row_count: int, seed: int, missing_fraction: float) -> None:
+    inputs = _random_ohlcv(row_count, seed=seed, missing_fraction=missing_fraction)
+
+    expected = build_structure_frame_reference(**inputs)
+    actual = market_structure._build_structure_frame(**inputs)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+
+def test_structure_frame_matches_reference_when_zones_tie() -> None:
+    rng = np.random.default_rng(7)
+    close = pd.Series(rng.integers(95, 105, 600).astype(float))
+    inputs = {"high": close + 1.0, "low": close - 1.0, "close": close, "atr": pd.Series(np.ones(600))}
+
+    expected = build_structure_frame_reference(**inputs)
+    actual = market_structure._build_structure_frame(**inputs)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
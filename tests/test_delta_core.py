@@ -190,3 +190,191 @@ def test_store_delta_incompatible_rename_preserves_existing_table_schema(monkeyp
     persisted_cols = [f.name for f in DeltaTable(str(table_dir)).schema().fields]
     assert "ticker" in persisted_cols
     assert "symbol" not in persisted_cols
+
+
+def _patch_delta_core_for_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(delta_core, "_ensure_container_exists", lambda _container: None)
+    monkeypatch.setattr(
+        delta_core,
+        "get_delta_table_uri",
+        lambda container, path, account_name=None: str(tmp_path / container / path),
+    )
+    monkeypatch.setattr(delta_core, "get_delta_storage_options", lambda _container=None: {})
+    delta_core.invalidate_delta_table_cache()
+
+
+def test_load_delta_reuses_cached_handle_and_sees_external_commits(monkeypatch, tmp_path):
+    _patch_delta_core_for_cache(monkeypatch, tmp_path)
+    from deltalake import write_deltalake
+
+    delta_core.store_delta(pd.DataFrame({"a": [1]}), container="gold", path="market/buckets/A")
+    first = delta_core.load_delta("gold", "market/buckets/A")
+    assert first["a"].tolist() == [1]
+
+    opened = []
+    real_delta_table = delta_core.DeltaTable
+
+    def counting_delta_table(*args, **kwargs):
+        opened.append(args[0])
+        return real_delta_table(*args, **kwargs)
+
+    monkeypatch.setattr(delta_core, "DeltaTable", counting_delta_table)
+
+    # A writer outside store_delta (another process) appends; the cached handle catches up incrementally.
+    write_deltalake(str(tmp_path / "gold" / "market/buckets/A"), pd.DataFrame({"a": [2]}), mode="append")
+    second = delta_core.load_delta("gold", "market/buckets/A")
+    assert sorted(second["a"].tolist()) == [1, 2]
+    assert delta_core.get_delta_last_commit("gold", "market/buckets/A") is not None
+    assert delta_core.get_delta_schema_columns("gold", "market/buckets/A") == ["a"]
+    assert opened == []
+
+
+def test_store_delta_invalidates_cached_handle(monkeypatch, tmp_path):
+    _patch_delta_core_for_cache(monkeypatch, tmp_path)
+
+    delta_core.store_delta(pd.DataFrame({"a": [1]}), container="gold", path="t")
+    assert delta_core.load_delta("gold", "t")["a"].tolist() == [1]
+    assert len(delta_core._delta_table_cache) == 1
+
+    delta_core.store_delta(pd.DataFrame({"a": [5], "b": [6]}), container="gold", path="t", schema_mode="overwrite")
+    assert len(delta_core._delta_table_cache) == 0
+    reloaded = delta_core.load_delta("gold", "t")
+    assert reloaded.to_dict("records") == [{"a": 5, "b": 6}]
+
+
+def test_delta_table_cache_is_bounded_and_can_be_disabled(monkeypatch, tmp_path):
+    _patch_delta_core_for_cache(monkeypatch, tmp_path)
+    for name in ("a", "b", "c"):
+        delta_core.store_delta(pd.DataFrame({"x": [1]}), container="gold", path=name)
+
+    monkeypatch.setenv("DELTA_TABLE_CACHE_MAX_ENTRIES", "2")
+    for name in ("a", "b", "c"):
+        delta_core.load_delta("gold", name)
+    cached_uris = [key[0] for key in delta_core._delta_table_cache]
+    assert cached_uris == [str(tmp_path / "gold" / "b"), str(tmp_path / "gold" / "c")]
+
+    delta_core.invalidate_delta_table_cache()
+    monkeypatch.setenv("DELTA_TABLE_CACHE_MAX_ENTRIES", "0")
+    assert delta_core.load_delta("gold", "a")["x"].tolist() == [1]
+    assert len(delta_core._delta_table_cache) == 0
+
+
+def test_load_delta_reopens_when_cached_table_was_recreated(monkeypatch, tmp_path):
+    import shutil
+
+    _patch_delta_core_for_cache(monkeypatch, tmp_path)
+    delta_core.store_delta(pd.DataFrame({"a": [1]}), container="gold", path="t")
+    delta_core.store_delta(pd.DataFrame({"a": [2]}), container="gold", path="t", mode="append")
+    assert sorted(delta_core.load_delta("gold", "t")["a"].tolist()) == [1, 2]
+
+    shutil.rmtree(tmp_path / "gold" / "t")
+    from deltalake import write_deltalake
+
+    write_deltalake(str(tmp_path / "gold" / "t"), pd.DataFrame({"a": [9]}))
+    assert delta_core.load_delta("gold", "t")["a"].tolist() == [9]
+
+
+class _FakeDelegationServiceClient:
+    issued: list = []
+
+    def __init__(self, account_url, credential):
+        self.account_url = account_url
+        self.credential = credential
+
+    def get_user_delegation_key(self, start, expiry):
+        self.issued.append((self.account_url, start, expiry))
+        return f"key-{len(self.issued)}"
+
+
+def _patch_user_delegation(monkeypatch, clock):
+    from datetime import datetime, timezone
+
+    _FakeDelegationServiceClient.issued = []
+    credentials = []
+
+    def fake_credential():
+        credentials.append(object())
+        return credentials[-1]
+
+    def fake_generate_container_sas(*, account_name, container_name, user_delegation_key, expiry, **_kwargs):
+        return f"{account_name}/{container_name}/{user_delegation_key}/{expiry.isoformat()}"
+
+    delta_core.clear_user_delegation_sas_cache()
+    monkeypatch.setattr(delta_core, "DefaultAzureCredential", fake_credential)
+    monkeypatch.setattr(delta_core, "BlobServiceClient", _FakeDelegationServiceClient)
+    monkeypatch.setattr(delta_core, "generate_container_sas", fake_generate_container_sas)
+    monkeypatch.setattr(delta_core, "_utcnow", lambda: clock["now"])
+    clock.setdefault("now", datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc))
+    return credentials
+
+
+def test_user_delegation_sas_is_cached_until_refresh_skew(monkeypatch):
+    from datetime import timedelta
+
+    clock = {}
+    credentials = _patch_user_delegation(monkeypatch, clock)
+
+    first = delta_core._get_user_delegation_sas("silver", "acct")
+    assert delta_core._get_user_delegation_sas("silver", "acct") == first
+    # The delegation key is shared across containers of the same account.
+    other = delta_core._get_user_delegation_sas("gold", "acct")
+    assert other != first
+    assert len(_FakeDelegationServiceClient.issued) == 1
+    assert len(credentials) == 1
+
+    # SAS expires 55 minutes after issue; refresh kicks in within the 5 minute skew.
+    clock["now"] += timedelta(minutes=49)
+    assert delta_core._get_user_delegation_sas("silver", "acct") == first
+    clock["now"] += timedelta(minutes=2)
+    refreshed = delta_core._get_user_delegation_sas("silver", "acct")
+    assert refreshed != first
+    assert len(_FakeDelegationServiceClient.issued) == 2
+    assert len(credentials) == 1
+
+
+def test_user_delegation_sas_refresh_is_single_flight(monkeypatch):
+    import threading
+
+    clock = {}
+    _patch_user_delegation(monkeypatch, clock)
+    release = threading.Event()
+    real_get_key = _FakeDelegationServiceClient.get_user_delegation_key
+
+    def slow_get_key(self, start, expiry):
+        release.wait(timeout=5)
+        return real_get_key(self, start, expiry)
+
+    monkeypatch.setattr(_FakeDelegationServiceClient, "get_user_delegation_key", slow_get_key)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(delta_core._get_user_delegation_sas("silver", "acct")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(results) == 8
+    assert len(set(results)) == 1
+    assert len(_FakeDelegationServiceClient.issued) == 1
+
+
+def test_user_delegation_sas_failure_is_not_cached(monkeypatch):
+    clock = {}
+    _patch_user_delegation(monkeypatch, clock)
+    calls = {"count": 0}
+
+    def flaky_get_key(self, start, expiry):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("identity endpoint unavailable")
+        return "key"
+
+    monkeypatch.setattr(_FakeDelegationServiceClient, "get_user_delegation_key", flaky_get_key)
+
+    assert delta_core._get_user_delegation_sas("silver", "acct") is None
+    assert delta_core._get_user_delegation_sas("silver", "acct") is not None
+    assert calls["count"] == 2
@@ -220,3 +220,35 @@ def test_provision_azure_postgres_auto_falls_back_to_dockerized_psql_when_local_
     assert "$UseDockerPsql = $true" in text, (
         "provision_azure_postgres must enable UseDockerPsql after detecting docker fallback"
     )
+
+
+def test_gold_sync_symbol_watermarks_migration_adds_jsonb_column() -> None:
+    repo_root = _repo_root()
+    migration = (
+        repo_root
+        / "deploy"
+        / "sql"
+        / "postgres"
+        / "migrations"
+        / "0034_gold_sync_symbol_watermarks.sql"
+    )
+    text = migration.read_text(encoding="utf-8")
+
+    assert "ALTER TABLE IF EXISTS core.gold_sync_state" in text
+    assert "ADD COLUMN IF NOT EXISTS symbol_watermarks JSONB" in text
+
+
+def test_ranking_watermark_fingerprint_migration_adds_text_column() -> None:
+    repo_root = _repo_root()
+    migration = (
+        repo_root
+        / "deploy"
+        / "sql"
+        / "postgres"
+        / "migrations"
+        / "0035_ranking_watermark_definition_fingerprint.sql"
+    )
+    text = migration.read_text(encoding="utf-8")
+
+    assert "ALTER TABLE IF EXISTS core.ranking_watermarks" in text
+    assert "ADD COLUMN IF NOT EXISTS definition_fingerprint TEXT" in text